@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Compare size and load time of JSON, Parquet and Arrow history datasets over several years.
+
+    python -m benchmarks.bench_columnar --years 5 --rows 400
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.bench_timeconv import CURRENCIES, IMPACTS, synthetic_month
+from ff_calendar_toolkit.columnar import read_columnar_tables
+from ff_calendar_toolkit.config import NORMALIZED_FIELDS
+from ff_calendar_toolkit.models import ScrapeContext
+from ff_calendar_toolkit.normalize import normalize_rows
+from ff_calendar_toolkit.storage import FileOutputStore
+
+FORMATS = {"json": ".json", "parquet": ".parquet", "arrow": ".arrow"}
+PROJECTED = ["date", "time", "event", "actual", "forecast"]
+
+
+def write_history(output_dir: Path, years: int, rows: int, seed: int) -> int:
+    rng = random.Random(seed)
+    store = FileOutputStore(output_dir)
+    count = 0
+    for year in range(2020, 2020 + years):
+        for month in range(1, 13):
+            raw = synthetic_month(year, month, rows, rng)
+            records = normalize_rows(
+                raw, str(year), "America/New_York", "UTC", CURRENCIES, IMPACTS, "2026-01-01T00:00:00+00:00"
+            )
+            context = ScrapeContext(
+                month_param=f"{year}-{month:02d}",
+                month_name="",
+                month_slug=f"{year}-{month:02d}",
+                year=str(year),
+                source_timezone="America/New_York",
+                target_timezone="UTC",
+                scraped_at="2026-01-01T00:00:00+00:00",
+            )
+            for file_format in FORMATS:
+                store.write(records, context, file_format)
+            count += len(records)
+    return count
+
+
+def load_full(paths: list[Path], file_format: str) -> pd.DataFrame:
+    if file_format == "json":
+        records = []
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as handle:
+                records.extend(json.load(handle))
+        return pd.DataFrame(records, columns=NORMALIZED_FIELDS)
+    return read_columnar_tables(paths).to_pandas()
+
+
+def load_filtered(paths: list[Path], file_format: str) -> pd.DataFrame:
+    """USD red-impact releases, five columns: what a dashboard panel typically asks for."""
+    if file_format == "json":
+        frame = load_full(paths, file_format)
+        return frame.loc[(frame["currency"] == "USD") & (frame["impact"] == "red"), PROJECTED]
+    return read_columnar_tables(paths, columns=PROJECTED, currencies=["USD"], impacts=["red"]).to_pandas()
+
+
+def best_of(repeat: int, function, *args) -> tuple[object, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(*args)
+        timings.append(time.perf_counter() - started)
+    return result, min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=400, help="raw rows per synthetic month")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = Path(temp_dir)
+        count = write_history(output_dir, args.years, args.rows, args.seed)
+        print(f"{args.years} years, {count} events in {args.years * 12} monthly history files per format")
+        print(f"{'format':>8} {'size KiB':>9} {'full load s':>12} {'filtered s':>11} {'rows':>7}")
+        expected_rows = None
+        for file_format, suffix in FORMATS.items():
+            paths = sorted((output_dir / "history").rglob(f"*{suffix}"))
+            size = sum(path.stat().st_size for path in paths)
+            full, full_seconds = best_of(args.repeat, load_full, paths, file_format)
+            filtered, filtered_seconds = best_of(args.repeat, load_filtered, paths, file_format)
+            assert len(full) == count
+            expected_rows = len(filtered) if expected_rows is None else expected_rows
+            assert len(filtered) == expected_rows
+            print(
+                f"{file_format:>8} {size / 1024:>9.0f} {full_seconds:>12.3f} "
+                f"{filtered_seconds:>11.3f} {len(filtered):>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Compare peak memory of list-based and streaming normalize + write as the input grows.
+
+    python -m benchmarks.bench_memory --rows 400 --months 12 48 192
+"""
+
+import argparse
+import csv
+import json
+import random
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.bench_timeconv import CURRENCIES, IMPACTS, synthetic_month
+from ff_calendar_toolkit.config import NORMALIZED_FIELDS
+from ff_calendar_toolkit.normalize import iter_normalized_rows, normalize_rows
+from ff_calendar_toolkit.storage import FileOutputStore
+
+NORMALIZE_ARGS = ("2024", "America/New_York", "Europe/London", CURRENCIES, IMPACTS)
+
+
+def raw_rows(months: int, rows: int, seed: int):
+    rng = random.Random(seed)
+    for index in range(months):
+        yield from synthetic_month(2024, index % 12 + 1, rows, rng)
+
+
+def list_path(output_dir: Path, months: int, rows: int, seed: int) -> int:
+    records = normalize_rows(list(raw_rows(months, rows, seed)), *NORMALIZE_ARGS)
+    projected = [{field: record.get(field, "") for field in NORMALIZED_FIELDS} for record in records]
+    with open(output_dir / "list.json", "w", encoding="utf-8") as handle:
+        json.dump(projected, handle, indent=2)
+    with open(output_dir / "list.csv", "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=NORMALIZED_FIELDS)
+        writer.writeheader()
+        writer.writerows(projected)
+    return len(records)
+
+
+def streaming_path(output_dir: Path, months: int, rows: int, seed: int) -> int:
+    store = FileOutputStore(output_dir)
+    records = iter_normalized_rows(raw_rows(months, rows, seed), *NORMALIZE_ARGS)
+    return store._write_files([(output_dir / "stream.json", "json"), (output_dir / "stream.csv", "csv")], records)
+
+
+def peak_mib(function, *args) -> tuple[int, float]:
+    tracemalloc.start()
+    try:
+        count = function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return count, peak / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=400, help="raw rows per synthetic month")
+    parser.add_argument("--months", type=int, nargs="+", default=[12, 48, 192])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'months':>7} {'records':>9} {'list MiB':>10} {'stream MiB':>11}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = Path(temp_dir)
+        for months in args.months:
+            count, list_peak = peak_mib(list_path, output_dir, months, args.rows, args.seed)
+            streamed, stream_peak = peak_mib(streaming_path, output_dir, months, args.rows, args.seed)
+            assert count == streamed
+            assert (output_dir / "list.json").read_bytes() == (output_dir / "stream.json").read_bytes()
+            assert (output_dir / "list.csv").read_bytes() == (output_dir / "stream.csv").read_bytes()
+            print(f"{months:>7} {count:>9} {list_peak:>10.1f} {stream_peak:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Compare memory per loaded event for plain dicts and CalendarRecord.
+
+    python -m benchmarks.bench_records --months 24 --rows 400
+"""
+
+import argparse
+import json
+import random
+import tracemalloc
+
+from benchmarks.bench_timeconv import CURRENCIES, IMPACTS, synthetic_month
+from ff_calendar_toolkit.normalize import normalize_rows
+from ff_calendar_toolkit.records import CalendarRecord
+
+
+def loaded_payload(months: int, rows: int, seed: int) -> str:
+    rng = random.Random(seed)
+    records = []
+    for index in range(months):
+        raw = synthetic_month(2024, index % 12 + 1, rows, rng)
+        records.extend(
+            normalize_rows(raw, "2024", "America/New_York", "UTC", CURRENCIES, IMPACTS, "2024-01-01T00:00:00+00:00")
+        )
+    return json.dumps(records)
+
+
+def traced_bytes(build) -> tuple[list, int]:
+    tracemalloc.start()
+    try:
+        loaded = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return loaded, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--rows", type=int, default=400, help="raw rows per synthetic month")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    payload = loaded_payload(args.months, args.rows, args.seed)
+    dicts, dict_bytes = traced_bytes(lambda: json.loads(payload))
+    records, record_bytes = traced_bytes(lambda: [CalendarRecord.from_dict(row) for row in json.loads(payload)])
+    assert records == dicts
+
+    count = len(dicts)
+    print(f"{count} events")
+    print(f"dict:           {dict_bytes / count:8.0f} bytes/event")
+    print(f"CalendarRecord: {record_bytes / count:8.0f} bytes/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Compare cached timezone conversion with the old per-row pytz path on synthetic months of rows.
+
+    python -m benchmarks.bench_timeconv --months 36 --rows 400
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytz
+
+from ff_calendar_toolkit.alerts.events import _parse_event_time
+from ff_calendar_toolkit.normalize import normalize_rows
+from ff_calendar_toolkit.timeconv import convert_time, convert_with_utc, get_zone, parse_local_time
+
+CURRENCIES = ["USD", "EUR", "GBP", "CAD"]
+IMPACTS = ["red", "orange", "gray"]
+TIMES = ["2:00am", "4:30am", "7:00am", "8:30am", "10:00am", "12:30pm", "2:00pm", "All Day"]
+
+
+def synthetic_month(year: int, month: int, rows: int, rng: random.Random) -> list[dict]:
+    first = date(year, month, 1)
+    days = [first + timedelta(days=offset) for offset in range(28)]
+    data = []
+    for index in range(rows):
+        day = days[index * len(days) // rows]
+        row = {
+            "time": rng.choice(TIMES),
+            "currency": rng.choice(CURRENCIES),
+            "impact": rng.choice(IMPACTS),
+            "event": f"Event {index}",
+        }
+        if not data or data[-1].get("_day") != day:
+            row["date"] = day.strftime("%a %b ") + str(day.day)
+        row["_day"] = day
+        data.append(row)
+    for row in data:
+        row.pop("_day")
+    return data
+
+
+def uncached_convert(date_str, time_str, from_zone_str, to_zone_str):
+    if not time_str or not date_str or not from_zone_str or not to_zone_str:
+        return time_str
+    if time_str.lower() in ["all day", "tentative"]:
+        return time_str
+    try:
+        from_zone = pytz.timezone(from_zone_str)
+        to_zone = pytz.timezone(to_zone_str)
+        naive_dt = datetime.strptime(f"{date_str} {time_str}", "%d/%m/%Y %I:%M%p")
+        return from_zone.localize(naive_dt).astimezone(to_zone).strftime("%H:%M")
+    except Exception:
+        return time_str
+
+
+def uncached_parse(record: dict):
+    naive = datetime.strptime(f"{record['date']} {record['time']}", "%d/%m/%Y %H:%M")
+    return pytz.timezone(record["timezone"]).localize(naive)
+
+
+def timed(function) -> float:
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--source", default="America/New_York")
+    parser.add_argument("--target", default="Asia/Karachi")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    months = [(2023 + index // 12, index % 12 + 1) for index in range(args.months)]
+    raw_months = [(str(year), synthetic_month(year, month, args.rows, rng)) for year, month in months]
+
+    def normalize_all():
+        return [
+            normalize_rows(rows, year, args.source, args.target, CURRENCIES, IMPACTS, "")
+            for year, rows in raw_months
+        ]
+
+    unconverted = [
+        normalize_rows(rows, year, None, None, CURRENCIES, IMPACTS, "") for year, rows in raw_months
+    ]
+    pairs = [(row["date"], row["time"]) for month in unconverted for row in month]
+    normalized = [row for month in normalize_all() for row in month]
+    total_rows = len(pairs)
+
+    uncached = timed(lambda: [uncached_convert(d, t, args.source, args.target) for d, t in pairs])
+    convert_with_utc.cache_clear()
+    get_zone.cache_clear()
+    cached = timed(lambda: [convert_time(d, t, args.source, args.target) for d, t in pairs])
+    batch = timed(normalize_all)
+
+    timed_records = [row for row in normalized if ":" in row["time"]]
+    uncached_alerts = timed(lambda: [uncached_parse(row) for row in timed_records])
+    parse_local_time.cache_clear()
+    cached_alerts = timed(lambda: [_parse_event_time(row) for row in timed_records])
+
+    print(f"{total_rows} rows over {args.months} months, {args.source} -> {args.target}")
+    print(f"  per-row pytz conversion      {uncached:8.3f}s")
+    print(f"  cached convert_time          {cached:8.3f}s  ({uncached / cached:.1f}x)")
+    print(f"  normalize_rows (batch)       {batch:8.3f}s  (includes parsing and filtering)")
+    print(f"{len(timed_records)} stored records parsed for alerts")
+    print(f"  per-record strptime + pytz   {uncached_alerts:8.3f}s")
+    print(f"  cached parse_local_time      {cached_alerts:8.3f}s  ({uncached_alerts / cached_alerts:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
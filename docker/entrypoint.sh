@@ -61,8 +61,20 @@ run_scheduler_loop() {
   done
 }
 
+start_browser_daemon() {
+  case "${FF_BROWSER_DAEMON:-false}" in
+    1|true|yes|on) ;;
+    *) return ;;
+  esac
+
+  mkdir -p "${LOG_DIR}"
+  echo "Starting warm browser daemon"
+  (cd /app && /usr/local/bin/python3 -m ff_calendar_toolkit.cli browser-daemon >> "${LOG_DIR}/browser_daemon.log" 2>&1) &
+}
+
 if [[ "${MODE}" == "schedule" ]]; then
   SCHEDULE="$(resolve_schedule)"
+  start_browser_daemon
   run_scheduler_loop "${SCHEDULE}" "scrape" "${LOG_FILE}"
 fi
 
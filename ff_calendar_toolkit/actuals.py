@@ -0,0 +1,163 @@
+"""Poll day views around scheduled releases and store actual values as soon as they appear."""
+
+import json
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .alerts.events import load_alert_events
+from .alerts.models import AlertEvent
+from .console import AppConsole
+from .models import ActualsOptions
+from .normalize import event_identity, normalize_rows
+from .service import build_scraper
+from .storage import OutputStore, build_store
+from .timeconv import get_zone
+
+LATENCY_LOG_NAME = "latency.jsonl"
+
+
+def actuals_dir(state_dir: Path) -> Path:
+    return state_dir / "actuals"
+
+
+def watched_events(
+    events: list[AlertEvent],
+    now: datetime,
+    impacts: list[str],
+    lookahead_minutes: int,
+    give_up_minutes: int,
+) -> list[AlertEvent]:
+    """Events without an actual whose release time falls inside the watch window around now."""
+    window_start = now - timedelta(minutes=give_up_minutes)
+    window_end = now + timedelta(minutes=lookahead_minutes)
+    return [
+        event
+        for event in events
+        if window_start <= event.event_time <= window_end
+        and not event.payload.get("actual")
+        and event.payload.get("impact", "").lower() in impacts
+    ]
+
+
+def day_selector(event: AlertEvent, source_timezone: str | None) -> str:
+    """Day view that lists the event, in the timezone the calendar page is rendered in."""
+    if source_timezone:
+        local_time = event.event_time.astimezone(get_zone(source_timezone))
+    else:
+        local_time = event.event_time.astimezone()
+    return f"day:{local_time:%Y-%m-%d}"
+
+
+class ActualsWatcher:
+    def __init__(self, console: AppConsole | None = None, clock=None, sleep=time.sleep) -> None:
+        self.console = console or AppConsole()
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.sleep = sleep
+
+    def run(self, options: ActualsOptions) -> int:
+        run = options.run
+        pending = {
+            event.event_id: event
+            for event in watched_events(
+                load_alert_events(run.output_dir, run.sqlite_path),
+                self.clock(),
+                options.impacts,
+                options.lookahead_minutes,
+                options.give_up_minutes,
+            )
+        }
+        if not pending:
+            self.console.success("No releases without actuals inside the watch window")
+            return 0
+
+        self.console.step(f"Watching {len(pending)} release(s) for actual values")
+        source_timezone = run.source_timezone if run.engine == "http" else None
+        give_up = timedelta(minutes=options.give_up_minutes)
+        scraper = build_scraper(self.console, run)
+        session = scraper.session() if run.reuse_browser else nullcontext()
+        with build_store(run) as store, session:
+            while pending:
+                now = self.clock()
+                for event_id, event in list(pending.items()):
+                    if now > event.event_time + give_up:
+                        self.console.warn(
+                            f"Giving up on {event.payload.get('currency', '')} "
+                            f"{event.payload.get('event', '')}: no actual after {options.give_up_minutes} minutes"
+                        )
+                        del pending[event_id]
+
+                due = [event for event in pending.values() if event.event_time <= now]
+                if due:
+                    self._poll(scraper, store, options, due, pending, source_timezone)
+                if not pending:
+                    break
+                if due:
+                    self.sleep(options.poll_seconds)
+                else:
+                    next_release = min(event.event_time for event in pending.values())
+                    self.sleep(max(0.0, (next_release - now).total_seconds()))
+
+        self.console.success("Actuals watch finished")
+        return 0
+
+    def _poll(
+        self,
+        scraper,
+        store: OutputStore,
+        options: ActualsOptions,
+        due: list[AlertEvent],
+        pending: dict,
+        source_timezone: str | None,
+    ) -> None:
+        run = options.run
+        for selector in sorted({day_selector(event, source_timezone) for event in due}):
+            try:
+                raw_rows, context = scraper.scrape_month(selector, run.target_timezone)
+            except Exception as error:
+                # A timeout right at release time must not end the watch; the next tick retries.
+                self.console.warn(f"Polling {selector} failed, retrying in {options.poll_seconds}s: {error}")
+                continue
+            records = normalize_rows(
+                raw_rows,
+                context.year,
+                context.source_timezone,
+                run.target_timezone,
+                run.allowed_currencies,
+                run.allowed_impacts,
+                context.scraped_at,
+            )
+            released = [
+                record for record in records if record.get("actual") and event_identity(record) in pending
+            ]
+            if not released:
+                continue
+
+            store.merge_monthly(released, run.output_format)
+            stored_at = self.clock()
+            for record in released:
+                event = pending.pop(event_identity(record))
+                latency = (stored_at - event.event_time).total_seconds()
+                self._log_latency(run.state_dir, event, record, stored_at, latency)
+                self.console.success(
+                    f"{record['currency']} {record['event']}: actual {record['actual']} "
+                    f"stored {latency:.1f}s after release"
+                )
+
+    def _log_latency(
+        self, state_dir: Path, event: AlertEvent, record: dict, stored_at: datetime, latency: float
+    ) -> None:
+        directory = actuals_dir(state_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "event_id": event.event_id,
+            "currency": record.get("currency", ""),
+            "event": record.get("event", ""),
+            "actual": record.get("actual", ""),
+            "released_at": event.event_time.isoformat(),
+            "stored_at": stored_at.isoformat(),
+            "latency_seconds": round(latency, 3),
+        }
+        with open(directory / LATENCY_LOG_NAME, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\n")
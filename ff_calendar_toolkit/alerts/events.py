@@ -1,38 +1,46 @@
-import json
 from datetime import datetime
 from pathlib import Path
 
-import pytz
-
+from ..normalize import event_identity
+from ..records import CalendarRecord
+from ..storage import dataset_stems, read_record_path, record_file_path
+from ..timeconv import from_timestamp, parse_local_time
 from .models import AlertEvent
 
 
-def event_identity(record: dict) -> str:
-    parts = [
-        record.get("date", ""),
-        record.get("time", ""),
-        record.get("currency", ""),
-        record.get("event", ""),
-        record.get("impact", ""),
-    ]
-    return "|".join(parts)
+def load_alert_events(
+    output_dir: Path,
+    sqlite_path: Path | None = None,
+    currencies: list[str] | None = None,
+    impacts: list[str] | None = None,
+) -> list[AlertEvent]:
+    """Timed events from the store, optionally limited to currencies and impacts.
 
+    With a sqlite_path the events table is read (filters run in SQL); otherwise
+    the monthly datasets are overlaid with last_run. Parquet and Arrow datasets
+    apply the filters while reading.
+    """
+    if sqlite_path is not None:
+        from ..sqlite_store import read_events
 
-def load_alert_events(output_dir: Path) -> list[AlertEvent]:
-    records = {}
-    for path in sorted((output_dir / "monthly").glob("*.json")):
-        for event in _events_from_file(path):
-            records[event.event_id] = event
-    for path in sorted((output_dir / "last_run").glob("*.json")):
-        for event in _events_from_file(path):
-            records[event.event_id] = event
-    return sorted(records.values(), key=lambda event: event.event_time)
+        events = _events_from_records(read_events(sqlite_path, currencies=currencies, impacts=impacts))
+        return sorted(events, key=lambda event: event.event_time)
 
+    records = {}
+    for directory in (output_dir / "monthly", output_dir / "last_run"):
+        for stem in dataset_stems(directory):
+            path = record_file_path(directory, stem)
+            for event in _events_from_records(read_record_path(path, currencies=currencies, impacts=impacts)):
+                records[event.event_id] = event
+    events = records.values()
+    if currencies:
+        events = [event for event in events if event.payload.get("currency", "") in currencies]
+    if impacts:
+        events = [event for event in events if event.payload.get("impact", "") in impacts]
+    return sorted(events, key=lambda event: event.event_time)
 
-def _events_from_file(path: Path) -> list[AlertEvent]:
-    with open(path, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
 
+def _events_from_records(payload: list[dict]) -> list[AlertEvent]:
     events = []
     for record in payload:
         try:
@@ -45,13 +53,17 @@ def _events_from_file(path: Path) -> list[AlertEvent]:
             AlertEvent(
                 event_id=event_identity(record),
                 event_time=event_time,
-                payload=record,
+                payload=CalendarRecord.from_dict(record),
             )
         )
     return events
 
 
 def _parse_event_time(record: dict) -> datetime | None:
+    timestamp = record.get("event_timestamp_utc")
+    if timestamp not in (None, ""):
+        return from_timestamp(timestamp, record.get("timezone", "").strip() or None)
+
     date_value = record.get("date", "").strip()
     time_value = record.get("time", "").strip()
     timezone_value = record.get("timezone", "").strip()
@@ -61,6 +73,4 @@ def _parse_event_time(record: dict) -> datetime | None:
     if time_value.lower() in {"all day", "tentative"}:
         return None
 
-    naive = datetime.strptime(f"{date_value} {time_value}", "%d/%m/%Y %H:%M")
-    timezone = pytz.timezone(timezone_value)
-    return timezone.localize(naive)
+    return parse_local_time(date_value, time_value, timezone_value)
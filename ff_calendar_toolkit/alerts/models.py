@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -13,11 +14,11 @@ class AlertRule:
     path: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlertEvent:
     event_id: str
     event_time: datetime
-    payload: dict
+    payload: Mapping
 
 
 @dataclass(frozen=True)
@@ -100,7 +100,7 @@ class NotifierFactory:
                 "id": rule.rule_id,
                 "name": rule.name,
             },
-            "event": event.payload,
+            "event": dict(event.payload),
             "event_time": event.event_time.isoformat(),
         }
         _post_json(url, payload, headers=headers)
@@ -18,7 +18,7 @@ class AlertService:
         state_store = AlertStateStore(options.state_dir)
         state = state_store.load()
         rules = load_rules(options.rules_dir)
-        events = load_alert_events(options.output_dir)
+        events = load_alert_events(options.output_dir, options.sqlite_path)
         notifier_factory = NotifierFactory(options)
         now = datetime.now(timezone.utc)
 
@@ -80,7 +80,7 @@ class AlertService:
 
 def preview_alerts(options: AlertOptions) -> list[dict]:
     rules = load_rules(options.rules_dir)
-    events = load_alert_events(options.output_dir)
+    events = load_alert_events(options.output_dir, options.sqlite_path)
     state_store = AlertStateStore(options.state_dir)
     state = state_store.load()
     now = datetime.now(timezone.utc)
@@ -0,0 +1,97 @@
+"""Resumable scraping of explicit year-month ranges with a per-month checkpoint."""
+
+import json
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .console import AppConsole
+from .models import BackfillOptions, ScrapeContext
+from .periods import month_range
+from .service import ScrapeService
+from .storage import OutputStore, build_store
+
+
+def month_end(slug: str) -> datetime:
+    year, month_number = (int(part) for part in slug.split("-"))
+    return datetime(year + month_number // 12, month_number % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def month_is_complete(store: OutputStore, slug: str) -> bool:
+    """A month is complete once the whole month was scraped after it ended.
+
+    Only full-month scrapes count: a week or day merge can carry a later scraped_at
+    into a month it only partly covers.
+    """
+    scraped = [value for value in store.month_scrape_times(slug) if value]
+    if not scraped:
+        return False
+    latest = max(datetime.fromisoformat(value) for value in scraped)
+    if latest.tzinfo is None:
+        latest = latest.replace(tzinfo=timezone.utc)
+    return latest >= month_end(slug)
+
+
+class BackfillCheckpoint:
+    def __init__(self, state_dir: Path) -> None:
+        self.state_dir = state_dir / "backfill"
+        self.checkpoint_path = self.state_dir / "checkpoint.json"
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def load(self) -> dict:
+        if not self.checkpoint_path.exists():
+            return {"completed": {}}
+        with open(self.checkpoint_path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        payload.setdefault("completed", {})
+        return payload
+
+    def mark_done(self, state: dict, slug: str, records: int | None, source: str) -> None:
+        state.setdefault("completed", {})[slug] = {
+            "records": records,
+            "source": source,
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        temp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(state, handle, indent=2)
+        temp_path.replace(self.checkpoint_path)
+
+
+class BackfillService:
+    def __init__(self, console: AppConsole | None = None, scrape_service: ScrapeService | None = None) -> None:
+        self.console = console or AppConsole()
+        self.scrape_service = scrape_service or ScrapeService(self.console)
+
+    def run(self, options: BackfillOptions) -> int:
+        run = options.run
+        months = month_range(options.start, options.end)
+        checkpoint = BackfillCheckpoint(run.state_dir)
+        state = checkpoint.load()
+
+        remaining = []
+        with build_store(run) as store:
+            for slug in months:
+                if options.force:
+                    remaining.append(slug)
+                elif slug in state["completed"]:
+                    continue
+                elif month_is_complete(store, slug):
+                    checkpoint.mark_done(state, slug, None, "existing")
+                else:
+                    remaining.append(slug)
+
+        self.console.step(
+            f"Backfill {months[0]} to {months[-1]}: {len(months) - len(remaining)} month(s) already done, "
+            f"{len(remaining)} to scrape"
+        )
+        if not remaining:
+            self.console.success("Backfill already complete")
+            return 0
+
+        def on_month_written(context: ScrapeContext, records: list[dict]) -> None:
+            # Months that have not ended yet are written but left for the next run to finish.
+            if datetime.fromisoformat(context.scraped_at) >= month_end(context.month_slug):
+                checkpoint.mark_done(state, context.month_slug, len(records), "scraped")
+
+        return self.scrape_service.run(replace(run, months=remaining), on_month_written=on_month_written)
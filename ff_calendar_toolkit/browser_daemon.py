@@ -0,0 +1,266 @@
+"""Long-lived headless Chrome that cron-triggered scrapes attach to over DevTools."""
+
+import json
+import os
+import shutil
+import signal
+import subprocess
+import time
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+
+CHROME_BINARY_NAMES = ["chromium", "chromium-browser", "google-chrome", "google-chrome-stable"]
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+def daemon_dir(state_dir: Path) -> Path:
+    return state_dir / "browser"
+
+
+def resolve_chrome_binary() -> str | None:
+    configured = os.getenv("FF_CHROME_BIN") or os.getenv("CHROME_BIN")
+    if configured:
+        return configured
+    for name in CHROME_BINARY_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def daemon_endpoint(state_dir: Path, timeout_seconds: float = 1.0) -> str | None:
+    """Return the debugger address of a running daemon browser, or None."""
+    endpoint_path = daemon_dir(state_dir) / "endpoint.json"
+    if not endpoint_path.exists():
+        return None
+    try:
+        payload = json.loads(endpoint_path.read_text(encoding="utf-8"))
+        address = payload["debugger_address"]
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=timeout_seconds):
+            pass
+    except (OSError, ValueError, KeyError):
+        return None
+    return address
+
+
+def acquire_lease(state_dir: Path) -> Path:
+    leases_dir = daemon_dir(state_dir) / "leases"
+    leases_dir.mkdir(parents=True, exist_ok=True)
+    lease_path = leases_dir / f"{os.getpid()}.lease"
+    lease_path.write_text(datetime.now(timezone.utc).isoformat(), encoding="utf-8")
+    return lease_path
+
+
+def release_lease(lease_path: Path) -> None:
+    try:
+        lease_path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def record_page(state_dir: Path) -> None:
+    with open(daemon_dir(state_dir) / "pages.log", "a", encoding="utf-8") as handle:
+        handle.write(f"{os.getpid()}\n")
+
+
+def process_tree_rss_bytes(root_pid: int) -> int | None:
+    """Sum VmRSS over a process and its descendants using /proc, or None off Linux."""
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+    children = {}
+    for stat_path in proc.glob("[0-9]*/stat"):
+        try:
+            fields = stat_path.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat_path.parent.name))
+
+    total = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            for line in (proc / str(pid) / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total += int(line.split()[1]) * 1024
+                    break
+        except OSError:
+            continue
+    return total
+
+
+class BrowserDaemon:
+    def __init__(
+        self,
+        console,
+        state_dir: Path,
+        port: int,
+        max_pages: int,
+        max_memory_mb: int,
+        chrome_arguments: list[str] | None = None,
+        poll_seconds: float = 5.0,
+        startup_timeout_seconds: float = 30.0,
+    ) -> None:
+        self.console = console
+        self.state_dir = state_dir
+        self.directory = daemon_dir(state_dir)
+        self.port = port
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.chrome_arguments = list(chrome_arguments or [])
+        self.poll_seconds = poll_seconds
+        self.startup_timeout_seconds = startup_timeout_seconds
+        self.endpoint_path = self.directory / "endpoint.json"
+        self.pages_path = self.directory / "pages.log"
+        self.leases_dir = self.directory / "leases"
+        self._process = None
+        self._generation = 0
+        self._stopping = False
+
+    def run(self) -> int:
+        chrome_binary = resolve_chrome_binary()
+        if not chrome_binary:
+            self.console.error("No Chrome binary found. Set FF_CHROME_BIN to run the browser daemon.")
+            return 1
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.leases_dir.mkdir(parents=True, exist_ok=True)
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+        try:
+            self._start(chrome_binary)
+        except RuntimeError as error:
+            self.console.error(str(error))
+            return 1
+        try:
+            while not self._stopping:
+                time.sleep(self.poll_seconds)
+                reason = self._recycle_reason()
+                browser_gone = self._process is None or self._process.poll() is not None
+                if reason and (browser_gone or not self._active_leases()):
+                    self.console.step(f"Recycling daemon browser: {reason}")
+                    self._stop_browser()
+                    try:
+                        self._start(chrome_binary)
+                    except RuntimeError as error:
+                        self.console.warn(f"{error}; retrying in {self.poll_seconds:g}s")
+        finally:
+            self._stop_browser()
+            self.endpoint_path.unlink(missing_ok=True)
+        self.console.success("Browser daemon stopped")
+        return 0
+
+    def _request_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _start(self, chrome_binary: str) -> None:
+        self._generation += 1
+        # Clients must never find the previous generation's address while this one starts.
+        self.endpoint_path.unlink(missing_ok=True)
+        self.pages_path.write_text("", encoding="utf-8")
+        started = time.perf_counter()
+        self._process = subprocess.Popen(
+            [
+                chrome_binary,
+                "--headless=new",
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+                "--disable-gpu",
+                "--window-size=1920,1080",
+                f"--user-agent={USER_AGENT}",
+                "--remote-debugging-address=127.0.0.1",
+                f"--remote-debugging-port={self.port}",
+                f"--user-data-dir={self.directory / 'profile'}",
+                *self.chrome_arguments,
+                "about:blank",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        address = f"127.0.0.1:{self.port}"
+        deadline = time.monotonic() + self.startup_timeout_seconds
+        while time.monotonic() < deadline and self._process.poll() is None:
+            try:
+                with urllib.request.urlopen(f"http://{address}/json/version", timeout=1):
+                    break
+            except OSError:
+                time.sleep(0.2)
+        else:
+            self._stop_browser()
+            raise RuntimeError(
+                f"Daemon browser did not answer on {address} within {self.startup_timeout_seconds:g}s"
+            )
+        self.endpoint_path.write_text(
+            json.dumps(
+                {
+                    "debugger_address": address,
+                    "browser_pid": self._process.pid,
+                    "daemon_pid": os.getpid(),
+                    "generation": self._generation,
+                    "started_at": datetime.now(timezone.utc).isoformat(),
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        self.console.success(
+            f"Daemon browser generation {self._generation} listening on {address} "
+            f"after {time.perf_counter() - started:.2f}s"
+        )
+
+    def _stop_browser(self) -> None:
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _recycle_reason(self) -> str | None:
+        if self._process is None:
+            return "browser failed to start"
+        if self._process.poll() is not None:
+            return "browser process exited"
+        pages = self._page_count()
+        if self.max_pages and pages >= self.max_pages:
+            return f"{pages} pages served"
+        rss = process_tree_rss_bytes(self._process.pid)
+        if rss is not None and self.max_memory_mb and rss > self.max_memory_mb * 1024 * 1024:
+            return f"memory at {rss / 1024 / 1024:.0f} MB"
+        return None
+
+    def _page_count(self) -> int:
+        try:
+            with open(self.pages_path, "r", encoding="utf-8") as handle:
+                return sum(1 for _ in handle)
+        except FileNotFoundError:
+            return 0
+
+    def _active_leases(self) -> list[Path]:
+        active = []
+        for lease_path in self.leases_dir.glob("*.lease"):
+            if _pid_alive(int(lease_path.stem)):
+                active.append(lease_path)
+            else:
+                release_lease(lease_path)
+        return active
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -0,0 +1,284 @@
+"""Column-wise normalization of many months at once, for re-processing stored data.
+
+``normalize_batches`` produces the same records as ``iter_normalized_rows`` and
+``renormalize_batches`` the same as ``renormalize_records``, row for row, but
+forward-fills dates, filters and converts times as pandas column operations
+over every month in one frame. Values outside the shapes the column parser is
+known to read exactly like ``strptime`` (unusual time labels, times inside a
+DST gap) are converted with the scalar helpers instead.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .config import NORMALIZED_FIELDS
+from .normalize import DATE_PATTERN, record_instant
+from .timeconv import UNTIMED_LABELS, convert_with_instant, get_zone
+
+RAW_VALUE_FIELDS = ["currency", "impact", "event", "detail", "actual", "forecast", "previous"]
+MONTH_NUMBERS = {
+    name: datetime.strptime(name, "%b").month
+    for name in ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+}
+DATE_VALUE_PATTERN = r"[0-9]{2}/[0-9]{2}/[0-9]{4}"
+CALENDAR_TIME_PATTERN = r"(?i)(?:1[0-2]|0?[1-9]):[0-5][0-9][ap]m"
+CLOCK_TIME_PATTERN = r"(?:[01][0-9]|2[0-3]):[0-5][0-9]"
+EPOCH = pd.Timestamp("1970-01-01", tz="UTC")
+
+
+def normalize_batches(
+    batches: list[tuple[list[dict], str, str | None, str | None]],
+    target_timezone: str | None,
+    allowed_currencies: list[str],
+    allowed_impacts: list[str],
+) -> list[list[dict]]:
+    """Normalize (raw_rows, year, source_timezone, scraped_at) batches; one record list per batch."""
+    rows = [row for raw_rows, *_ in batches for row in raw_rows]
+    results = [[] for _ in batches]
+    if not rows:
+        return results
+
+    batch_ids = np.repeat(np.arange(len(batches)), [len(raw_rows) for raw_rows, *_ in batches])
+    batch = pd.Series(batch_ids)
+    fields = ["date", "time", *RAW_VALUE_FIELDS]
+    frame = pd.DataFrame({field: [row.get(field) for row in rows] for field in fields}, dtype=object)
+    key_counts = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+
+    current_date, current_day = _filled_dates(frame["date"], batch, [str(year) for _, year, *_ in batches])
+    times = frame["time"]
+    has_time = times.notna() & (times != "empty")
+    current_time = pd.Series(None, index=frame.index, dtype=object)
+    current_time[has_time] = times[has_time].astype(str).str.strip()
+    current_time = current_time.groupby(batch).ffill().fillna("")
+
+    values = {field: _clean(frame[field]) for field in RAW_VALUE_FIELDS}
+    keep = (
+        (key_counts != 1)
+        & values["currency"].isin(allowed_currencies)
+        & values["impact"].str.lower().isin(allowed_impacts)
+    )
+    if not keep.any():
+        return results
+
+    kept = batch[keep]
+    dates = current_date[keep]
+    times = current_time[keep]
+    utc = _empty_instants(kept.index)
+    sources = kept.map(lambda batch_id: batches[batch_id][2] or "")
+    for source_timezone, index in sources.groupby(sources).groups.items():
+        utc[index] = _calendar_instants(dates[index], times[index], source_timezone or None, target_timezone)
+
+    converted, event_time_utc, event_timestamp_utc = _time_columns(times, utc, _zone_or_none(target_timezone))
+    columns = {
+        "time": _clean(converted),
+        "timezone": kept.map(lambda batch_id: _clean_value(target_timezone or batches[batch_id][2] or "")),
+        **{field: values[field][keep] for field in RAW_VALUE_FIELDS},
+        "day": current_day[keep],
+        "date": dates,
+        "scraped_at": kept.map(lambda batch_id: _clean_value(batches[batch_id][3] or "")),
+        "event_time_utc": event_time_utc,
+        "event_timestamp_utc": event_timestamp_utc,
+    }
+    return _split_records(columns, kept, results)
+
+
+def renormalize_batches(
+    batches: list[list[dict]],
+    target_timezone: str | None,
+    allowed_currencies: list[str],
+    allowed_impacts: list[str],
+) -> list[list[dict]]:
+    """Column-wise ``renormalize_records`` over several months of stored records; one list per batch."""
+    to_zone = get_zone(target_timezone) if target_timezone else None
+    rows = [record for records in batches for record in records]
+    results = [[] for _ in batches]
+    if not rows:
+        return results
+
+    batch = pd.Series(np.repeat(np.arange(len(batches)), [len(records) for records in batches]))
+    frame = pd.DataFrame(
+        {field: [row.get(field, "") for row in rows] for field in NORMALIZED_FIELDS}, dtype=object
+    )
+    keep = (
+        frame["currency"].isin(allowed_currencies)
+        & frame["impact"].astype(str).str.lower().isin(allowed_impacts)
+    )
+    if not keep.any():
+        return results
+
+    frame = frame[keep]
+    kept = batch[keep]
+    utc = _empty_instants(frame.index)
+
+    stamps = frame["event_timestamp_utc"]
+    missing = stamps.isna() | (stamps == "")
+    numeric = ~missing & stamps.astype(str).str.fullmatch(r"[0-9]{1,12}")
+    seconds = pd.to_numeric(stamps[numeric].astype(str)).astype("int64")
+    utc[seconds.index] = pd.to_datetime(seconds, unit="s", utc=True)
+
+    local = (
+        missing
+        & frame["date"].astype(str).str.fullmatch(DATE_VALUE_PATTERN)
+        & frame["time"].astype(str).str.fullmatch(CLOCK_TIME_PATTERN)
+    )
+    zones = frame["timezone"][local]
+    parsed = pd.Series(False, index=frame.index)
+    for zone_name, index in zones.groupby(zones).groups.items():
+        zone = _zone_or_none(zone_name)
+        if zone is None:
+            parsed[index] = True
+            continue
+        instants = _utc_instants(frame["date"][index] + " " + frame["time"][index], "%d/%m/%Y %H:%M", zone)
+        utc[index] = instants
+        parsed[index] = instants.notna()
+
+    # strptime needs digits in both the date and the time, so rows without them have no instant.
+    hopeless = missing & (
+        ~frame["time"].astype(str).str.contains("[0-9]")
+        | ~frame["date"].astype(str).str.contains("[0-9]")
+        | (frame["timezone"] == "")
+    )
+    for index in frame.index[~numeric & ~parsed & ~hopeless]:
+        instant = record_instant(rows[index])
+        if instant is not None:
+            utc[index] = pd.Timestamp(instant).tz_convert("UTC")
+
+    converted, event_time_utc, event_timestamp_utc = _time_columns(frame["time"], utc, to_zone)
+    columns = {field: frame[field] for field in NORMALIZED_FIELDS}
+    columns.update(
+        time=converted,
+        timezone=frame["timezone"] if not target_timezone else pd.Series(target_timezone, index=frame.index),
+        event_time_utc=event_time_utc,
+        event_timestamp_utc=event_timestamp_utc,
+    )
+    return _split_records(columns, kept, results)
+
+
+def _filled_dates(dates: pd.Series, batch: pd.Series, years: list[str]) -> tuple[pd.Series, pd.Series]:
+    """Forward-filled dd/mm/yyyy dates and weekday names, rolling the year when a month goes backwards."""
+    has_date = dates.notna() & (dates != "empty")
+    parts = dates[has_date].astype(str).str.extract(DATE_PATTERN)
+    parts = parts[parts["day"].notna()]
+
+    current_date = pd.Series(None, index=dates.index, dtype=object)
+    current_day = pd.Series(None, index=dates.index, dtype=object)
+    if not parts.empty:
+        months = parts["month"].map(MONTH_NUMBERS).astype("int64")
+        part_batches = batch[parts.index]
+        previous = months.groupby(part_batches).shift(1, fill_value=0)
+        offsets = (months < previous).astype("int64").groupby(part_batches).cumsum()
+        year_values = part_batches.map(lambda batch_id: years[batch_id]).astype(object)
+        rolled = offsets > 0
+        year_values[rolled] = (
+            part_batches[rolled].map(lambda batch_id: int(years[batch_id])) + offsets[rolled]
+        ).astype(str)
+        current_date[parts.index] = (
+            parts["date"].astype(str).str.zfill(2) + "/" + months.map("{:02d}".format) + "/" + year_values
+        )
+        current_day[parts.index] = parts["day"]
+
+    return (
+        current_date.groupby(batch).ffill().fillna(""),
+        current_day.groupby(batch).ffill().fillna(""),
+    )
+
+
+def _calendar_instants(
+    dates: pd.Series, times: pd.Series, source_timezone: str | None, target_timezone: str | None
+) -> pd.Series:
+    """UTC instants of calendar ``9:30am`` times, NaT where ``convert_with_instant`` finds none."""
+    utc = _empty_instants(times.index)
+    try:
+        from_zone = get_zone(source_timezone) if source_timezone else None
+        to_zone = get_zone(target_timezone) if target_timezone else None
+    except Exception:
+        return utc
+    if from_zone is None:
+        return utc
+
+    timed = (times != "") & (dates != "") & ~times.str.lower().isin(UNTIMED_LABELS)
+    vector = timed & times.str.fullmatch(CALENDAR_TIME_PATTERN) & dates.str.fullmatch(DATE_VALUE_PATTERN)
+    instants = _utc_instants(dates[vector] + " " + times[vector], "%d/%m/%Y %I:%M%p", from_zone)
+    utc[instants.index] = instants
+
+    for index in times.index[timed & utc.isna()]:
+        _, instant = convert_with_instant(dates[index], times[index], from_zone, to_zone)
+        if instant is not None:
+            utc[index] = pd.Timestamp(instant)
+    return utc
+
+
+def _utc_instants(text: pd.Series, time_format: str, zone) -> pd.Series:
+    """Parse and localize like pytz ``localize`` (standard time when ambiguous); NaT inside DST gaps."""
+    if text.empty:
+        return _empty_instants(text.index)
+    parsed = pd.to_datetime(text, format=time_format, errors="coerce")
+    localized = parsed.dt.tz_localize(zone, ambiguous=np.zeros(len(parsed), dtype=bool), nonexistent="NaT")
+    return localized.dt.tz_convert("UTC")
+
+
+def _time_columns(times: pd.Series, utc: pd.Series, to_zone) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """Converted ``HH:MM`` times plus event_time_utc / event_timestamp_utc, as ``utc_fields`` writes them."""
+    converted = times.astype(object).copy()
+    event_time_utc = pd.Series("", index=times.index, dtype=object)
+    event_timestamp_utc = pd.Series("", index=times.index, dtype=object)
+    instants = utc.dropna()
+    if instants.empty:
+        return converted, event_time_utc, event_timestamp_utc
+
+    # Series.dt.strftime formats row by row; clock strings come from lookup tables and dates are
+    # formatted once per distinct day.
+    if to_zone is not None:
+        local = instants.dt.tz_convert(to_zone)
+        converted[instants.index] = _clock_strings()[(local.dt.hour * 60 + local.dt.minute).to_numpy()][:, 0]
+    seconds = ((instants - EPOCH) // pd.Timedelta(seconds=1)).to_numpy()
+    days = instants.dt.floor("D")
+    unique_days = days.unique()
+    day_strings = days.map(dict(zip(unique_days, unique_days.strftime("%Y-%m-%d")))).to_numpy(dtype=object)
+    second_of_day = (seconds % 86400).astype(np.int64)
+    clock = _clock_strings()[second_of_day // 60][:, 1] + _second_strings()[second_of_day % 60]
+    event_time_utc[instants.index] = day_strings + clock
+    event_timestamp_utc[instants.index] = seconds.astype(object)
+    return converted, event_time_utc, event_timestamp_utc
+
+
+def _split_records(columns: dict, kept: pd.Series, results: list[list[dict]]) -> list[list[dict]]:
+    values = [columns[field].reindex(kept.index).tolist() for field in NORMALIZED_FIELDS]
+    for batch_id, row in zip(kept.tolist(), zip(*values)):
+        results[batch_id].append(dict(zip(NORMALIZED_FIELDS, row)))
+    return results
+
+
+@lru_cache(maxsize=None)
+def _clock_strings() -> np.ndarray:
+    """Per minute of the day: ``HH:MM`` and ``THH:MM`` (the ISO time prefix)."""
+    clock = [f"{minute // 60:02d}:{minute % 60:02d}" for minute in range(1440)]
+    return np.array([[value, f"T{value}"] for value in clock], dtype=object)
+
+
+@lru_cache(maxsize=None)
+def _second_strings() -> np.ndarray:
+    return np.array([f":{second:02d}+00:00" for second in range(60)], dtype=object)
+
+
+def _empty_instants(index) -> pd.Series:
+    return pd.Series(pd.NaT, index=index, dtype="datetime64[ns, UTC]")
+
+
+def _zone_or_none(name: str | None):
+    try:
+        return get_zone(name) if name else None
+    except Exception:
+        return None
+
+
+def _clean(column: pd.Series) -> pd.Series:
+    values = column.astype(object).where(column.notna(), "")
+    return values.where(values != "empty", "")
+
+
+def _clean_value(value: str) -> str:
+    return "" if value == "empty" else value
@@ -4,10 +4,22 @@ import subprocess
 import sys
 from pathlib import Path
 
-from .config import DEFAULT_VIEWER_HOST, DEFAULT_VIEWER_PORT
+from .config import (
+    DEFAULT_VIEWER_HOST,
+    DEFAULT_VIEWER_PORT,
+    ENGINES,
+    EXTRACTION_MODES,
+    OUTPUT_FORMATS,
+    STORAGE_BACKENDS,
+)
 from .console import AppConsole
+from .periods import WEEK_SELECTORS
 from .runtime import (
+    build_actuals_options,
     build_alert_options,
+    build_backfill_options,
+    build_renormalize_options,
+    build_replay_options,
     build_run_options,
     build_view_options,
     current_alert_schedule,
@@ -27,10 +39,21 @@ def build_parser() -> argparse.ArgumentParser:
     scrape = subparsers.add_parser("scrape", help="Run the scraper and write output files")
     scrape.add_argument("--config", help="Path to YAML config file")
     scrape.add_argument("--months", nargs="+", help="Month selectors such as this next")
+    scrape.add_argument(
+        "--week",
+        nargs="+",
+        choices=WEEK_SELECTORS,
+        help="Also scrape the week view and merge it into the monthly files",
+    )
+    scrape.add_argument(
+        "--day",
+        nargs="+",
+        help="Also scrape the day view (today, tomorrow or YYYY-MM-DD) and merge it into the monthly files",
+    )
     scrape.add_argument(
         "--format",
         dest="output_format",
-        choices=["csv", "json", "both"],
+        choices=OUTPUT_FORMATS,
         help="Output format to write",
     )
     scrape.add_argument("--output-dir", help="Directory for generated artifacts")
@@ -50,6 +73,180 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Run with a visible browser instead of headless mode",
     )
+    scrape.add_argument(
+        "--engine",
+        choices=ENGINES,
+        help="Fetch pages with a Selenium browser or a plain HTTP client",
+    )
+    scrape.add_argument(
+        "--extraction",
+        dest="extraction_mode",
+        choices=EXTRACTION_MODES,
+        help="Row extraction strategy: embedded page state, one table script call, per-element walk, or a timed comparison",
+    )
+    scrape.add_argument(
+        "--block-resources",
+        action="store_true",
+        default=None,
+        help="Block images, fonts, stylesheets and third-party hosts while scraping",
+    )
+    scrape.add_argument(
+        "--snapshot-dir",
+        help="Save each rendered calendar page as a compressed snapshot in this directory",
+    )
+    scrape.add_argument(
+        "--workers",
+        type=int,
+        help="Scrape this many months in parallel, each in its own browser process",
+    )
+    scrape.add_argument(
+        "--storage",
+        choices=STORAGE_BACKENDS,
+        help="Write CSV/JSON files or upsert into a SQLite database",
+    )
+
+    replay = subparsers.add_parser(
+        "replay", help="Rebuild and normalize rows from saved page snapshots offline"
+    )
+    replay.add_argument("snapshots", nargs="+", help="Snapshot files or directories of snapshots")
+    replay.add_argument("--config", help="Path to YAML config file")
+    replay.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        help="Output format to write with --write",
+    )
+    replay.add_argument("--output-dir", help="Directory for generated artifacts")
+    replay.add_argument("--timezone", help="Target timezone for converted event times")
+    replay.add_argument("--currencies", nargs="+", help="Allowed currencies")
+    replay.add_argument("--impacts", nargs="+", help="Allowed impact levels")
+    replay.add_argument(
+        "--write", action="store_true", help="Write normalized rows through the output store"
+    )
+    replay.add_argument(
+        "--repeat", type=int, default=1, help="Replay each snapshot this many times for benchmarking"
+    )
+    replay.set_defaults(months=None, show_browser=False)
+
+    renormalize = subparsers.add_parser(
+        "renormalize",
+        help="Rewrite stored monthly datasets (or snapshots) with the current timezone and filters",
+    )
+    renormalize.add_argument(
+        "snapshots",
+        nargs="*",
+        help="Snapshot files or directories to rebuild from instead of the monthly datasets",
+    )
+    renormalize.add_argument("--config", help="Path to YAML config file")
+    renormalize.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        help="Output format to write",
+    )
+    renormalize.add_argument("--output-dir", help="Directory for generated artifacts")
+    renormalize.add_argument("--timezone", help="Target timezone for converted event times")
+    renormalize.add_argument("--currencies", nargs="+", help="Allowed currencies")
+    renormalize.add_argument("--impacts", nargs="+", help="Allowed impact levels")
+    renormalize.set_defaults(months=None, show_browser=False)
+
+    backfill = subparsers.add_parser(
+        "backfill", help="Scrape a range of past months, resuming from the last checkpoint"
+    )
+    backfill.add_argument("--from", dest="start", required=True, help="First month as YYYY-MM")
+    backfill.add_argument("--to", dest="end", required=True, help="Last month as YYYY-MM")
+    backfill.add_argument("--config", help="Path to YAML config file")
+    backfill.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        help="Output format to write",
+    )
+    backfill.add_argument("--output-dir", help="Directory for generated artifacts")
+    backfill.add_argument("--timezone", help="Target timezone for converted event times")
+    backfill.add_argument("--currencies", nargs="+", help="Allowed currencies")
+    backfill.add_argument("--impacts", nargs="+", help="Allowed impact levels")
+    backfill.add_argument(
+        "--engine",
+        choices=ENGINES,
+        help="Fetch pages with a Selenium browser or a plain HTTP client",
+    )
+    backfill.add_argument(
+        "--workers", type=int, help="Scrape this many months in parallel, each in its own browser process"
+    )
+    backfill.add_argument(
+        "--force", action="store_true", help="Rescrape every month, ignoring the checkpoint and existing data"
+    )
+    backfill.add_argument(
+        "--show-browser",
+        action="store_true",
+        help="Run with a visible browser instead of headless mode",
+    )
+    backfill.add_argument(
+        "--storage",
+        choices=STORAGE_BACKENDS,
+        help="Write CSV/JSON files or upsert into a SQLite database",
+    )
+    backfill.set_defaults(months=None)
+
+    sqlite_import = subparsers.add_parser(
+        "sqlite-import", help="Load existing monthly and history files into the SQLite store"
+    )
+    sqlite_import.add_argument("--config", help="Path to YAML config file")
+    sqlite_import.add_argument("--output-dir", help="Directory containing generated artifacts")
+    sqlite_import.add_argument("--database", help="SQLite database to fill, defaults to the configured path")
+    sqlite_import.set_defaults(
+        months=None,
+        output_format=None,
+        timezone=None,
+        currencies=None,
+        impacts=None,
+        show_browser=False,
+        storage="sqlite",
+    )
+
+    actuals_watch = subparsers.add_parser(
+        "actuals-watch", help="Poll day views around scheduled releases and store actuals as they appear"
+    )
+    actuals_watch.add_argument("--config", help="Path to YAML config file")
+    actuals_watch.add_argument("--output-dir", help="Directory containing generated artifacts")
+    actuals_watch.add_argument(
+        "--engine",
+        choices=ENGINES,
+        help="Fetch day views with a Selenium browser or a plain HTTP client",
+    )
+    actuals_watch.add_argument(
+        "--watch-impacts", nargs="+", help="Impact levels to watch, for example red"
+    )
+    actuals_watch.add_argument(
+        "--lookahead-minutes", type=int, help="Watch releases scheduled up to this many minutes ahead"
+    )
+    actuals_watch.add_argument(
+        "--give-up-minutes", type=int, help="Stop polling an event this many minutes after its release"
+    )
+    actuals_watch.add_argument("--poll-seconds", type=float, help="Seconds between polls of a due release")
+    actuals_watch.set_defaults(
+        months=None,
+        output_format=None,
+        timezone=None,
+        currencies=None,
+        impacts=None,
+        show_browser=False,
+    )
+
+    browser_daemon = subparsers.add_parser(
+        "browser-daemon", help="Keep a warm headless browser running for scrapes to attach to"
+    )
+    browser_daemon.add_argument("--config", help="Path to YAML config file")
+    browser_daemon.set_defaults(
+        months=None,
+        output_format=None,
+        output_dir=None,
+        timezone=None,
+        currencies=None,
+        impacts=None,
+        show_browser=False,
+    )
 
     view = subparsers.add_parser("view", help="Launch the local Streamlit viewer")
     view.add_argument("--config", help="Path to YAML config file")
@@ -84,7 +281,7 @@ def build_parser() -> argparse.ArgumentParser:
 
 def _prepare_args(argv: list[str] | None) -> list[str]:
     args = list(argv) if argv is not None else sys.argv[1:]
-    if not args or args[0] not in {"scrape", "view", "alerts-check", "schedule-info", "alerts-schedule-info", "test-notify"}:
+    if not args or args[0] not in {"scrape", "replay", "renormalize", "backfill", "sqlite-import", "actuals-watch", "browser-daemon", "view", "alerts-check", "schedule-info", "alerts-schedule-info", "test-notify"}:
         return ["scrape", *args]
     return args
 
@@ -130,6 +327,32 @@ def main(argv: list[str] | None = None) -> int:
                 all_ok = False
         return 0 if all_ok else 1
 
+    if args.command == "replay":
+        from .replay import ReplayService
+
+        return ReplayService(console).run(build_replay_options(args))
+
+    if args.command == "renormalize":
+        from .renormalize import RenormalizeService
+
+        return RenormalizeService(console).run(build_renormalize_options(args))
+
+    if args.command == "backfill":
+        from .backfill import BackfillService
+
+        return BackfillService(console).run(build_backfill_options(args))
+
+    if args.command == "sqlite-import":
+        return run_sqlite_import(console, args)
+
+    if args.command == "actuals-watch":
+        from .actuals import ActualsWatcher
+
+        return ActualsWatcher(console).run(build_actuals_options(args))
+
+    if args.command == "browser-daemon":
+        return run_browser_daemon(console, args)
+
     if args.command == "alerts-check":
         options = build_alert_options(args)
         from .alerts.service import AlertService
@@ -142,6 +365,37 @@ def main(argv: list[str] | None = None) -> int:
     return ScrapeService(console).run(options)
 
 
+def run_browser_daemon(console: AppConsole, args) -> int:
+    options = build_run_options(args)
+    from .browser_daemon import BrowserDaemon
+
+    chrome_arguments = []
+    if options.block_resources and options.allowed_domains:
+        from .scraper import host_resolver_rules
+
+        chrome_arguments.append(f"--host-resolver-rules={host_resolver_rules(options.allowed_domains)}")
+    return BrowserDaemon(
+        console,
+        options.state_dir,
+        port=options.browser_daemon_port,
+        max_pages=options.browser_daemon_max_pages,
+        max_memory_mb=options.browser_daemon_max_memory_mb,
+        chrome_arguments=chrome_arguments,
+    ).run()
+
+
+def run_sqlite_import(console: AppConsole, args) -> int:
+    options = build_run_options(args)
+    from .sqlite_store import SqliteOutputStore, import_file_store
+
+    database_path = Path(args.database) if args.database else options.sqlite_path
+    console.step(f"Importing {options.output_dir} into {database_path}")
+    with SqliteOutputStore(database_path) as store:
+        revisions, events = import_file_store(store, options.output_dir)
+    console.success(f"Imported {revisions} history snapshot(s) and upserted {events} monthly event row(s)")
+    return 0
+
+
 def run_viewer(console: AppConsole, args) -> int:
     options = build_view_options(args)
     env = os.environ.copy()
@@ -0,0 +1,212 @@
+"""Parquet and Arrow IPC datasets of normalized records.
+
+Both formats share one Arrow schema: the small vocabularies (timezone,
+currency, impact, day) are dictionary-encoded and ``event_timestamp_utc`` is a
+typed UTC timestamp instead of a number-or-empty-string. Readers ask for a
+subset of columns and filter on currency, impact and event time in Arrow,
+before anything becomes Python objects; for Parquet the filters also skip
+row groups by their statistics. pyarrow is only needed when one of these
+formats is configured.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .config import NORMALIZED_FIELDS
+
+DICTIONARY_FIELDS = ("timezone", "currency", "impact", "day")
+TIMESTAMP_FIELD = "event_timestamp_utc"
+TIMESTAMP_TYPE = pa.timestamp("s", tz="UTC")
+ROW_GROUP_SIZE = 4096
+
+
+def _field_type(field: str) -> pa.DataType:
+    if field == TIMESTAMP_FIELD:
+        return TIMESTAMP_TYPE
+    if field in DICTIONARY_FIELDS:
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.string()
+
+
+RECORD_SCHEMA = pa.schema([(field, _field_type(field)) for field in NORMALIZED_FIELDS])
+
+
+def _batch(columns: dict[str, list]) -> pa.RecordBatch:
+    arrays = []
+    for field in NORMALIZED_FIELDS:
+        values = columns[field]
+        if field == TIMESTAMP_FIELD:
+            epochs = [int(value) if value not in (None, "") else None for value in values]
+            arrays.append(pa.array(epochs, pa.int64()).cast(TIMESTAMP_TYPE))
+        elif field in DICTIONARY_FIELDS:
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, pa.string()))
+    return pa.record_batch(arrays, schema=RECORD_SCHEMA)
+
+
+class ColumnarRecordWriter(ABC):
+    """Buffer records into columns and write them to a binary handle one batch at a time."""
+
+    def __init__(self, handle) -> None:
+        self.writer = self._open(handle)
+        self.columns = {field: [] for field in NORMALIZED_FIELDS}
+        self.buffered = 0
+
+    @abstractmethod
+    def _open(self, handle):
+        """The pyarrow writer for this format, opened on handle with RECORD_SCHEMA."""
+
+    def write(self, record: dict) -> None:
+        for field in NORMALIZED_FIELDS:
+            self.columns[field].append(record.get(field, ""))
+        self.buffered += 1
+        if self.buffered >= ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        self.writer.write_batch(_batch(self.columns))
+        self.columns = {field: [] for field in NORMALIZED_FIELDS}
+        self.buffered = 0
+
+    def close(self) -> None:
+        if self.buffered:
+            self._flush()
+        self.writer.close()
+
+
+class ParquetRecordWriter(ColumnarRecordWriter):
+    def _open(self, handle):
+        return pq.ParquetWriter(handle, RECORD_SCHEMA)
+
+
+class ArrowRecordWriter(ColumnarRecordWriter):
+    def _open(self, handle):
+        return pa.ipc.new_file(handle, RECORD_SCHEMA)
+
+
+COLUMNAR_WRITERS = {"parquet": ParquetRecordWriter, "arrow": ArrowRecordWriter}
+
+
+def _condition(currencies, impacts, start, end):
+    conditions = []
+    if currencies:
+        conditions.append(pc.field("currency").isin(currencies))
+    if impacts:
+        conditions.append(pc.field("impact").isin(impacts))
+    if start is not None:
+        conditions.append(pc.field(TIMESTAMP_FIELD) >= pa.scalar(start, pa.int64()).cast(TIMESTAMP_TYPE))
+    if end is not None:
+        conditions.append(pc.field(TIMESTAMP_FIELD) < pa.scalar(end, pa.int64()).cast(TIMESTAMP_TYPE))
+    condition = None
+    for item in conditions:
+        condition = item if condition is None else condition & item
+    return condition
+
+
+def _row_group_may_match(row_group, positions: dict, currencies, impacts, start, end) -> bool:
+    """False only when the row group's min/max statistics rule out every filter value."""
+
+    def bounds(field):
+        statistics = row_group.column(positions[field]).statistics
+        if statistics is None or not statistics.has_min_max:
+            return None
+        return statistics.min, statistics.max
+
+    for field, values in (("currency", currencies), ("impact", impacts)):
+        limits = bounds(field) if values else None
+        if limits and not any(limits[0] <= value <= limits[1] for value in values):
+            return False
+    limits = bounds(TIMESTAMP_FIELD) if start is not None or end is not None else None
+    if limits:
+        low, high = (int(value.timestamp()) for value in limits)
+        if (start is not None and high < start) or (end is not None and low >= end):
+            return False
+    return True
+
+
+def _read_parquet(path: Path, columns: list[str] | None, currencies, impacts, start, end) -> pa.Table:
+    parquet = pq.ParquetFile(path)
+    metadata = parquet.metadata
+    positions = {metadata.schema.column(index).path: index for index in range(metadata.num_columns)}
+    row_groups = [
+        index
+        for index in range(metadata.num_row_groups)
+        if _row_group_may_match(metadata.row_group(index), positions, currencies, impacts, start, end)
+    ]
+    return parquet.read_row_groups(row_groups, columns=columns, use_threads=False)
+
+
+def _read_arrow(path: Path, columns: list[str] | None) -> pa.Table:
+    # Batches read from a memory map are zero-copy views, so only the pages behind the
+    # selected columns are ever loaded from disk; the other columns are never touched.
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def read_columnar_table(
+    path: Path,
+    columns: list[str] | None = None,
+    currencies: list[str] | None = None,
+    impacts: list[str] | None = None,
+    start: int | None = None,
+    end: int | None = None,
+) -> pa.Table:
+    """Load only the requested columns of the rows matching the filters.
+
+    ``start`` and ``end`` are epoch seconds (end exclusive); a time filter
+    leaves out events without an exact time. Parquet row groups whose
+    statistics rule out the filters are skipped without being decoded, and
+    only the requested and filtered columns are read.
+    """
+    condition = _condition(currencies, impacts, start, end)
+    filtered = [
+        field
+        for field, active in (
+            ("currency", currencies),
+            ("impact", impacts),
+            (TIMESTAMP_FIELD, start is not None or end is not None),
+        )
+        if active
+    ]
+    needed = None if columns is None else list(dict.fromkeys([*columns, *filtered]))
+
+    if path.suffix == ".parquet":
+        table = _read_parquet(path, needed, currencies, impacts, start, end)
+    else:
+        table = _read_arrow(path, needed)
+    if TIMESTAMP_FIELD in table.column_names:
+        # Parquet stores second timestamps as milliseconds; hand back the schema's unit.
+        position = table.column_names.index(TIMESTAMP_FIELD)
+        table = table.set_column(position, TIMESTAMP_FIELD, table.column(position).cast(TIMESTAMP_TYPE))
+    if condition is not None:
+        table = table.filter(condition)
+    return table.select(columns) if columns is not None else table
+
+
+def read_columnar_tables(paths: list[Path], **filters) -> pa.Table:
+    """Several datasets as one table, so callers convert to pandas or Python once."""
+    tables = [read_columnar_table(path, **filters) for path in paths]
+    if not tables:
+        return RECORD_SCHEMA.empty_table()
+    return pa.concat_tables(tables)
+
+
+def read_columnar(path: Path, **filters) -> list[dict]:
+    """Rows as plain dicts shaped like the JSON output (epoch seconds or ``""`` for the timestamp)."""
+    table = read_columnar_table(path, **filters)
+    columns = {}
+    for name in table.column_names:
+        column = table.column(name)
+        if name == TIMESTAMP_FIELD:
+            epochs = column.cast(pa.int64()).to_pylist()
+            columns[name] = ["" if value is None else value for value in epochs]
+        else:
+            columns[name] = column.to_pylist()
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
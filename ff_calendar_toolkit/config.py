@@ -29,6 +29,13 @@ ICON_COLOR_MAP = {
     "icon icon--ff-impact-gra": "gray",
 }
 
+BLOCKABLE_RESOURCE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "stylesheet": ["*.css"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.m3u8"],
+}
+
 NORMALIZED_FIELDS = [
     "time",
     "timezone",
@@ -42,18 +49,46 @@ NORMALIZED_FIELDS = [
     "day",
     "date",
     "scraped_at",
+    "event_time_utc",
+    "event_timestamp_utc",
 ]
 
 DEFAULT_ALLOWED_CURRENCY_CODES = ["CAD", "EUR", "GBP", "USD"]
 DEFAULT_ALLOWED_IMPACT_COLORS = ["red", "orange", "gray"]
 DEFAULT_TARGET_TIMEZONE = "Asia/Karachi"
 DEFAULT_OUTPUT_DIR = Path("news")
+OUTPUT_FORMATS = ["csv", "json", "both", "parquet", "arrow"]
 DEFAULT_OUTPUT_FORMAT = "both"
 DEFAULT_MONTHS = ["this"]
 DEFAULT_HEADLESS = True
+ENGINES = ["selenium", "http"]
+DEFAULT_ENGINE = "selenium"
+DEFAULT_SOURCE_TIMEZONE = "America/New_York"
+EXTRACTION_MODES = ["state", "script", "elements", "compare"]
+DEFAULT_EXTRACTION_MODE = "state"
+DEFAULT_SCROLL_WAIT_SECONDS = 2.0
+DEFAULT_REUSE_BROWSER = True
+DEFAULT_WORKERS = 1
+DEFAULT_BLOCK_RESOURCES = False
+DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "font", "stylesheet", "media"]
+DEFAULT_ALLOWED_DOMAINS = ["forexfactory.com", "*.forexfactory.com"]
+DEFAULT_WORKER_MEMORY_MB = 512
+DEFAULT_PIPELINE_QUEUE_SIZE = 2
+STORAGE_BACKENDS = ["file", "sqlite"]
+DEFAULT_STORAGE = "file"
+DEFAULT_SQLITE_FILENAME = "calendar.sqlite"
 DEFAULT_SCHEDULE_PRESET = "weekly"
 DEFAULT_VIEWER_HOST = "127.0.0.1"
 DEFAULT_VIEWER_PORT = 8501
+DEFAULT_STATE_DIR = Path("state")
+DEFAULT_BROWSER_DAEMON = False
+DEFAULT_BROWSER_DAEMON_PORT = 9222
+DEFAULT_BROWSER_DAEMON_MAX_PAGES = 200
+DEFAULT_BROWSER_DAEMON_MAX_MEMORY_MB = 1024
+DEFAULT_ACTUALS_IMPACTS = ["red"]
+DEFAULT_ACTUALS_LOOKAHEAD_MINUTES = 5
+DEFAULT_ACTUALS_GIVE_UP_MINUTES = 15
+DEFAULT_ACTUALS_POLL_SECONDS = 10.0
 DEFAULT_ALERT_RULES_DIR = Path("rules")
 DEFAULT_ALERT_STATE_DIR = Path("state/alerts")
 DEFAULT_ALERT_CHECK_INTERVAL_MINUTES = 5
@@ -72,6 +107,29 @@ ENV_KEYS = {
     "output_dir": "FF_OUTPUT_DIR",
     "output_format": "FF_OUTPUT_FORMAT",
     "headless": "FF_HEADLESS",
+    "engine": "FF_ENGINE",
+    "source_timezone": "FF_SOURCE_TIMEZONE",
+    "extraction_mode": "FF_EXTRACTION_MODE",
+    "scroll_wait_seconds": "FF_SCROLL_WAIT_SECONDS",
+    "reuse_browser": "FF_REUSE_BROWSER",
+    "workers": "FF_WORKERS",
+    "worker_memory_mb": "FF_WORKER_MEMORY_MB",
+    "pipeline_queue_size": "FF_PIPELINE_QUEUE_SIZE",
+    "storage": "FF_STORAGE",
+    "sqlite_path": "FF_SQLITE_PATH",
+    "snapshot_dir": "FF_SNAPSHOT_DIR",
+    "block_resources": "FF_BLOCK_RESOURCES",
+    "blocked_resource_types": "FF_BLOCKED_RESOURCE_TYPES",
+    "allowed_domains": "FF_ALLOWED_DOMAINS",
+    "state_dir": "FF_STATE_DIR",
+    "browser_daemon": "FF_BROWSER_DAEMON",
+    "browser_daemon_port": "FF_BROWSER_DAEMON_PORT",
+    "browser_daemon_max_pages": "FF_BROWSER_DAEMON_MAX_PAGES",
+    "browser_daemon_max_memory_mb": "FF_BROWSER_DAEMON_MAX_MEMORY_MB",
+    "actuals_impacts": "FF_ACTUALS_IMPACTS",
+    "actuals_lookahead_minutes": "FF_ACTUALS_LOOKAHEAD_MINUTES",
+    "actuals_give_up_minutes": "FF_ACTUALS_GIVE_UP_MINUTES",
+    "actuals_poll_seconds": "FF_ACTUALS_POLL_SECONDS",
     "viewer_host": "FF_VIEWER_HOST",
     "viewer_port": "FF_VIEWER_PORT",
     "schedule_preset": "FF_SCHEDULE_PRESET",
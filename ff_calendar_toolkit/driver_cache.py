@@ -0,0 +1,62 @@
+"""On-disk cache of the resolved chromedriver path, keyed by Chrome version."""
+
+import json
+import re
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def chrome_version(chrome_binary: str | None) -> str | None:
+    if not chrome_binary:
+        return None
+    try:
+        completed = subprocess.run(
+            [chrome_binary, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"\d+(?:\.\d+)+", completed.stdout)
+    return match.group(0) if match else None
+
+
+class DriverCache:
+    def __init__(self, state_dir: Path) -> None:
+        self.cache_path = state_dir / "webdriver" / "driver_cache.json"
+
+    def lookup(self, version: str | None) -> str | None:
+        """Return the cached driver path if it was resolved for this Chrome version."""
+        if not version or not self.cache_path.exists():
+            return None
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        driver_path = payload.get("driver_path")
+        if payload.get("chrome_version") != version or not driver_path or not Path(driver_path).exists():
+            return None
+        return driver_path
+
+    def save(self, version: str | None, driver_path: str | None, resolution: str) -> None:
+        if not version or not driver_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(
+            json.dumps(
+                {
+                    "chrome_version": version,
+                    "driver_path": str(driver_path),
+                    "resolution": resolution,
+                    "updated_at": datetime.now(timezone.utc).isoformat(),
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    def invalidate(self) -> None:
+        self.cache_path.unlink(missing_ok=True)
@@ -0,0 +1,257 @@
+"""Browser-independent helpers for turning calendar table cells into raw rows."""
+
+import json
+import re
+from html.parser import HTMLParser
+
+from .config import ALLOWED_ELEMENT_TYPES, ICON_COLOR_MAP
+
+CALENDAR_TABLE_SCRIPT = """
+const allowed = new Set(arguments[0]);
+const table = document.querySelector(".calendar__table");
+if (!table) {
+  return null;
+}
+const rows = [];
+for (const row of table.querySelectorAll("tr")) {
+  const cells = [];
+  for (const cell of row.querySelectorAll("td")) {
+    const className = cell.getAttribute("class");
+    if (!allowed.has(className)) {
+      continue;
+    }
+    cells.push({
+      class: className,
+      text: (cell.innerText || "").trim(),
+      spans: Array.from(cell.querySelectorAll("span"), (span) => span.getAttribute("class")),
+    });
+  }
+  rows.push({id: row.getAttribute("data-event-id"), cells: cells});
+}
+return JSON.stringify(rows);
+"""
+
+EMBEDDED_STATE_SCRIPT = """
+const states = window.calendarComponentStates;
+if (!states) {
+  return null;
+}
+const days = [];
+for (const state of Object.values(states)) {
+  if (state && Array.isArray(state.days)) {
+    days.push(...state.days);
+  }
+}
+return days.length ? JSON.stringify(days) : null;
+"""
+
+EMBEDDED_STATE_PATTERN = re.compile(r"calendarComponentStates\[\d+\]\s*=\s*\{")
+EMBEDDED_DAYS_PATTERN = re.compile(r"[{,]\s*[\"']?days[\"']?\s*:\s*\[")
+
+
+def detail_url(month_name: str, event_id: str) -> str:
+    return f"https://www.forexfactory.com/calendar?month={month_name}#detail={event_id}"
+
+
+def raw_row_from_cells(cells: list[dict], event_id: str | None, month_name: str) -> dict:
+    row_data = {}
+    for cell in cells:
+        class_name = cell.get("class")
+        if class_name not in ALLOWED_ELEMENT_TYPES:
+            continue
+
+        class_name_key = ALLOWED_ELEMENT_TYPES.get(class_name, "cell")
+        if "calendar__impact" in class_name:
+            color = None
+            for impact_class in cell.get("spans") or []:
+                color = ICON_COLOR_MAP.get(impact_class)
+            row_data[class_name_key] = color if color else "impact"
+        elif "calendar__detail" in class_name and event_id:
+            row_data[class_name_key] = detail_url(month_name, event_id)
+        elif cell.get("text"):
+            row_data[class_name_key] = cell["text"]
+        else:
+            row_data[class_name_key] = "empty"
+    return row_data
+
+
+def raw_rows_from_table_json(payload: str, month_name: str) -> list[dict]:
+    data = []
+    for row in json.loads(payload):
+        row_data = raw_row_from_cells(row.get("cells", []), row.get("id"), month_name)
+        if row_data:
+            data.append(row_data)
+    return data
+
+
+def _matching_bracket(text: str, start: int) -> int:
+    """Index just past the bracket that closes text[start], skipping JSON string contents."""
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if not depth:
+                return index + 1
+    raise ValueError("Unterminated embedded calendar state")
+
+
+def embedded_days_from_html(html: str) -> list[dict] | None:
+    """Return the ``days`` arrays of every calendarComponentStates assignment in the page, or None."""
+    days = []
+    found = False
+    for state_match in EMBEDDED_STATE_PATTERN.finditer(html):
+        state_start = state_match.end() - 1
+        state_end = _matching_bracket(html, state_start)
+        days_match = EMBEDDED_DAYS_PATTERN.search(html, state_start, state_end)
+        if not days_match:
+            continue
+        array_start = days_match.end() - 1
+        array_end = _matching_bracket(html, array_start)
+        days.extend(json.loads(html[array_start:array_end]))
+        found = True
+    return days if found else None
+
+
+def _day_label(day: dict) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", day.get("date") or "")).strip()
+
+
+def raw_rows_from_embedded_days(days: list[dict], month_name: str) -> list[dict]:
+    """Map embedded calendar state onto the row format produced from calendar__table cells."""
+    data = []
+    for day in days:
+        events = day.get("events") or []
+        for index, event in enumerate(events):
+            impact_class = event.get("impactClass") or ""
+            event_id = event.get("id")
+            row_data = {
+                "date": _day_label(day) if index == 0 else "empty",
+                "time": event.get("timeLabel") or "empty",
+                "currency": event.get("currency") or "empty",
+                "impact": ICON_COLOR_MAP.get(f"icon {impact_class}", "impact"),
+                "event": event.get("name") or "empty",
+                "detail": detail_url(month_name, str(event_id)) if event_id else "empty",
+            }
+            for field in ("actual", "forecast", "previous"):
+                row_data[field] = event.get(field) or "empty"
+            data.append(row_data)
+    return data
+
+
+def raw_rows_from_embedded_json(payload: str, month_name: str) -> list[dict]:
+    return raw_rows_from_embedded_days(json.loads(payload), month_name)
+
+
+class CalendarTableParser(HTMLParser):
+    """Collect the cells of the first calendar__table in server-rendered HTML.
+
+    Produces the same row/cell structure as CALENDAR_TABLE_SCRIPT so both
+    sources share raw_row_from_cells.
+    """
+
+    TEXT_BREAK_TAGS = {"br", "div", "li", "p", "span"}
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self.found = False
+        self._table_depth = 0
+        self._row = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        if tag == "table":
+            if self._table_depth:
+                self._table_depth += 1
+            elif not self.found and "calendar__table" in (attributes.get("class") or "").split():
+                self.found = True
+                self._table_depth = 1
+            return
+        if self._table_depth != 1 and not self._cell:
+            return
+        if tag == "tr" and self._table_depth == 1:
+            self._close_row()
+            self._row = {"id": attributes.get("data-event-id"), "cells": []}
+        elif tag == "td" and self._table_depth == 1 and self._row is not None:
+            self._close_cell()
+            self._cell = {"class": attributes.get("class"), "text": [], "spans": []}
+        elif self._cell is not None:
+            if tag == "span":
+                self._cell["spans"].append(attributes.get("class"))
+            if tag in self.TEXT_BREAK_TAGS:
+                self._cell["text"].append(" ")
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if not self._table_depth:
+            return
+        if tag == "table":
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._close_row()
+        elif self._table_depth == 1 and tag == "td":
+            self._close_cell()
+        elif self._table_depth == 1 and tag == "tr":
+            self._close_row()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell["text"].append(data)
+
+    def _close_cell(self) -> None:
+        if self._cell is None:
+            return
+        self._cell["text"] = re.sub(r"\s+", " ", "".join(self._cell["text"])).strip()
+        self._row["cells"].append(self._cell)
+        self._cell = None
+
+    def _close_row(self) -> None:
+        self._close_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+        self._row = None
+
+
+def raw_rows_from_html(html: str, month_name: str) -> list[dict]:
+    parser = CalendarTableParser()
+    parser.feed(html)
+    parser.close()
+    if not parser.found:
+        raise ValueError("calendar__table not found in page HTML")
+    data = []
+    for row in parser.rows:
+        row_data = raw_row_from_cells(row["cells"], row["id"], month_name)
+        if row_data:
+            data.append(row_data)
+    return data
+
+
+def raw_rows_from_page(html: str, month_name: str) -> tuple[list[dict], str]:
+    """Prefer the embedded calendar state and fall back to parsing calendar__table.
+
+    Returns the rows together with the source they came from ("state" or "table").
+    """
+    try:
+        days = embedded_days_from_html(html)
+    except ValueError:
+        days = None
+    if days:
+        return raw_rows_from_embedded_days(days, month_name), "state"
+    return raw_rows_from_html(html, month_name), "table"
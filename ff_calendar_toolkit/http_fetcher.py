@@ -0,0 +1,101 @@
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import urllib3
+
+from .config import DEFAULT_SOURCE_TIMEZONE
+from .extract import raw_rows_from_page
+from .metrics import RunMetrics
+from .models import ScrapeContext
+from .periods import CALENDAR_BASE_URL, month_context, month_slug, month_url, resolve_month
+from .snapshots import save_snapshot
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+class FetchError(RuntimeError):
+    pass
+
+
+class HttpCalendarFetcher:
+    """Browserless engine: fetch the calendar HTML over pooled HTTP and parse it."""
+
+    def __init__(
+        self,
+        console,
+        source_timezone: str | None = DEFAULT_SOURCE_TIMEZONE,
+        base_url: str = CALENDAR_BASE_URL,
+        timeout_seconds: float = 30.0,
+        snapshot_dir: Path | None = None,
+        metrics: RunMetrics | None = None,
+    ) -> None:
+        self.console = console
+        self.source_timezone = source_timezone
+        self.base_url = base_url
+        self.timeout_seconds = timeout_seconds
+        self.snapshot_dir = snapshot_dir
+        self.metrics = metrics or RunMetrics()
+        self._pool = None
+
+    @contextmanager
+    def session(self):
+        """Keep one connection pool for every scrape_month call inside the block."""
+        self._pool = self._new_pool()
+        try:
+            yield self
+        finally:
+            pool, self._pool = self._pool, None
+            pool.clear()
+
+    def _new_pool(self) -> urllib3.PoolManager:
+        return urllib3.PoolManager(
+            num_pools=2,
+            maxsize=4,
+            headers=urllib3.make_headers(accept_encoding=True, user_agent=USER_AGENT),
+            retries=urllib3.Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+            timeout=urllib3.Timeout(total=self.timeout_seconds),
+        )
+
+    def fetch_html(self, url: str) -> str:
+        pool = self._pool or self._new_pool()
+        try:
+            response = pool.request("GET", url)
+        except urllib3.exceptions.HTTPError as exc:
+            raise FetchError(f"Request to {url} failed: {exc}") from exc
+        finally:
+            if self._pool is None:
+                pool.clear()
+        if response.status != 200:
+            raise FetchError(f"Request to {url} returned HTTP {response.status}")
+        return response.data.decode("utf-8", errors="replace")
+
+    def scrape_month(
+        self, month_param: str, target_timezone: str | None
+    ) -> tuple[list[dict], ScrapeContext]:
+        url = month_url(month_param, self.base_url)
+        month_name, _, _ = resolve_month(month_param)
+        label = month_slug(month_param)
+        self.console.step(f"Fetching {url} over HTTP")
+        started = time.perf_counter()
+        html = self.fetch_html(url)
+        elapsed = time.perf_counter() - started
+        self.metrics.record("http_fetch", elapsed, label)
+        self.console.step(
+            f"Fetched {len(html)} characters in {elapsed:.2f}s, "
+            f"using configured source timezone {self.source_timezone}"
+        )
+        started = time.perf_counter()
+        rows, source = raw_rows_from_page(html, month_name)
+        elapsed = time.perf_counter() - started
+        self.metrics.record("parse_state" if source == "state" else "parse_table", elapsed, label)
+        self.console.step(f"Parsed {len(rows)} raw calendar rows from page {source} in {elapsed:.2f}s")
+        context = month_context(month_param, self.source_timezone, target_timezone)
+        if self.snapshot_dir:
+            path = save_snapshot(self.snapshot_dir, html, context)
+            self.console.step(f"Saved page snapshot to {path}")
+        return rows, context
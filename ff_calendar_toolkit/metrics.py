@@ -0,0 +1,106 @@
+"""Per-phase timings and resource usage for a scrape run, written as JSON and Prometheus text."""
+
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPORT_JSON_NAME = "run_report.json"
+REPORT_PROM_NAME = "run_report.prom"
+
+
+def peak_rss_bytes() -> int:
+    """Peak RSS of this process and its waited-for children (browser drivers, workers)."""
+    scale = 1 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) * scale
+
+
+class RunMetrics:
+    def __init__(self) -> None:
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self.phases = []
+        self.counts = []
+
+    @contextmanager
+    def phase(self, name: str, month: str | None = None):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, month)
+
+    def record(self, name: str, seconds: float, month: str | None = None) -> None:
+        self.phases.append({"phase": name, "month": month or "", "seconds": round(seconds, 6)})
+
+    def count(self, name: str, value: int, month: str | None = None) -> None:
+        self.counts.append({"name": name, "month": month or "", "value": value})
+
+    def merge(self, other: "RunMetrics") -> None:
+        self.phases.extend(other.phases)
+        self.counts.extend(other.counts)
+
+    def report(self) -> dict:
+        return {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "duration_seconds": round(time.perf_counter() - self._started, 6),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "phases": self.phases,
+            "counts": self.counts,
+        }
+
+    def write(self, output_dir: Path) -> tuple[Path, Path]:
+        report = self.report()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        json_path = output_dir / REPORT_JSON_NAME
+        prom_path = output_dir / REPORT_PROM_NAME
+        # Written beside and renamed into place, so the textfile collector never reads half a report.
+        for path, text in [(json_path, json.dumps(report, indent=2)), (prom_path, prometheus_text(report))]:
+            temp_path = path.with_name(f"{path.name}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+            temp_path.replace(path)
+        return json_path, prom_path
+
+
+def prometheus_text(report: dict) -> str:
+    phase_totals = {}
+    for item in report["phases"]:
+        key = (item["phase"], item["month"])
+        phase_totals[key] = phase_totals.get(key, 0.0) + item["seconds"]
+    count_totals = {}
+    for item in report["counts"]:
+        key = (item["name"], item["month"])
+        count_totals[key] = count_totals.get(key, 0) + item["value"]
+
+    finished = datetime.fromisoformat(report["finished_at"]).timestamp()
+    lines = [
+        "# HELP ff_scrape_phase_seconds Time spent in each scrape phase.",
+        "# TYPE ff_scrape_phase_seconds gauge",
+    ]
+    for (phase, month), seconds in sorted(phase_totals.items()):
+        lines.append(f'ff_scrape_phase_seconds{{phase="{phase}",month="{month}"}} {seconds:.6f}')
+    lines += [
+        "# HELP ff_scrape_count Row and record counts per month.",
+        "# TYPE ff_scrape_count gauge",
+    ]
+    for (name, month), value in sorted(count_totals.items()):
+        lines.append(f'ff_scrape_count{{name="{name}",month="{month}"}} {value}')
+    lines += [
+        "# HELP ff_scrape_duration_seconds Wall time of the whole run.",
+        "# TYPE ff_scrape_duration_seconds gauge",
+        f"ff_scrape_duration_seconds {report['duration_seconds']:.6f}",
+        "# HELP ff_scrape_peak_rss_bytes Peak resident memory of the run.",
+        "# TYPE ff_scrape_peak_rss_bytes gauge",
+        f"ff_scrape_peak_rss_bytes {report['peak_rss_bytes']}",
+        "# HELP ff_scrape_last_run_timestamp_seconds Unix time the run finished.",
+        "# TYPE ff_scrape_last_run_timestamp_seconds gauge",
+        f"ff_scrape_last_run_timestamp_seconds {finished:.0f}",
+    ]
+    return "\n".join(lines) + "\n"
@@ -12,6 +12,66 @@ class RunOptions:
     allowed_currencies: list[str]
     allowed_impacts: list[str]
     headless: bool
+    engine: str
+    source_timezone: str | None
+    extraction_mode: str
+    scroll_wait_seconds: float
+    reuse_browser: bool
+    workers: int
+    worker_memory_mb: int
+    pipeline_queue_size: int
+    snapshot_dir: Path | None
+    block_resources: bool
+    blocked_resource_types: list[str]
+    allowed_domains: list[str]
+    state_dir: Path
+    browser_daemon: bool
+    browser_daemon_port: int
+    browser_daemon_max_pages: int
+    browser_daemon_max_memory_mb: int
+    storage: str = "file"
+    sqlite_path: Path | None = None
+
+
+@dataclass(frozen=True)
+class ReplayOptions:
+    snapshot_paths: list[Path]
+    output_format: str
+    output_dir: Path
+    target_timezone: str | None
+    allowed_currencies: list[str]
+    allowed_impacts: list[str]
+    write: bool
+    repeat: int
+
+
+@dataclass(frozen=True)
+class RenormalizeOptions:
+    snapshot_paths: list[Path]
+    output_format: str
+    output_dir: Path
+    target_timezone: str | None
+    allowed_currencies: list[str]
+    allowed_impacts: list[str]
+    storage: str = "file"
+    sqlite_path: Path | None = None
+
+
+@dataclass(frozen=True)
+class BackfillOptions:
+    run: RunOptions
+    start: str
+    end: str
+    force: bool
+
+
+@dataclass(frozen=True)
+class ActualsOptions:
+    run: RunOptions
+    impacts: list[str]
+    lookahead_minutes: int
+    give_up_minutes: int
+    poll_seconds: float
 
 
 @dataclass(frozen=True)
@@ -22,6 +82,7 @@ class ViewOptions:
     state_dir: Path
     host: str
     port: int
+    sqlite_path: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -45,6 +106,7 @@ class AlertOptions:
     retry_backoff_seconds: int
     message_prefix: str
     connectors: list[AlertConnector]
+    sqlite_path: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -56,6 +118,7 @@ class ScrapeContext:
     source_timezone: str | None
     target_timezone: str | None
     scraped_at: str
+    period: str = "month"
 
 
 @dataclass(frozen=True)
@@ -63,3 +126,7 @@ class WriteResult:
     last_run_paths: list[Path]
     monthly_paths: list[Path]
     history_paths: list[Path]
+    records_written: int = 0
+    bytes_written: int = 0
+    write_seconds: float = 0.0
+    history_reused: bool = False
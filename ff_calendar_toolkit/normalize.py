@@ -1,11 +1,17 @@
 import json
 import re
-from datetime import datetime
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
 from pathlib import Path
 
-import pytz
-
 from .config import NORMALIZED_FIELDS
+from .timeconv import batch_converter, convert_time, from_timestamp, get_zone, parse_local_time, utc_fields
+
+DATE_PATTERN = re.compile(
+    r"\b(?P<day>Mon|Tue|Wed|Thu|Fri|Sat|Sun)\b\s+"
+    r"(?P<month>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b\s+"
+    r"(?P<date>\d{1,2})\b"
+)
 
 
 def read_json(path: str | Path):
@@ -14,12 +20,7 @@ def read_json(path: str | Path):
 
 
 def extract_date_parts(text: str, year: str):
-    pattern = (
-        r"\b(?P<day>Mon|Tue|Wed|Thu|Fri|Sat|Sun)\b\s+"
-        r"(?P<month>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b\s+"
-        r"(?P<date>\d{1,2})\b"
-    )
-    match = re.search(pattern, text)
+    match = DATE_PATTERN.search(text)
     if not match:
         return None
 
@@ -36,26 +37,24 @@ def convert_time_zone(
     from_zone_str: str | None,
     to_zone_str: str | None,
 ) -> str:
-    if not time_str or not date_str or not from_zone_str or not to_zone_str:
-        return time_str
+    return convert_time(date_str, time_str, from_zone_str, to_zone_str)
 
-    if time_str.lower() in ["all day", "tentative"]:
-        return time_str
 
-    try:
-        from_zone = pytz.timezone(from_zone_str)
-        to_zone = pytz.timezone(to_zone_str)
-        naive_dt = datetime.strptime(f"{date_str} {time_str}", "%d/%m/%Y %I:%M%p")
-        localized_dt = from_zone.localize(naive_dt)
-        return localized_dt.astimezone(to_zone).strftime("%H:%M")
-    except Exception:
-        return time_str
+def event_identity(record: dict) -> str:
+    parts = [
+        record.get("date", ""),
+        record.get("time", ""),
+        record.get("currency", ""),
+        record.get("event", ""),
+        record.get("impact", ""),
+    ]
+    return "|".join(parts)
 
 
 def filter_row(row: dict, allowed_currencies: list[str], allowed_impacts: list[str]):
-    if row["currency"] not in allowed_currencies:
+    if row.get("currency", "") not in allowed_currencies:
         return False
-    if row["impact"].lower() not in allowed_impacts:
+    if row.get("impact", "").lower() not in allowed_impacts:
         return False
     return True
 
@@ -69,49 +68,117 @@ def normalize_rows(
     allowed_impacts: list[str],
     scraped_at: str | None = None,
 ) -> list[dict]:
+    return list(
+        iter_normalized_rows(
+            data,
+            year,
+            source_timezone,
+            target_timezone,
+            allowed_currencies,
+            allowed_impacts,
+            scraped_at,
+        )
+    )
+
+
+def _clean(value: str) -> str:
+    return "" if value == "empty" else value
+
+
+def iter_normalized_rows(
+    data: Iterable[dict],
+    year: str,
+    source_timezone: str | None,
+    target_timezone: str | None,
+    allowed_currencies: list[str],
+    allowed_impacts: list[str],
+    scraped_at: str | None = None,
+) -> Iterator[dict]:
+    """Yield normalized records one at a time without copying raw rows or building a list."""
     current_date = ""
     current_time = ""
     current_day = ""
-    structured_rows = []
+    current_month = 0
+    convert = batch_converter(source_timezone, target_timezone)
+    record_timezone = _clean(target_timezone or source_timezone or "")
+    record_scraped_at = _clean(scraped_at or "")
 
     for row in data:
-        new_row = row.copy()
-
-        if "date" in new_row and new_row["date"] != "empty":
-            date_parts = extract_date_parts(new_row["date"], year)
+        date_text = row.get("date")
+        if date_text is not None and date_text != "empty":
+            date_parts = extract_date_parts(date_text, year)
             if date_parts:
+                month_number = int(date_parts["date"][3:5])
+                if month_number < current_month:
+                    # Rows are chronological, so a week view running into January is a new year.
+                    year = str(int(year) + 1)
+                    date_parts = extract_date_parts(date_text, year)
+                current_month = month_number
                 current_date = date_parts["date"]
                 current_day = date_parts["day"]
 
-        if "time" in new_row:
-            if new_row["time"] != "empty":
-                current_time = new_row["time"].strip()
-            else:
-                new_row["time"] = current_time
+        time_text = row.get("time")
+        if time_text is not None and time_text != "empty":
+            current_time = time_text.strip()
 
         if len(row) == 1:
             continue
 
+        new_row = {key: _clean(value) for key, value in row.items()}
+        if not filter_row(new_row, allowed_currencies, allowed_impacts):
+            continue
+
+        converted_time, instant = convert(current_date, current_time)
+        new_row["event_time_utc"], new_row["event_timestamp_utc"] = utc_fields(instant)
+        new_row["time"] = _clean(converted_time)
+        new_row["timezone"] = record_timezone
         new_row["day"] = current_day
         new_row["date"] = current_date
-        new_row["time"] = convert_time_zone(
-            current_date, current_time, source_timezone, target_timezone
+        new_row["scraped_at"] = record_scraped_at
+        yield {field: new_row.get(field, "") for field in NORMALIZED_FIELDS}
+
+
+def record_instant(record: dict) -> datetime | None:
+    """UTC instant of a stored record: its event_timestamp_utc, else its date and time in its timezone."""
+    timestamp = record.get("event_timestamp_utc")
+    try:
+        if timestamp not in (None, ""):
+            return from_timestamp(timestamp, None)
+        return parse_local_time(record.get("date", ""), record.get("time", ""), record.get("timezone", ""))
+    except Exception:
+        return None
+
+
+def renormalize_records(
+    records: Iterable[dict],
+    target_timezone: str | None,
+    allowed_currencies: list[str],
+    allowed_impacts: list[str],
+) -> Iterator[dict]:
+    """Re-express already normalized records in another timezone and filter them again.
+
+    Dates stay on the calendar day the page listed, exactly as a fresh scrape
+    with the new timezone would write them. Rows dropped by an earlier filter
+    cannot come back; widening the filters needs a scrape or a snapshot replay.
+    """
+    to_zone = get_zone(target_timezone) if target_timezone else None
+    for record in records:
+        if not filter_row(record, allowed_currencies, allowed_impacts):
+            continue
+
+        instant = record_instant(record)
+        time_value = record.get("time", "")
+        if instant is not None and to_zone is not None:
+            time_value = instant.astimezone(to_zone).strftime("%H:%M")
+        if instant is not None:
+            instant = instant.astimezone(timezone.utc)
+        event_time_utc, event_timestamp_utc = utc_fields(instant)
+
+        renormalized = {field: record.get(field, "") for field in NORMALIZED_FIELDS}
+        renormalized.update(
+            time=time_value,
+            timezone=target_timezone or renormalized["timezone"],
+            event_time_utc=event_time_utc,
+            event_timestamp_utc=event_timestamp_utc,
         )
-        new_row["timezone"] = target_timezone or source_timezone or ""
-        new_row["currency"] = row.get("currency", "")
-        new_row["impact"] = row.get("impact", "")
-        new_row["event"] = row.get("event", "")
-        new_row["detail"] = row.get("detail", "")
-        new_row["actual"] = row.get("actual", "")
-        new_row["forecast"] = row.get("forecast", "")
-        new_row["previous"] = row.get("previous", "")
-        new_row["scraped_at"] = scraped_at or ""
-
-        for key, value in list(new_row.items()):
-            if value == "empty":
-                new_row[key] = ""
-
-        if filter_row(new_row, allowed_currencies, allowed_impacts):
-            structured_rows.append({field: new_row.get(field, "") for field in NORMALIZED_FIELDS})
-
-    return structured_rows
+        yield renormalized
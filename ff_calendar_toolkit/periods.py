@@ -0,0 +1,142 @@
+"""Calendar selector resolution and URLs shared by every fetch engine.
+
+Month selectors are ``this``, ``next``, a month name (current year) or an
+explicit ``YYYY-MM``. Narrower views use
+``week:this`` / ``week:next`` and ``day:today`` / ``day:tomorrow`` /
+``day:YYYY-MM-DD``.
+"""
+
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from .models import ScrapeContext
+
+CALENDAR_BASE_URL = "https://www.forexfactory.com"
+WEEK_SELECTORS = ["this", "next"]
+DAY_SELECTORS = ["today", "tomorrow"]
+PERIOD_DAYS = {"week": 7, "day": 1}
+YEAR_MONTH_PATTERN = re.compile(r"^(\d{4})-(\d{2})$")
+
+
+def split_selector(selector: str) -> tuple[str, str]:
+    """Return (period, value) where period is month, week or day."""
+    period, separator, value = selector.lower().partition(":")
+    if separator and period in {"week", "day"}:
+        return period, value
+    return "month", selector.lower()
+
+
+def resolve_day(value: str, now: datetime | None = None) -> date:
+    today = (now or datetime.now()).date()
+    if value == "today":
+        return today
+    if value == "tomorrow":
+        return today + timedelta(days=1)
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"Unknown day selector '{value}', expected today, tomorrow or YYYY-MM-DD") from None
+
+
+def resolve_week(value: str, now: datetime | None = None) -> date:
+    """First day (Sunday, as on the calendar) of the selected week."""
+    today = (now or datetime.now()).date()
+    start = today - timedelta(days=(today.weekday() + 1) % 7)
+    if value == "this":
+        return start
+    if value == "next":
+        return start + timedelta(days=7)
+    raise ValueError(f"Unknown week selector '{value}', expected one of {', '.join(WEEK_SELECTORS)}")
+
+
+def period_start(selector: str, now: datetime | None = None) -> date | None:
+    """First day covered by a week or day selector, or None for month selectors."""
+    period, value = split_selector(selector)
+    if period == "week":
+        return resolve_week(value, now)
+    if period == "day":
+        return resolve_day(value, now)
+    return None
+
+
+def covered_dates(context: ScrapeContext) -> list[str]:
+    """dd/mm/yyyy dates a week or day scrape lists, read from its slug; empty for months."""
+    days = PERIOD_DAYS.get(context.period)
+    if not days:
+        return []
+    start = datetime.strptime(context.month_slug.partition("-")[2], "%Y-%m-%d").date()
+    return [f"{start + timedelta(days=offset):%d/%m/%Y}" for offset in range(days)]
+
+
+def resolve_month(month_param: str, now: datetime | None = None) -> tuple[str, str, int]:
+    start = period_start(month_param, now)
+    if start is not None:
+        return start.strftime("%B"), str(start.year), start.month
+
+    param = month_param.lower()
+    explicit = YEAR_MONTH_PATTERN.match(param)
+    if explicit:
+        year, month_number = int(explicit.group(1)), int(explicit.group(2))
+        if not 1 <= month_number <= 12:
+            raise ValueError(f"Invalid month in selector '{month_param}'")
+        return datetime(year, month_number, 1).strftime("%B"), str(year), month_number
+
+    now = now or datetime.now()
+    if param == "this":
+        return now.strftime("%B"), str(now.year), now.month
+    if param == "next":
+        next_month = (now.month % 12) + 1
+        year = now.year if now.month < 12 else now.year + 1
+        return datetime(year, next_month, 1).strftime("%B"), str(year), next_month
+    month_number = datetime.strptime(param.capitalize(), "%B").month
+    return param.capitalize(), str(now.year), month_number
+
+
+def month_slug(month_param: str) -> str:
+    period, _ = split_selector(month_param)
+    if period != "month":
+        return f"{period}-{period_start(month_param):%Y-%m-%d}"
+    _, year, month_number = resolve_month(month_param)
+    return f"{year}-{month_number:02d}"
+
+
+def month_url(month_param: str, base_url: str = CALENDAR_BASE_URL) -> str:
+    period, value = split_selector(month_param)
+    if period == "day" and value != "today":
+        day = resolve_day(value)
+        value = f"{day:%b}{day.day}.{day.year}".lower()
+    elif period == "week":
+        resolve_week(value)
+    elif YEAR_MONTH_PATTERN.match(value):
+        month_name, year, _ = resolve_month(value)
+        value = f"{month_name[:3]}.{year}".lower()
+    return f"{base_url.rstrip('/')}/calendar?{period}={value}"
+
+
+def month_range(start: str, end: str) -> list[str]:
+    """Every YYYY-MM selector from start to end inclusive."""
+    _, start_year, start_month = resolve_month(start)
+    _, end_year, end_month = resolve_month(end)
+    first = int(start_year) * 12 + start_month - 1
+    last = int(end_year) * 12 + end_month - 1
+    if last < first:
+        raise ValueError(f"Backfill range ends ({end}) before it starts ({start})")
+    return [f"{index // 12}-{index % 12 + 1:02d}" for index in range(first, last + 1)]
+
+
+def month_context(
+    month_param: str,
+    source_timezone: str | None,
+    target_timezone: str | None,
+) -> ScrapeContext:
+    month_name, year, _ = resolve_month(month_param)
+    return ScrapeContext(
+        month_param=month_param.lower(),
+        month_name=month_name,
+        month_slug=month_slug(month_param),
+        year=year,
+        source_timezone=source_timezone,
+        target_timezone=target_timezone,
+        scraped_at=datetime.now(timezone.utc).isoformat(),
+        period=split_selector(month_param)[0],
+    )
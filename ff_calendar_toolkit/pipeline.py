@@ -0,0 +1,100 @@
+"""Bounded-queue stages that let scraping, normalization and writing overlap across months."""
+
+import queue
+import threading
+import time
+
+from .metrics import RunMetrics
+
+_DONE = object()
+POLL_SECONDS = 0.1
+
+
+class StagePipeline:
+    """Feed items from the calling thread through stages that each run in their own thread.
+
+    Stages are connected by queues of ``queue_size`` items, so a slow stage holds
+    back the ones before it instead of letting raw pages pile up in memory. The
+    first exception raised by any stage stops the pipeline and is re-raised from
+    ``run``.
+    """
+
+    def __init__(self, metrics: RunMetrics, queue_size: int, label=None) -> None:
+        self.metrics = metrics
+        self.queue_size = max(1, queue_size)
+        self.label = label or (lambda item: None)
+        self._failed = threading.Event()
+        self._error = None
+
+    def run(self, source, stages: list[tuple[str, object]]) -> None:
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in stages]
+        threads = []
+        for index, (name, function) in enumerate(stages):
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(name, function, queues[index], outbox, stages[index + 1][0] if outbox else None),
+                name=f"pipeline-{name}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+
+        try:
+            for item in source:
+                if not self._put(queues[0], item, stages[0][0]):
+                    break
+        except BaseException as exc:
+            self._fail(exc)
+        finally:
+            self._put(queues[0], _DONE, None)
+            for thread in threads:
+                thread.join()
+
+        if self._error is not None:
+            raise self._error
+
+    def _run_stage(self, name: str, function, inbox: queue.Queue, outbox, next_name) -> None:
+        try:
+            while True:
+                item = self._get(inbox)
+                if item is _DONE:
+                    break
+                result = function(item)
+                if outbox is not None and not self._put(outbox, result, next_name):
+                    break
+        except BaseException as exc:
+            self._fail(exc)
+        finally:
+            if outbox is not None:
+                self._put(outbox, _DONE, None)
+
+    def _put(self, target: queue.Queue, item, stage_name) -> bool:
+        started = time.perf_counter()
+        while True:
+            if self._failed.is_set() and item is not _DONE:
+                return False
+            try:
+                target.put(item, timeout=POLL_SECONDS)
+                break
+            except queue.Full:
+                if self._failed.is_set():
+                    return False
+        if item is not _DONE:
+            label = self.label(item)
+            self.metrics.record(f"{stage_name}_queue_wait", time.perf_counter() - started, label)
+            self.metrics.count(f"{stage_name}_queue_depth", target.qsize(), label)
+        return True
+
+    def _get(self, source: queue.Queue):
+        while True:
+            try:
+                return source.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                if self._failed.is_set():
+                    return _DONE
+
+    def _fail(self, exc: BaseException) -> None:
+        if self._error is None:
+            self._error = exc
+        self._failed.set()
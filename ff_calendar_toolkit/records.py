@@ -0,0 +1,58 @@
+"""Compact in-memory form of a normalized calendar record.
+
+Files on disk stay plain CSV/JSON rows keyed by ``NORMALIZED_FIELDS``. Code that
+keeps many events loaded at once (alerts, the local API) converts them to
+``CalendarRecord`` when reading and back with ``to_dict`` at the edges. A
+record has one slot per field and no per-instance dict, and the small
+vocabularies (currency, impact, day, timezone) are interned so every record
+shares the same string objects.
+"""
+
+import sys
+from collections.abc import Mapping
+
+from .config import NORMALIZED_FIELDS
+
+INTERNED_FIELDS = ("timezone", "currency", "impact", "day")
+
+
+class CalendarRecord(Mapping):
+    """Read-only mapping over ``NORMALIZED_FIELDS``; missing fields read as ``""``."""
+
+    __slots__ = tuple(NORMALIZED_FIELDS)
+
+    def __init__(self, **fields) -> None:
+        for field in NORMALIZED_FIELDS:
+            value = fields.get(field, "")
+            if field in INTERNED_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            object.__setattr__(self, field, value)
+
+    @classmethod
+    def from_dict(cls, record: Mapping) -> "CalendarRecord":
+        if isinstance(record, cls):
+            return record
+        return cls(**{field: record[field] for field in NORMALIZED_FIELDS if field in record})
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in NORMALIZED_FIELDS}
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(NORMALIZED_FIELDS)
+
+    def __len__(self) -> int:
+        return len(NORMALIZED_FIELDS)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("CalendarRecord is read-only")
+
+    def __reduce__(self):
+        return CalendarRecord.from_dict, (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        return f"CalendarRecord({self.to_dict()!r})"
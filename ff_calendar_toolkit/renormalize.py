@@ -0,0 +1,74 @@
+import time
+
+from .bulk import normalize_batches, renormalize_batches
+from .console import AppConsole
+from .models import RenormalizeOptions
+from .snapshots import replay_snapshot, snapshot_paths
+from .storage import OutputStore, build_store
+
+
+class RenormalizeService:
+    """Apply the current timezone and filters to data already on disk instead of scraping again."""
+
+    def __init__(self, console: AppConsole | None = None) -> None:
+        self.console = console or AppConsole()
+
+    def run(self, options: RenormalizeOptions) -> int:
+        with build_store(options) as store:
+            if options.snapshot_paths:
+                return self._from_snapshots(store, options)
+            return self._from_monthly(store, options)
+
+    def _from_monthly(self, store: OutputStore, options: RenormalizeOptions) -> int:
+        slugs = store.monthly_slugs()
+        if not slugs:
+            self.console.error(f"No monthly datasets found in {options.sqlite_path or options.output_dir}")
+            return 1
+
+        started = time.perf_counter()
+        batches = [store.read_monthly(slug) for slug in slugs]
+        renormalized = renormalize_batches(
+            batches,
+            options.target_timezone,
+            options.allowed_currencies,
+            options.allowed_impacts,
+        )
+        for slug, records in zip(slugs, renormalized):
+            store.replace_monthly(slug, records, options.output_format)
+
+        self.console.success(
+            f"Renormalized {len(slugs)} month(s): {sum(map(len, batches))} stored rows, "
+            f"{sum(map(len, renormalized))} kept, in {time.perf_counter() - started:.2f}s"
+        )
+        return 0
+
+    def _from_snapshots(self, store: OutputStore, options: RenormalizeOptions) -> int:
+        paths = snapshot_paths(options.snapshot_paths)
+        if not paths:
+            self.console.error("No snapshot files found to renormalize")
+            return 1
+
+        started = time.perf_counter()
+        loaded = [replay_snapshot(path) for path in paths]
+        normalized = normalize_batches(
+            [
+                (raw_rows, context.year, context.source_timezone, context.scraped_at)
+                for raw_rows, context in loaded
+            ],
+            options.target_timezone,
+            options.allowed_currencies,
+            options.allowed_impacts,
+        )
+        store.begin_run(options.output_format)
+        for (_, context), records in zip(loaded, normalized):
+            if context.period == "month":
+                store.write(records, context, options.output_format)
+            else:
+                store.merge(records, context, options.output_format)
+        store.end_run()
+
+        self.console.success(
+            f"Renormalized {len(paths)} snapshot(s): {sum(len(raw_rows) for raw_rows, _ in loaded)} raw rows, "
+            f"{sum(map(len, normalized))} kept, in {time.perf_counter() - started:.2f}s"
+        )
+        return 0
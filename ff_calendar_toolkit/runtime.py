@@ -4,6 +4,11 @@ from pathlib import Path
 import yaml
 
 from .config import (
+    DEFAULT_ACTUALS_GIVE_UP_MINUTES,
+    DEFAULT_ACTUALS_IMPACTS,
+    DEFAULT_ACTUALS_LOOKAHEAD_MINUTES,
+    DEFAULT_ACTUALS_POLL_SECONDS,
+    DEFAULT_ALLOWED_DOMAINS,
     DEFAULT_ALERT_CHECK_INTERVAL_MINUTES,
     DEFAULT_ALERT_MESSAGE_PREFIX,
     DEFAULT_ALERT_RETRY_ATTEMPTS,
@@ -13,19 +18,45 @@ from .config import (
     DEFAULT_ALERT_STATE_DIR,
     DEFAULT_ALLOWED_CURRENCY_CODES,
     DEFAULT_ALLOWED_IMPACT_COLORS,
+    DEFAULT_BLOCK_RESOURCES,
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_BROWSER_DAEMON,
+    DEFAULT_BROWSER_DAEMON_MAX_MEMORY_MB,
+    DEFAULT_BROWSER_DAEMON_MAX_PAGES,
+    DEFAULT_BROWSER_DAEMON_PORT,
     DEFAULT_CONFIG_PATH,
+    DEFAULT_ENGINE,
     DEFAULT_ENV_PATH,
+    DEFAULT_EXTRACTION_MODE,
     DEFAULT_HEADLESS,
     DEFAULT_MONTHS,
     DEFAULT_OUTPUT_DIR,
     DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_PIPELINE_QUEUE_SIZE,
+    DEFAULT_REUSE_BROWSER,
     DEFAULT_SCHEDULE_PRESET,
+    DEFAULT_SCROLL_WAIT_SECONDS,
+    DEFAULT_SOURCE_TIMEZONE,
+    DEFAULT_SQLITE_FILENAME,
+    DEFAULT_STATE_DIR,
+    DEFAULT_STORAGE,
     DEFAULT_TARGET_TIMEZONE,
     DEFAULT_VIEWER_HOST,
     DEFAULT_VIEWER_PORT,
+    DEFAULT_WORKER_MEMORY_MB,
+    DEFAULT_WORKERS,
     ENV_KEYS,
 )
-from .models import AlertConnector, AlertOptions, RunOptions, ViewOptions
+from .models import (
+    ActualsOptions,
+    AlertConnector,
+    AlertOptions,
+    BackfillOptions,
+    RenormalizeOptions,
+    ReplayOptions,
+    RunOptions,
+    ViewOptions,
+)
 
 
 def _csv_values(value: str | None, default: list[str]) -> list[str]:
@@ -52,6 +83,12 @@ def _int_value(value: str | None, default: int) -> int:
     return int(value)
 
 
+def _float_value(value: str | None, default: float) -> float:
+    if value is None:
+        return default
+    return float(value)
+
+
 def _config_relative_path(config_path: Path, value, default: Path) -> Path:
     raw_path = Path(str(value)) if value is not None else default
     if raw_path.is_absolute():
@@ -59,6 +96,22 @@ def _config_relative_path(config_path: Path, value, default: Path) -> Path:
     return (config_path.parent / raw_path).resolve()
 
 
+def _storage_settings(config_path: Path, yaml_config: dict, output_dir: Path, storage_arg=None) -> tuple[str, Path | None]:
+    """Storage backend and, for sqlite, the database path (inside output_dir unless configured)."""
+    yaml_storage = yaml_config.get("storage", DEFAULT_STORAGE)
+    env_storage = os.getenv(ENV_KEYS["storage"], yaml_storage)
+    storage = str(storage_arg or env_storage).lower()
+    if storage != "sqlite":
+        return storage, None
+
+    yaml_sqlite_path = (
+        _config_relative_path(config_path, yaml_config.get("sqlite_path"), Path("."))
+        if yaml_config.get("sqlite_path")
+        else output_dir / DEFAULT_SQLITE_FILENAME
+    )
+    return storage, Path(os.getenv(ENV_KEYS["sqlite_path"], str(yaml_sqlite_path)))
+
+
 def resolve_config_path(path_value: str | None = None) -> Path:
     return Path(path_value or os.getenv(ENV_KEYS["config_path"]) or DEFAULT_CONFIG_PATH)
 
@@ -156,6 +209,35 @@ def build_run_options(args) -> RunOptions:
     )
     yaml_output_format = yaml_config.get("output_format", DEFAULT_OUTPUT_FORMAT)
     yaml_headless = bool(yaml_config.get("headless", DEFAULT_HEADLESS))
+    yaml_engine = yaml_config.get("engine", DEFAULT_ENGINE)
+    yaml_source_timezone = yaml_config.get("source_timezone", DEFAULT_SOURCE_TIMEZONE)
+    yaml_extraction_mode = yaml_config.get("extraction_mode", DEFAULT_EXTRACTION_MODE)
+    yaml_scroll_wait = float(yaml_config.get("scroll_wait_seconds", DEFAULT_SCROLL_WAIT_SECONDS))
+    yaml_reuse_browser = bool(yaml_config.get("reuse_browser", DEFAULT_REUSE_BROWSER))
+    yaml_snapshot_dir = (
+        _config_relative_path(config_path, yaml_config.get("snapshot_dir"), Path("."))
+        if yaml_config.get("snapshot_dir")
+        else None
+    )
+    yaml_block_resources = bool(yaml_config.get("block_resources", DEFAULT_BLOCK_RESOURCES))
+    yaml_blocked_types = _yaml_list(
+        yaml_config.get("blocked_resource_types"), DEFAULT_BLOCKED_RESOURCE_TYPES
+    )
+    yaml_allowed_domains = _yaml_list(yaml_config.get("allowed_domains"), DEFAULT_ALLOWED_DOMAINS)
+    yaml_state_dir = _config_relative_path(
+        config_path, yaml_config.get("state_dir"), DEFAULT_STATE_DIR
+    )
+    yaml_browser_daemon = bool(yaml_config.get("browser_daemon", DEFAULT_BROWSER_DAEMON))
+    yaml_daemon_port = int(yaml_config.get("browser_daemon_port", DEFAULT_BROWSER_DAEMON_PORT))
+    yaml_daemon_max_pages = int(
+        yaml_config.get("browser_daemon_max_pages", DEFAULT_BROWSER_DAEMON_MAX_PAGES)
+    )
+    yaml_daemon_max_memory = int(
+        yaml_config.get("browser_daemon_max_memory_mb", DEFAULT_BROWSER_DAEMON_MAX_MEMORY_MB)
+    )
+    yaml_workers = int(yaml_config.get("workers", DEFAULT_WORKERS))
+    yaml_worker_memory = int(yaml_config.get("worker_memory_mb", DEFAULT_WORKER_MEMORY_MB))
+    yaml_queue_size = int(yaml_config.get("pipeline_queue_size", DEFAULT_PIPELINE_QUEUE_SIZE))
 
     env_months = _space_values(os.getenv(ENV_KEYS["months"]), yaml_months)
     env_timezone = os.getenv(ENV_KEYS["timezone"], yaml_timezone)
@@ -164,16 +246,132 @@ def build_run_options(args) -> RunOptions:
     env_output_dir = Path(os.getenv(ENV_KEYS["output_dir"], str(yaml_output_dir)))
     env_output_format = os.getenv(ENV_KEYS["output_format"], yaml_output_format)
     env_headless = _bool_value(os.getenv(ENV_KEYS["headless"]), yaml_headless)
+    env_engine = os.getenv(ENV_KEYS["engine"], yaml_engine)
+    env_source_timezone = os.getenv(ENV_KEYS["source_timezone"], yaml_source_timezone)
+    env_extraction_mode = os.getenv(ENV_KEYS["extraction_mode"], yaml_extraction_mode)
+    env_scroll_wait = _float_value(os.getenv(ENV_KEYS["scroll_wait_seconds"]), yaml_scroll_wait)
+    env_reuse_browser = _bool_value(os.getenv(ENV_KEYS["reuse_browser"]), yaml_reuse_browser)
+    env_snapshot_dir = os.getenv(ENV_KEYS["snapshot_dir"])
+    env_block_resources = _bool_value(os.getenv(ENV_KEYS["block_resources"]), yaml_block_resources)
+    env_blocked_types = _csv_values(os.getenv(ENV_KEYS["blocked_resource_types"]), yaml_blocked_types)
+    env_allowed_domains = _csv_values(os.getenv(ENV_KEYS["allowed_domains"]), yaml_allowed_domains)
+    env_state_dir = Path(os.getenv(ENV_KEYS["state_dir"], str(yaml_state_dir)))
+    env_browser_daemon = _bool_value(os.getenv(ENV_KEYS["browser_daemon"]), yaml_browser_daemon)
+    env_daemon_port = _int_value(os.getenv(ENV_KEYS["browser_daemon_port"]), yaml_daemon_port)
+    env_daemon_max_pages = _int_value(
+        os.getenv(ENV_KEYS["browser_daemon_max_pages"]), yaml_daemon_max_pages
+    )
+    env_daemon_max_memory = _int_value(
+        os.getenv(ENV_KEYS["browser_daemon_max_memory_mb"]), yaml_daemon_max_memory
+    )
+    env_workers = _int_value(os.getenv(ENV_KEYS["workers"]), yaml_workers)
+    env_worker_memory = _int_value(os.getenv(ENV_KEYS["worker_memory_mb"]), yaml_worker_memory)
+    env_queue_size = _int_value(os.getenv(ENV_KEYS["pipeline_queue_size"]), yaml_queue_size)
+
+    # --week and --day add to --months rather than replacing it; FF_MONTHS only applies when none is given.
+    cli_months = list(args.months or [])
+    cli_months += [f"week:{value}" for value in getattr(args, "week", None) or []]
+    cli_months += [f"day:{value}" for value in getattr(args, "day", None) or []]
+    output_dir = Path(args.output_dir) if args.output_dir else env_output_dir
+    storage, sqlite_path = _storage_settings(
+        config_path, yaml_config, output_dir, getattr(args, "storage", None)
+    )
 
     return RunOptions(
         config_path=config_path,
-        months=args.months if args.months else env_months,
+        months=cli_months or env_months,
         output_format=args.output_format or env_output_format,
-        output_dir=Path(args.output_dir) if args.output_dir else env_output_dir,
+        output_dir=output_dir,
         target_timezone=args.timezone if args.timezone is not None else env_timezone,
         allowed_currencies=args.currencies if args.currencies else env_currencies,
         allowed_impacts=args.impacts if args.impacts else env_impacts,
         headless=(not args.show_browser) if args.show_browser else env_headless,
+        engine=getattr(args, "engine", None) or env_engine,
+        source_timezone=env_source_timezone,
+        extraction_mode=getattr(args, "extraction_mode", None) or env_extraction_mode,
+        scroll_wait_seconds=env_scroll_wait,
+        reuse_browser=env_reuse_browser,
+        workers=getattr(args, "workers", None) or env_workers,
+        worker_memory_mb=env_worker_memory,
+        pipeline_queue_size=env_queue_size,
+        snapshot_dir=(
+            Path(args.snapshot_dir)
+            if getattr(args, "snapshot_dir", None)
+            else Path(env_snapshot_dir) if env_snapshot_dir else yaml_snapshot_dir
+        ),
+        block_resources=getattr(args, "block_resources", None) or env_block_resources,
+        blocked_resource_types=env_blocked_types,
+        allowed_domains=env_allowed_domains,
+        state_dir=env_state_dir,
+        browser_daemon=env_browser_daemon,
+        browser_daemon_port=env_daemon_port,
+        browser_daemon_max_pages=env_daemon_max_pages,
+        browser_daemon_max_memory_mb=env_daemon_max_memory,
+        storage=storage,
+        sqlite_path=sqlite_path,
+    )
+
+
+def build_replay_options(args) -> ReplayOptions:
+    run_options = build_run_options(args)
+    return ReplayOptions(
+        snapshot_paths=[Path(value) for value in args.snapshots],
+        output_format=run_options.output_format,
+        output_dir=run_options.output_dir,
+        target_timezone=run_options.target_timezone,
+        allowed_currencies=run_options.allowed_currencies,
+        allowed_impacts=run_options.allowed_impacts,
+        write=bool(args.write),
+        repeat=max(1, args.repeat or 1),
+    )
+
+
+def build_renormalize_options(args) -> RenormalizeOptions:
+    run_options = build_run_options(args)
+    return RenormalizeOptions(
+        snapshot_paths=[Path(value) for value in args.snapshots or []],
+        output_format=run_options.output_format,
+        output_dir=run_options.output_dir,
+        target_timezone=run_options.target_timezone,
+        allowed_currencies=run_options.allowed_currencies,
+        allowed_impacts=run_options.allowed_impacts,
+        storage=run_options.storage,
+        sqlite_path=run_options.sqlite_path,
+    )
+
+
+def build_backfill_options(args) -> BackfillOptions:
+    return BackfillOptions(
+        run=build_run_options(args),
+        start=args.start,
+        end=args.end,
+        force=bool(args.force),
+    )
+
+
+def build_actuals_options(args) -> ActualsOptions:
+    run_options = build_run_options(args)
+    yaml_config = _load_yaml_config(run_options.config_path)
+    actuals_config = yaml_config.get("actuals") or {}
+    if not isinstance(actuals_config, dict):
+        actuals_config = {}
+
+    yaml_impacts = _yaml_list(actuals_config.get("impacts"), DEFAULT_ACTUALS_IMPACTS)
+    yaml_lookahead = int(actuals_config.get("lookahead_minutes", DEFAULT_ACTUALS_LOOKAHEAD_MINUTES))
+    yaml_give_up = int(actuals_config.get("give_up_minutes", DEFAULT_ACTUALS_GIVE_UP_MINUTES))
+    yaml_poll = float(actuals_config.get("poll_seconds", DEFAULT_ACTUALS_POLL_SECONDS))
+
+    env_impacts = _space_values(os.getenv(ENV_KEYS["actuals_impacts"]), yaml_impacts)
+    env_lookahead = _int_value(os.getenv(ENV_KEYS["actuals_lookahead_minutes"]), yaml_lookahead)
+    env_give_up = _int_value(os.getenv(ENV_KEYS["actuals_give_up_minutes"]), yaml_give_up)
+    env_poll = _float_value(os.getenv(ENV_KEYS["actuals_poll_seconds"]), yaml_poll)
+
+    return ActualsOptions(
+        run=run_options,
+        impacts=[item.lower() for item in (args.watch_impacts or env_impacts)],
+        lookahead_minutes=args.lookahead_minutes if args.lookahead_minutes is not None else env_lookahead,
+        give_up_minutes=args.give_up_minutes if args.give_up_minutes is not None else env_give_up,
+        poll_seconds=args.poll_seconds if args.poll_seconds is not None else env_poll,
     )
 
 
@@ -199,14 +397,16 @@ def build_view_options(args) -> ViewOptions:
     env_viewer_port = int(os.getenv(ENV_KEYS["viewer_port"], str(yaml_viewer_port)))
     env_rules_dir = Path(os.getenv(ENV_KEYS["alert_rules_dir"], str(yaml_rules_dir)))
     env_state_dir = Path(os.getenv(ENV_KEYS["alert_state_dir"], str(yaml_state_dir)))
+    output_dir = Path(args.output_dir) if args.output_dir else env_output_dir
 
     return ViewOptions(
         config_path=config_path,
-        output_dir=Path(args.output_dir) if args.output_dir else env_output_dir,
+        output_dir=output_dir,
         rules_dir=env_rules_dir,
         state_dir=env_state_dir,
         host=args.host or env_viewer_host,
         port=args.port or env_viewer_port,
+        sqlite_path=_storage_settings(config_path, yaml_config, output_dir)[1],
     )
 
 
@@ -260,9 +460,11 @@ def build_alert_options(args) -> AlertOptions:
         ENV_KEYS["alert_message_prefix"], yaml_message_prefix
     )
 
+    output_dir = Path(args.output_dir) if getattr(args, "output_dir", None) else env_output_dir
+
     return AlertOptions(
         config_path=config_path,
-        output_dir=Path(args.output_dir) if getattr(args, "output_dir", None) else env_output_dir,
+        output_dir=output_dir,
         rules_dir=Path(args.rules_dir) if getattr(args, "rules_dir", None) else env_rules_dir,
         state_dir=Path(args.state_dir) if getattr(args, "state_dir", None) else env_state_dir,
         check_interval_minutes=env_check_interval,
@@ -272,6 +474,7 @@ def build_alert_options(args) -> AlertOptions:
         retry_backoff_seconds=env_retry_backoff,
         message_prefix=env_message_prefix,
         connectors=_connector_configs(alerts_config),
+        sqlite_path=_storage_settings(config_path, yaml_config, output_dir)[1],
     )
 
 
@@ -1,22 +1,139 @@
 import os
 import time
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from pathlib import Path
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
-from .config import ALLOWED_ELEMENT_TYPES, ICON_COLOR_MAP
+from .browser_daemon import (
+    acquire_lease,
+    daemon_endpoint,
+    record_page,
+    release_lease,
+    resolve_chrome_binary,
+)
+from .config import (
+    ALLOWED_ELEMENT_TYPES,
+    BLOCKABLE_RESOURCE_PATTERNS,
+    DEFAULT_ALLOWED_DOMAINS,
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_EXTRACTION_MODE,
+    DEFAULT_SCROLL_WAIT_SECONDS,
+    EXTRACTION_MODES,
+    ICON_COLOR_MAP,
+)
+from .driver_cache import DriverCache, chrome_version
+from .extract import (
+    CALENDAR_TABLE_SCRIPT,
+    EMBEDDED_STATE_SCRIPT,
+    detail_url,
+    raw_rows_from_embedded_json,
+    raw_rows_from_table_json,
+)
+from .metrics import RunMetrics
 from .models import ScrapeContext
+from .periods import month_context, month_slug, month_url, resolve_month
+from .snapshots import save_snapshot
+
+ROW_COUNT_SCRIPT = "return document.querySelectorAll('.calendar__table tr').length;"
+SCROLL_POLL_SECONDS = 0.2
+# A month lists a few hundred rows; a page that keeps growing past this is not the calendar.
+MAX_SCROLL_STEPS = 50
+PAGE_STATS_SCRIPT = """
+const navigation = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+let transfer = navigation ? navigation.transferSize : 0;
+for (const entry of resources) {
+  transfer += entry.transferSize || 0;
+}
+return {
+  transfer_bytes: transfer,
+  resources: resources.length,
+  load_ms: navigation && navigation.loadEventEnd ? navigation.loadEventEnd - navigation.startTime : null,
+};
+"""
+
+
+def blocked_url_patterns(resource_types: list[str]) -> list[str]:
+    patterns = []
+    for resource_type in resource_types:
+        if resource_type not in BLOCKABLE_RESOURCE_PATTERNS:
+            raise ValueError(
+                f"Unknown resource type '{resource_type}', expected one of "
+                f"{', '.join(BLOCKABLE_RESOURCE_PATTERNS)}"
+            )
+        patterns.extend(BLOCKABLE_RESOURCE_PATTERNS[resource_type])
+    return patterns
+
+
+def host_resolver_rules(allowed_domains: list[str]) -> str:
+    """Fail DNS for every host except the allowed domains, which drops third-party requests."""
+    excludes = ", ".join(f"EXCLUDE {domain}" for domain in ["localhost", *allowed_domains])
+    return f"MAP * ~NOTFOUND, {excludes}"
 
 
 class ForexFactoryScraper:
-    def __init__(self, console, headless: bool = True) -> None:
+    def __init__(
+        self,
+        console,
+        headless: bool = True,
+        extraction_mode: str = DEFAULT_EXTRACTION_MODE,
+        scroll_wait_seconds: float = DEFAULT_SCROLL_WAIT_SECONDS,
+        snapshot_dir: Path | None = None,
+        block_resources: bool = False,
+        blocked_resource_types: list[str] | None = None,
+        allowed_domains: list[str] | None = None,
+        state_dir: Path | None = None,
+        use_browser_daemon: bool = False,
+        metrics: RunMetrics | None = None,
+    ) -> None:
+        if extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(
+                f"Unknown extraction mode '{extraction_mode}', expected one of {', '.join(EXTRACTION_MODES)}"
+            )
         self.console = console
         self.headless = headless
+        self.extraction_mode = extraction_mode
+        self.scroll_wait_seconds = scroll_wait_seconds
+        self.snapshot_dir = snapshot_dir
+        self.block_resources = block_resources
+        self.blocked_resource_types = list(
+            DEFAULT_BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types
+        )
+        self.allowed_domains = list(
+            DEFAULT_ALLOWED_DOMAINS if allowed_domains is None else allowed_domains
+        )
+        if self.block_resources:
+            blocked_url_patterns(self.blocked_resource_types)
+        self.state_dir = state_dir
+        self.use_browser_daemon = use_browser_daemon and state_dir is not None
+        self.driver_cache = DriverCache(state_dir) if state_dir else None
+        self.metrics = metrics or RunMetrics()
+        self._driver = None
+        self._lease = None
+        self._month_label = None
+        self._session_active = False
+        self._session_startup_seconds = 0.0
+        self._session_page_loads = []
 
     def init_driver(self) -> webdriver.Chrome:
+        address = daemon_endpoint(self.state_dir) if self.use_browser_daemon else None
+        if address:
+            driver = self._attach_driver(address)
+        else:
+            if self.use_browser_daemon:
+                self.console.warn("Browser daemon is not reachable, launching a local browser")
+            driver = self._launch_driver(self._chrome_options())
+        if self.block_resources:
+            self._apply_request_blocking(driver)
+        return driver
+
+    def _chrome_options(self) -> webdriver.ChromeOptions:
         options = webdriver.ChromeOptions()
         if self.headless:
             options.add_argument("--headless")
@@ -34,40 +151,190 @@ class ForexFactoryScraper:
         if chrome_bin:
             options.binary_location = chrome_bin
 
+        if self.block_resources:
+            if "image" in self.blocked_resource_types:
+                options.add_experimental_option(
+                    "prefs", {"profile.managed_default_content_settings.images": 2}
+                )
+            if self.allowed_domains:
+                options.add_argument(f"--host-resolver-rules={host_resolver_rules(self.allowed_domains)}")
+        return options
+
+    def _attach_driver(self, address: str) -> webdriver.Chrome:
+        options = webdriver.ChromeOptions()
+        options.debugger_address = address
+        self._lease = acquire_lease(self.state_dir)
+        try:
+            driver = self._launch_driver(options)
+            driver.switch_to.new_window("tab")
+        except Exception:
+            release_lease(self._lease)
+            self._lease = None
+            raise
+        self.console.step(f"Attached to daemon browser at {address}")
+        return driver
+
+    def _launch_driver(self, options: webdriver.ChromeOptions) -> webdriver.Chrome:
+        started = time.perf_counter()
+        driver, resolution = self._resolve_driver(options)
+        self.console.step(
+            f"WebDriver resolved via {resolution} in {time.perf_counter() - started:.2f}s"
+        )
+        return driver
+
+    def _resolve_driver(self, options: webdriver.ChromeOptions) -> tuple[webdriver.Chrome, str]:
         chromedriver_path = os.getenv("FF_CHROMEDRIVER_PATH") or os.getenv("CHROMEDRIVER_PATH")
         if chromedriver_path:
-            return webdriver.Chrome(service=Service(chromedriver_path), options=options)
+            return webdriver.Chrome(service=Service(chromedriver_path), options=options), "environment"
+
+        version = chrome_version(resolve_chrome_binary()) if self.driver_cache else None
+        cached_path = self.driver_cache.lookup(version) if self.driver_cache else None
+        if cached_path:
+            try:
+                return webdriver.Chrome(service=Service(cached_path), options=options), "cache"
+            except Exception:
+                self.console.warn(f"Cached WebDriver at {cached_path} failed, resolving again")
+                self.driver_cache.invalidate()
 
         try:
-            return webdriver.Chrome(options=options)
+            driver = webdriver.Chrome(options=options)
+            resolution = "selenium-manager"
         except Exception:
             self.console.step("Falling back to ChromeDriverManager for WebDriver setup")
             service = Service(ChromeDriverManager().install())
-            return webdriver.Chrome(service=service, options=options)
+            driver = webdriver.Chrome(service=service, options=options)
+            resolution = "webdriver-manager"
+        if self.driver_cache:
+            self.driver_cache.save(version, getattr(driver.service, "path", None), resolution)
+        return driver, resolution
+
+    def _apply_request_blocking(self, driver: webdriver.Chrome) -> None:
+        patterns = blocked_url_patterns(self.blocked_resource_types)
+        if not patterns:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except WebDriverException as exc:
+            self.console.warn(f"Could not enable DevTools request blocking: {exc}")
+            return
+        self.console.step(
+            f"Blocking {', '.join(self.blocked_resource_types)} requests "
+            f"outside {', '.join(self.allowed_domains) or 'no allowed domains'}"
+        )
+
+    def _log_page_stats(self, driver: webdriver.Chrome) -> None:
+        try:
+            stats = driver.execute_script(PAGE_STATS_SCRIPT) or {}
+        except WebDriverException:
+            return
+        load_ms = stats.get("load_ms")
+        load_text = f"{load_ms / 1000:.2f}s" if load_ms else "n/a"
+        self.console.step(
+            f"Page transfer {stats.get('transfer_bytes', 0) / 1024:.0f} KB over "
+            f"{stats.get('resources', 0)} resources, browser load {load_text} "
+            f"(resource blocking {'on' if self.block_resources else 'off'})"
+        )
 
     def scroll_to_end(self, driver: webdriver.Chrome) -> None:
-        previous_position = None
-        scroll_count = 0
-        self.console.step("Scrolling calendar page to load all events")
-        while True:
-            current_position = driver.execute_script("return window.pageYOffset;")
-            driver.execute_script("window.scrollTo(0, window.pageYOffset + 500);")
-            scroll_count += 1
-            if scroll_count == 1 or scroll_count % 5 == 0:
-                self.console.step(
-                    f"Scroll progress: step {scroll_count}, page offset {int(current_position)}"
-                )
-            time.sleep(2)
-            if current_position == previous_position:
-                self.console.step(
-                    f"Reached end of calendar after {scroll_count} scroll steps"
-                )
+        started = time.perf_counter()
+        row_count = self._row_count(driver)
+        self.console.step(
+            f"Scrolling calendar page to load all events ({row_count} rows before scrolling)"
+        )
+        for scroll_count in range(1, MAX_SCROLL_STEPS + 1):
+            step_started = time.perf_counter()
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            try:
+                WebDriverWait(
+                    driver, self.scroll_wait_seconds, poll_frequency=SCROLL_POLL_SECONDS
+                ).until(lambda current: self._row_count(current) > row_count)
+            except TimeoutException:
+                pass
+            new_count = self._row_count(driver)
+            self.console.step(
+                f"Scroll step {scroll_count}: {new_count - row_count} new rows "
+                f"({new_count} total) in {time.perf_counter() - step_started:.2f}s"
+            )
+            if new_count <= row_count:
                 break
-            previous_position = current_position
+            row_count = new_count
+        else:
+            self.console.warn(
+                f"Rows still growing after {MAX_SCROLL_STEPS} scroll steps; reading what is loaded"
+            )
+        self.console.step(
+            f"Reached end of calendar after {scroll_count} scroll steps in "
+            f"{time.perf_counter() - started:.2f}s with {row_count} rows"
+        )
+
+    def _row_count(self, driver: webdriver.Chrome) -> int:
+        return int(driver.execute_script(ROW_COUNT_SCRIPT) or 0)
+
+    def parse_embedded_state(self, driver: webdriver.Chrome, month_name: str) -> list[dict] | None:
+        """Read the calendar state the page embeds for its own rendering, or None if it is missing."""
+        self.console.step("Reading embedded calendar state")
+        started = time.perf_counter()
+        try:
+            payload = driver.execute_script(EMBEDDED_STATE_SCRIPT)
+            data = raw_rows_from_embedded_json(payload, month_name) if payload else None
+        except (WebDriverException, ValueError) as exc:
+            self.console.warn(f"Embedded state extraction failed ({exc})")
+            return None
+        if not data:
+            self.console.warn("No embedded calendar state on page, falling back to the rendered table")
+            return None
+        self.console.step(
+            f"Parsed {len(data)} raw calendar rows from embedded state in {time.perf_counter() - started:.2f}s"
+        )
+        return data
 
     def parse_table(self, driver: webdriver.Chrome, month_name: str) -> list[dict]:
+        if self.extraction_mode == "elements":
+            return self.parse_table_elements(driver, month_name)
+        if self.extraction_mode == "compare":
+            return self.compare_extraction(driver, month_name)
+        try:
+            return self.parse_table_script(driver, month_name)
+        except (WebDriverException, ValueError) as exc:
+            self.console.warn(f"Script extraction failed ({exc}), falling back to per-element parsing")
+            return self.parse_table_elements(driver, month_name)
+
+    def parse_table_script(self, driver: webdriver.Chrome, month_name: str) -> list[dict]:
+        self.console.step("Extracting calendar rows with a single script call")
+        started = time.perf_counter()
+        payload = driver.execute_script(CALENDAR_TABLE_SCRIPT, list(ALLOWED_ELEMENT_TYPES))
+        if payload is None:
+            raise ValueError("calendar__table not found on page")
+        data = raw_rows_from_table_json(payload, month_name)
+        self.console.step(
+            f"Parsed {len(data)} raw calendar rows via script in {time.perf_counter() - started:.2f}s"
+        )
+        return data
+
+    def compare_extraction(self, driver: webdriver.Chrome, month_name: str) -> list[dict]:
+        started = time.perf_counter()
+        script_rows = self.parse_table_script(driver, month_name)
+        script_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        element_rows = self.parse_table_elements(driver, month_name)
+        element_seconds = time.perf_counter() - started
+        speedup = element_seconds / script_seconds if script_seconds else 0.0
+        self.console.step(
+            f"Extraction timing: script {script_seconds:.2f}s, elements {element_seconds:.2f}s "
+            f"({speedup:.1f}x)"
+        )
+        if script_rows != element_rows:
+            self.console.warn(
+                f"Extraction paths disagree: script returned {len(script_rows)} rows, "
+                f"elements returned {len(element_rows)} rows"
+            )
+        return script_rows
+
+    def parse_table_elements(self, driver: webdriver.Chrome, month_name: str) -> list[dict]:
         data = []
-        self.console.step("Parsing loaded calendar rows")
+        self.console.step("Parsing loaded calendar rows element by element")
+        started = time.perf_counter()
         table = driver.find_element(By.CLASS_NAME, "calendar__table")
 
         for row in table.find_elements(By.TAG_NAME, "tr"):
@@ -88,9 +355,7 @@ class ForexFactoryScraper:
                         color = ICON_COLOR_MAP.get(impact_class)
                     row_data[class_name_key] = color if color else "impact"
                 elif "calendar__detail" in class_name and event_id:
-                    row_data[class_name_key] = (
-                        f"https://www.forexfactory.com/calendar?month={month_name}#detail={event_id}"
-                    )
+                    row_data[class_name_key] = detail_url(month_name, event_id)
                 elif element.text:
                     row_data[class_name_key] = element.text
                 else:
@@ -99,46 +364,116 @@ class ForexFactoryScraper:
             if row_data:
                 data.append(row_data)
 
-        self.console.step(f"Parsed {len(data)} raw calendar rows")
+        self.console.step(
+            f"Parsed {len(data)} raw calendar rows via elements in {time.perf_counter() - started:.2f}s"
+        )
         return data
 
     def resolve_month(self, month_param: str) -> tuple[str, str, int]:
-        param = month_param.lower()
-        now = datetime.now()
-        if param == "this":
-            return now.strftime("%B"), str(now.year), now.month
-        if param == "next":
-            next_month = (now.month % 12) + 1
-            year = now.year if now.month < 12 else now.year + 1
-            return datetime(year, next_month, 1).strftime("%B"), str(year), next_month
-        month_number = datetime.strptime(param.capitalize(), "%B").month
-        return param.capitalize(), str(now.year), month_number
+        return resolve_month(month_param)
+
+    @contextmanager
+    def session(self):
+        """Keep one browser alive for every scrape_month call inside the block."""
+        self._session_active = True
+        self._session_startup_seconds = 0.0
+        self._session_page_loads = []
+        try:
+            yield self
+        finally:
+            self._session_active = False
+            self._quit_driver()
+            if self._session_page_loads:
+                average = sum(self._session_page_loads) / len(self._session_page_loads)
+                self.console.step(
+                    f"Browser session summary: startup {self._session_startup_seconds:.2f}s, "
+                    f"{len(self._session_page_loads)} page loads averaging {average:.2f}s"
+                )
+
+    def _acquire_driver(self) -> webdriver.Chrome:
+        if self._driver is None:
+            started = time.perf_counter()
+            self._driver = self.init_driver()
+            elapsed = time.perf_counter() - started
+            self._session_startup_seconds += elapsed
+            self.metrics.record("driver_start", elapsed, self._month_label)
+            self.console.step(f"Browser started in {elapsed:.2f}s")
+        return self._driver
+
+    def _quit_driver(self) -> None:
+        driver, self._driver = self._driver, None
+        lease, self._lease = self._lease, None
+        if driver is None:
+            return
+        try:
+            if lease:
+                driver.close()
+            driver.quit()
+        except WebDriverException:
+            pass
+        finally:
+            if lease:
+                release_lease(lease)
+
+    def _driver_alive(self) -> bool:
+        try:
+            self._driver.current_url
+        except WebDriverException:
+            return False
+        return True
 
     def scrape_month(
         self, month_param: str, target_timezone: str | None
     ) -> tuple[list[dict], ScrapeContext]:
-        url = f"https://www.forexfactory.com/calendar?month={month_param.lower()}"
-        month_name, year, month_number = self.resolve_month(month_param)
+        url = month_url(month_param)
+        month_name, _, _ = self.resolve_month(month_param)
+        self._month_label = month_slug(month_param)
         self.console.step(f"Navigating to {url}")
-        driver = self.init_driver()
         try:
-            driver.get(url)
-            self.console.step("Calendar page loaded, detecting browser timezone")
-            source_timezone = driver.execute_script(
-                "return Intl.DateTimeFormat().resolvedOptions().timeZone"
-            )
-            self.console.step(f"Browser timezone detected as {source_timezone}")
+            rows, source_timezone, page_source = self._load_and_parse(url, month_name)
+        except WebDriverException:
+            if not self._session_active or self._driver is None or self._driver_alive():
+                raise
+            self.console.warn("Browser session crashed, restarting it and retrying the month")
+            self._quit_driver()
+            rows, source_timezone, page_source = self._load_and_parse(url, month_name)
+        finally:
+            if not self._session_active:
+                self._quit_driver()
+
+        context = month_context(month_param, source_timezone, target_timezone)
+        if page_source is not None:
+            path = save_snapshot(self.snapshot_dir, page_source, context)
+            self.console.step(f"Saved page snapshot to {path}")
+        return rows, context
+
+    def _load_and_parse(self, url: str, month_name: str) -> tuple[list[dict], str, str | None]:
+        driver = self._acquire_driver()
+        started = time.perf_counter()
+        driver.get(url)
+        page_load_seconds = time.perf_counter() - started
+        self.metrics.record("driver_get", page_load_seconds, self._month_label)
+        if self._session_active:
+            self._session_page_loads.append(page_load_seconds)
+        if self._lease:
+            record_page(self.state_dir)
+        self.console.step(
+            f"Calendar page loaded in {page_load_seconds:.2f}s, detecting browser timezone"
+        )
+        self._log_page_stats(driver)
+        source_timezone = driver.execute_script(
+            "return Intl.DateTimeFormat().resolvedOptions().timeZone"
+        )
+        self.console.step(f"Browser timezone detected as {source_timezone}")
+        if self.extraction_mode == "state":
+            with self.metrics.phase("parse_state", self._month_label):
+                rows = self.parse_embedded_state(driver, month_name)
+            if rows:
+                page_source = driver.page_source if self.snapshot_dir else None
+                return rows, source_timezone, page_source
+        with self.metrics.phase("scroll_to_end", self._month_label):
             self.scroll_to_end(driver)
+        page_source = driver.page_source if self.snapshot_dir else None
+        with self.metrics.phase("parse_table", self._month_label):
             rows = self.parse_table(driver, month_name)
-            context = ScrapeContext(
-                month_param=month_param.lower(),
-                month_name=month_name,
-                month_slug=f"{year}-{month_number:02d}",
-                year=year,
-                source_timezone=source_timezone,
-                target_timezone=target_timezone,
-                scraped_at=datetime.now(timezone.utc).isoformat(),
-            )
-            return rows, context
-        finally:
-            driver.quit()
+        return rows, source_timezone, page_source
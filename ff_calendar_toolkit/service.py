@@ -1,47 +1,157 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
+
 from .console import AppConsole
+from .metrics import RunMetrics
 from .models import RunOptions
 from .normalize import normalize_rows
-from .scraper import ForexFactoryScraper
-from .storage import FileOutputStore
+from .pipeline import StagePipeline
+from .storage import OutputStore, build_store
+from .workers import available_memory_bytes, effective_worker_count, init_worker, scrape_month_in_worker
+
+
+def build_scraper(console: AppConsole, options: RunOptions, metrics: RunMetrics | None = None):
+    if options.engine == "http":
+        from .http_fetcher import HttpCalendarFetcher
+
+        return HttpCalendarFetcher(
+            console,
+            source_timezone=options.source_timezone,
+            snapshot_dir=options.snapshot_dir,
+            metrics=metrics,
+        )
+
+    from .scraper import ForexFactoryScraper
+
+    return ForexFactoryScraper(
+        console,
+        headless=options.headless,
+        extraction_mode=options.extraction_mode,
+        scroll_wait_seconds=options.scroll_wait_seconds,
+        snapshot_dir=options.snapshot_dir,
+        block_resources=options.block_resources,
+        blocked_resource_types=options.blocked_resource_types,
+        allowed_domains=options.allowed_domains,
+        state_dir=options.state_dir,
+        use_browser_daemon=options.browser_daemon,
+        metrics=metrics,
+    )
 
 
 class ScrapeService:
     def __init__(self, console: AppConsole | None = None) -> None:
         self.console = console or AppConsole()
 
-    def run(self, options: RunOptions) -> int:
-        scraper = ForexFactoryScraper(self.console, headless=options.headless)
-        store = FileOutputStore(options.output_dir)
-        total_records = 0
+    def run(self, options: RunOptions, on_month_written=None) -> int:
+        with build_store(options) as store:
+            return self._run(store, options, on_month_written)
+
+    def _run(self, store: OutputStore, options: RunOptions, on_month_written) -> int:
+        metrics = RunMetrics()
+        totals = {"records": 0}
         store.begin_run(options.output_format)
 
-        for month in options.months:
-            self.console.step(f"Scraping month selector '{month}'")
-            raw_rows, context = scraper.scrape_month(month, options.target_timezone)
+        def normalize(item):
+            raw_rows, context = item
             self.console.step(
                 f"Normalizing {len(raw_rows)} raw rows for {context.month_name} {context.year}"
             )
-            records = normalize_rows(
-                raw_rows,
-                context.year,
-                context.source_timezone,
-                options.target_timezone,
-                options.allowed_currencies,
-                options.allowed_impacts,
-                context.scraped_at,
-            )
+            with metrics.phase("normalize_rows", context.month_slug):
+                records = normalize_rows(
+                    raw_rows,
+                    context.year,
+                    context.source_timezone,
+                    options.target_timezone,
+                    options.allowed_currencies,
+                    options.allowed_impacts,
+                    context.scraped_at,
+                )
+            metrics.count("raw_rows", len(raw_rows), context.month_slug)
+            metrics.count("records", len(records), context.month_slug)
+            return records, context
+
+        def write(item):
+            records, context = item
             self.console.step(
                 f"Writing {len(records)} filtered rows as {options.output_format} output"
             )
-            total_records += len(records)
-            result = store.write(records, context, options.output_format)
+            with metrics.phase("store_write", context.month_slug):
+                if context.period == "month":
+                    result = store.write(records, context, options.output_format)
+                else:
+                    result = store.merge(records, context, options.output_format)
+            totals["records"] += len(records)
+            metrics.count("bytes_written", result.bytes_written, context.month_slug)
+            if on_month_written:
+                on_month_written(context, records)
             self.console.success(
                 f"{context.month_name} {context.year}: {len(records)} rows written "
-                f"to {options.output_dir}"
+                f"to {options.output_dir} ({result.bytes_written:,} bytes in {result.write_seconds:.3f}s)"
             )
+            if result.history_reused:
+                metrics.count("history_reused", 1, context.month_slug)
+                self.console.step(
+                    f"{context.month_slug} is unchanged; history points at {result.history_paths[0].name}"
+                )
             self.console.step(
                 f"Last-run artifacts: {', '.join(str(path) for path in result.last_run_paths)}"
             )
 
-        self.console.success(f"Run finished with {total_records} rows across {len(options.months)} month(s)")
+        pipeline = StagePipeline(metrics, options.pipeline_queue_size, label=lambda item: item[1].month_slug)
+        with self._scraped_months(options, metrics) as scraped_months:
+            pipeline.run(scraped_months, [("normalize", normalize), ("write", write)])
+        store.end_run()
+
+        json_path, prom_path = metrics.write(options.output_dir)
+        self.console.step(f"Run report written to {json_path} and {prom_path}")
+        self.console.success(
+            f"Run finished with {totals['records']} rows across {len(options.months)} month(s), "
+            f"{store.bytes_written:,} bytes written"
+        )
         return 0
+
+    @contextmanager
+    def _scraped_months(self, options: RunOptions, metrics: RunMetrics):
+        """Yield (raw_rows, context) pairs in the order the months were requested."""
+        workers = effective_worker_count(
+            options.workers,
+            len(options.months),
+            options.worker_memory_mb,
+            available_memory_bytes(),
+        )
+        if workers < options.workers:
+            self.console.warn(
+                f"Reducing scrape workers from {options.workers} to {workers} "
+                f"based on month count, CPUs and available memory"
+            )
+
+        if workers > 1:
+            self.console.step(f"Scraping {len(options.months)} months with {workers} browser workers")
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=init_worker, initargs=(options,)
+            ) as executor:
+                yield self._merge_worker_metrics(
+                    executor.map(
+                        partial(scrape_month_in_worker, target_timezone=options.target_timezone),
+                        options.months,
+                    ),
+                    metrics,
+                )
+            return
+
+        scraper = build_scraper(self.console, options, metrics)
+        session = scraper.session() if options.reuse_browser else nullcontext()
+        with session:
+            yield self._scrape_serially(scraper, options)
+
+    @staticmethod
+    def _merge_worker_metrics(results, metrics: RunMetrics):
+        for raw_rows, context, worker_metrics in results:
+            metrics.merge(worker_metrics)
+            yield raw_rows, context
+
+    def _scrape_serially(self, scraper, options: RunOptions):
+        for month in options.months:
+            self.console.step(f"Scraping month selector '{month}'")
+            yield scraper.scrape_month(month, options.target_timezone)
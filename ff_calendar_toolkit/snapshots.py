@@ -0,0 +1,56 @@
+"""Compressed captures of rendered calendar pages for offline replay."""
+
+import gzip
+import json
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+from .extract import raw_rows_from_page
+from .models import ScrapeContext
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".json.gz"
+
+
+def save_snapshot(snapshot_dir: Path, html: str, context: ScrapeContext) -> Path:
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().astimezone().strftime("%Y-%m-%dT%H-%M-%S%z")
+    payload = {"version": SNAPSHOT_VERSION, "context": asdict(context), "html": html}
+    suffix = 0
+    while True:
+        # Names have one-second resolution; a second capture of the slug in that second gets -1, -2, ...
+        name = f"{context.month_slug}_{timestamp}{f'-{suffix}' if suffix else ''}{SNAPSHOT_SUFFIX}"
+        path = snapshot_dir / name
+        try:
+            handle = gzip.open(path, "xt", encoding="utf-8")
+        except FileExistsError:
+            suffix += 1
+            continue
+        with handle:
+            json.dump(payload, handle)
+        return path
+
+
+def load_snapshot(path: Path) -> tuple[str, ScrapeContext]:
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    if payload.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Snapshot {path} has unsupported version {payload.get('version')!r}")
+    return payload["html"], ScrapeContext(**payload["context"])
+
+
+def replay_snapshot(path: Path) -> tuple[list[dict], ScrapeContext]:
+    html, context = load_snapshot(path)
+    rows, _ = raw_rows_from_page(html, context.month_name)
+    return rows, context
+
+
+def snapshot_paths(paths: list[Path]) -> list[Path]:
+    resolved = []
+    for path in paths:
+        if path.is_dir():
+            resolved.extend(sorted(path.glob(f"*{SNAPSHOT_SUFFIX}")))
+        else:
+            resolved.append(path)
+    return resolved
@@ -0,0 +1,349 @@
+"""SQLite output store: one upserted row per event plus a table of snapshot revisions.
+
+``events`` holds the current state of every event keyed by ``event_identity``,
+the same identity the file store merges on. ``revisions`` keeps each written
+scrape as a JSON payload, which is what ``history/`` holds for the file store.
+The database runs in WAL mode, so the viewer, local API and alerts can read
+while a scrape writes.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from .config import NORMALIZED_FIELDS
+from .models import ScrapeContext, WriteResult
+from .normalize import event_identity
+from .periods import covered_dates
+from .storage import HISTORY_TIMESTAMP_FORMAT, OutputStore, dataset_stems, read_record_file, record_month_slug
+
+BUSY_TIMEOUT_MS = 5000
+MONTH_SLUG_PATTERN = re.compile(r"\d{4}-\d{2}")
+
+FIELD_COLUMNS = ", ".join(f'"{field}"' for field in NORMALIZED_FIELDS)
+FIELD_DEFINITIONS = ",\n    ".join(
+    f'"{field}" INTEGER' if field == "event_timestamp_utc" else f'"{field}" TEXT NOT NULL DEFAULT \'\''
+    for field in NORMALIZED_FIELDS
+)
+EVENT_COLUMNS = f"event_id, month_slug, event_date, position, revision_id, updated_at, {FIELD_COLUMNS}"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    month_slug TEXT NOT NULL,
+    event_date TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    revision_id INTEGER,
+    updated_at TEXT NOT NULL,
+    {FIELD_DEFINITIONS}
+);
+CREATE INDEX IF NOT EXISTS events_time ON events (event_timestamp_utc);
+CREATE INDEX IF NOT EXISTS events_currency_time ON events (currency, event_timestamp_utc);
+CREATE INDEX IF NOT EXISTS events_impact_time ON events (impact, event_timestamp_utc);
+CREATE INDEX IF NOT EXISTS events_month ON events (month_slug, event_date, position);
+CREATE TABLE IF NOT EXISTS revisions (
+    revision_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    month_slug TEXT NOT NULL,
+    period TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    written_at TEXT NOT NULL,
+    source TEXT UNIQUE,
+    record_count INTEGER NOT NULL,
+    records TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS revisions_month ON revisions (month_slug, written_at);
+"""
+
+UPSERT_SQL = (
+    f"INSERT INTO events ({EVENT_COLUMNS}) VALUES ({', '.join('?' * (6 + len(NORMALIZED_FIELDS)))}) "
+    "ON CONFLICT (event_id) DO UPDATE SET "
+    + ", ".join(
+        f"{column} = excluded.{column}"
+        for column in ["month_slug", "event_date", "position", "revision_id", "updated_at"]
+        + [f'"{field}"' for field in NORMALIZED_FIELDS]
+    )
+)
+
+
+def connect(database_path: Path) -> sqlite3.Connection:
+    # The scrape pipeline writes from its own stage thread; stores serialize access with a lock.
+    connection = sqlite3.connect(database_path, check_same_thread=False)
+    connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    return connection
+
+
+def _event_date(record: dict) -> str:
+    """Sortable yyyy-mm-dd form of the record's dd/mm/yyyy date."""
+    return "-".join(record.get("date", "").split("/")[::-1])
+
+
+def _column_value(record: dict, field: str):
+    value = record.get(field, "")
+    if field == "event_timestamp_utc":
+        return int(value) if value not in (None, "") else None
+    return value
+
+
+def _event_row(
+    record: dict, position: int, revision_id: int | None, updated_at: str, month_slug: str | None = None
+) -> tuple:
+    return (
+        event_identity(record),
+        month_slug or record_month_slug(record) or "",
+        _event_date(record),
+        position,
+        revision_id,
+        updated_at,
+        *(_column_value(record, field) for field in NORMALIZED_FIELDS),
+    )
+
+
+def _record_from_row(row: tuple) -> dict:
+    record = dict(zip(NORMALIZED_FIELDS, row))
+    if record["event_timestamp_utc"] is None:
+        record["event_timestamp_utc"] = ""
+    return record
+
+
+def select_events(
+    connection: sqlite3.Connection,
+    start: int | None = None,
+    end: int | None = None,
+    currencies: list[str] | None = None,
+    impacts: list[str] | None = None,
+    month: str | None = None,
+) -> list[dict]:
+    """Stored events in date order, filtered in SQL on the indexed columns.
+
+    ``start`` and ``end`` are epoch seconds (end exclusive); a time filter leaves
+    out events without an exact time.
+    """
+    clauses = []
+    parameters = []
+    if start is not None:
+        clauses.append("event_timestamp_utc >= ?")
+        parameters.append(start)
+    if end is not None:
+        clauses.append("event_timestamp_utc < ?")
+        parameters.append(end)
+    if currencies:
+        clauses.append(f"currency IN ({', '.join('?' * len(currencies))})")
+        parameters.extend(currencies)
+    if impacts:
+        clauses.append(f"impact IN ({', '.join('?' * len(impacts))})")
+        parameters.extend(impacts)
+    if month:
+        clauses.append("month_slug = ?")
+        parameters.append(month)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = connection.execute(
+        f"SELECT {FIELD_COLUMNS} FROM events{where} ORDER BY event_date, position, rowid", parameters
+    )
+    return [_record_from_row(row) for row in rows]
+
+
+def read_events(database_path: Path, **filters) -> list[dict]:
+    """Read events from a database another process may be writing; see ``select_events`` for filters."""
+    if not database_path.exists():
+        return []
+    connection = connect(database_path)
+    try:
+        return select_events(connection, **filters)
+    finally:
+        connection.close()
+
+
+def select_month_slugs(connection: sqlite3.Connection) -> list[str]:
+    rows = connection.execute("SELECT DISTINCT month_slug FROM events WHERE month_slug != '' ORDER BY month_slug")
+    return [row[0] for row in rows]
+
+
+def read_month_slugs(database_path: Path) -> list[str]:
+    if not database_path.exists():
+        return []
+    connection = connect(database_path)
+    try:
+        return select_month_slugs(connection)
+    finally:
+        connection.close()
+
+
+class SqliteOutputStore(OutputStore):
+    def __init__(self, database_path: Path) -> None:
+        self.database_path = database_path
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = connect(database_path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self.bytes_written = 0
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def begin_run(self, output_format: str) -> None:
+        """Nothing to reset: events hold the current state and every write adds a revision."""
+
+    def end_run(self) -> None:
+        """Nothing to publish: each write commits its own transaction."""
+
+    def write(self, records: Iterable[dict], context: ScrapeContext, output_format: str) -> WriteResult:
+        """Store a month scrape as a revision and make that month's events match it exactly."""
+        return self._store(list(records), context, replace_month=context.period == "month")
+
+    def merge(self, records: list[dict], context: ScrapeContext, output_format: str) -> WriteResult:
+        """Store a week or day scrape as a revision and replace its days' events in their months."""
+        return self._store(list(records), context, replace_month=False, replace_dates=covered_dates(context))
+
+    def merge_monthly(self, records: list[dict], output_format: str) -> list[Path]:
+        """Update events in place without recording a revision, as the actuals watcher does."""
+        updated_at = datetime.now().astimezone().isoformat()
+        with self.lock, self.connection:
+            self._upsert(records, None, updated_at)
+        return [self.database_path]
+
+    def replace_monthly(self, slug: str, records: list[dict], output_format: str) -> list[Path]:
+        """Make a month's events exactly records, as renormalize does for the file store.
+
+        Records stay in the month they were read from even if a new timezone moves
+        their date across the month boundary, matching the file store's monthly files.
+        """
+        updated_at = datetime.now().astimezone().isoformat()
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM events WHERE month_slug = ?", (slug,))
+            self._upsert(records, None, updated_at, month_slug=slug)
+        return [self.database_path]
+
+    def add_revision(
+        self,
+        records: list[dict],
+        month_slug: str,
+        period: str,
+        scraped_at: str,
+        written_at: str,
+        source: str | None = None,
+    ) -> int | None:
+        """Insert a revision without touching events; returns None when source was already imported."""
+        payload = json.dumps(records)
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO revisions (month_slug, period, scraped_at, written_at, source, record_count, records) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (source) DO NOTHING",
+                (month_slug, period, scraped_at, written_at, source, len(records), payload),
+            )
+        if not cursor.rowcount:
+            return None
+        self.bytes_written += len(payload)
+        return cursor.lastrowid
+
+    def revisions(self, month_slug: str) -> list[dict]:
+        rows = self.connection.execute(
+            "SELECT revision_id, period, scraped_at, written_at, source, record_count "
+            "FROM revisions WHERE month_slug = ? ORDER BY written_at, revision_id",
+            (month_slug,),
+        )
+        columns = ["revision_id", "period", "scraped_at", "written_at", "source", "record_count"]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def monthly_slugs(self) -> list[str]:
+        with self.lock:
+            return select_month_slugs(self.connection)
+
+    def month_scrape_times(self, slug: str) -> list[str]:
+        """scraped_at of every full-month revision; week and day merges never count."""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT scraped_at FROM revisions WHERE month_slug = ? AND period = 'month'", (slug,)
+            )
+            return [row[0] for row in rows]
+
+    def read_monthly(self, slug: str) -> list[dict]:
+        return self.events(month=slug)
+
+    def events(self, **filters) -> list[dict]:
+        with self.lock:
+            return select_events(self.connection, **filters)
+
+    def _store(
+        self, records: list[dict], context: ScrapeContext, replace_month: bool, replace_dates: Iterable[str] = ()
+    ) -> WriteResult:
+        started = time.perf_counter()
+        written_at = datetime.now().astimezone().isoformat()
+        payload = json.dumps(records)
+        with self.lock, self.connection:
+            revision_id = self.connection.execute(
+                "INSERT INTO revisions (month_slug, period, scraped_at, written_at, record_count, records) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (context.month_slug, context.period, context.scraped_at, written_at, len(records), payload),
+            ).lastrowid
+            self._upsert(records, revision_id, written_at)
+            if replace_month:
+                # Events the month no longer lists were dropped upstream or renamed.
+                self.connection.execute(
+                    "DELETE FROM events WHERE month_slug = ? AND revision_id IS NOT ?",
+                    (context.month_slug, revision_id),
+                )
+            for date in replace_dates:
+                # A rescheduled or re-rated event has a new identity; its old row must go.
+                self.connection.execute(
+                    "DELETE FROM events WHERE event_date = ? AND revision_id IS NOT ?",
+                    (_event_date({"date": date}), revision_id),
+                )
+        self.bytes_written += len(payload)
+        return WriteResult(
+            last_run_paths=[self.database_path],
+            monthly_paths=[self.database_path],
+            history_paths=[self.database_path],
+            records_written=len(records),
+            bytes_written=len(payload),
+            write_seconds=time.perf_counter() - started,
+        )
+
+    def _upsert(
+        self, records: list[dict], revision_id: int | None, updated_at: str, month_slug: str | None = None
+    ) -> None:
+        self.connection.executemany(
+            UPSERT_SQL,
+            (
+                _event_row(record, position, revision_id, updated_at, month_slug)
+                for position, record in enumerate(records)
+            ),
+        )
+
+
+def import_file_store(store: SqliteOutputStore, output_dir: Path) -> tuple[int, int]:
+    """Backfill a database from a file store's history and monthly files.
+
+    Every history snapshot becomes a revision, matched by its relative path so
+    that importing again only adds new files. The monthly files are then
+    upserted as the current events. Returns (revisions added, events upserted).
+    """
+    revisions = 0
+    history_dir = output_dir / "history"
+    for period_dir in sorted(path for path in history_dir.glob("*") if path.is_dir()):
+        slug = period_dir.name
+        period = "month" if MONTH_SLUG_PATTERN.fullmatch(slug) else slug.split("-")[0]
+        for stem in dataset_stems(period_dir):
+            records = read_record_file(period_dir, stem)
+            try:
+                written_at = datetime.strptime(stem, HISTORY_TIMESTAMP_FORMAT).isoformat()
+            except ValueError:
+                written_at = stem
+            scraped_at = max((record.get("scraped_at", "") for record in records), default="")
+            source = f"history/{slug}/{stem}"
+            if store.add_revision(records, slug, period, scraped_at, written_at, source) is not None:
+                revisions += 1
+
+    events = 0
+    monthly_dir = output_dir / "monthly"
+    for slug in dataset_stems(monthly_dir):
+        records = read_record_file(monthly_dir, slug)
+        store.merge_monthly(records, "both")
+        events += len(records)
+    return revisions, events
@@ -1,76 +1,630 @@
 import csv
+import filecmp
+import hashlib
 import json
+import os
+import shutil
+import time
+import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from contextlib import ExitStack
 from datetime import datetime
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
 
 from .config import NORMALIZED_FIELDS
 from .models import ScrapeContext, WriteResult
+from .normalize import event_identity
+from .periods import covered_dates
+
+
+LAST_RUN_GENERATIONS_DIR = "last_run_generations"
+# Preferred first when a dataset exists in several formats with the same modification time.
+RECORD_SUFFIXES = (".json", ".csv", ".parquet", ".arrow")
+BINARY_FORMATS = {"parquet", "arrow"}
+HISTORY_MANIFEST_NAME = "manifest.jsonl"
+HISTORY_TIMESTAMP_FORMAT = "%Y-%m-%dT%H-%M-%S%z"
+# scraped_at changes on every run, so it is left out of a snapshot's content digest.
+DIGEST_FIELDS = [field for field in NORMALIZED_FIELDS if field != "scraped_at"]
+
+
+def temp_path_for(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def fsync_directory(path: Path) -> None:
+    """Persist renames in a directory; a no-op where directories cannot be opened (Windows)."""
+    if os.name == "nt":
+        return
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def same_bytes(first: Path, second: Path) -> bool:
+    """True when both files exist with identical contents (or are the same file)."""
+    try:
+        if os.path.samefile(first, second):
+            return True
+        if first.stat().st_size != second.stat().st_size:
+            return False
+    except FileNotFoundError:
+        return False
+    return filecmp.cmp(first, second, shallow=False)
+
+
+def record_digest_key(record: dict) -> bytes:
+    return ("\x1f".join(str(record.get(field, "")) for field in DIGEST_FIELDS) + "\x1e").encode("utf-8")
+
+
+def read_history_manifest(directory: Path) -> list[dict]:
+    path = directory / HISTORY_MANIFEST_NAME
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def append_history_manifest(directory: Path, entry: dict) -> None:
+    with open(directory / HISTORY_MANIFEST_NAME, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps(entry) + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def latest_scrape_times(output_dir: Path) -> dict[str, str]:
+    """Latest scraped_at of every history slug, read from the manifests.
+
+    This is how fresh the file store's data is. An unchanged scrape reuses its
+    snapshot and leaves monthly/ and last_run/ untouched, so their rows keep the
+    scraped_at of the first scrape that produced that content.
+    """
+    times = {}
+    for manifest_path in sorted((output_dir / "history").glob(f"*/{HISTORY_MANIFEST_NAME}")):
+        scraped = [entry.get("scraped_at") or "" for entry in read_history_manifest(manifest_path.parent)]
+        if any(scraped):
+            times[manifest_path.parent.name] = max(scraped)
+    return times
+
+
+def record_month_slug(record: dict) -> str | None:
+    """Monthly dataset a normalized record belongs to, from its dd/mm/yyyy date."""
+    parts = record.get("date", "").split("/")
+    if len(parts) != 3:
+        return None
+    return f"{parts[2]}-{parts[1]}"
+
+
+def record_file_path(directory: Path, stem: str) -> Path | None:
+    """The most recently written ``<stem>.<format>`` dataset in directory, if any.
+
+    After output_format changes, older files in the previous format stay behind; the
+    newest one is the current data.
+    """
+    existing = [directory / f"{stem}{suffix}" for suffix in RECORD_SUFFIXES]
+    existing = [path for path in existing if path.exists()]
+    if not existing:
+        return None
+    return max(existing, key=lambda path: path.stat().st_mtime_ns)
+
+
+def read_record_path(path: Path, **filters) -> list[dict]:
+    """Records from a dataset file of any output format.
+
+    Parquet and Arrow files apply ``filters`` (see ``columnar.read_columnar_table``)
+    while reading; text formats return every record and ignore them.
+    """
+    if path.suffix == ".json":
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    if path.suffix == ".csv":
+        with open(path, "r", newline="", encoding="utf-8") as handle:
+            return list(csv.DictReader(handle))
+    from .columnar import read_columnar
+
+    return read_columnar(path, **filters)
+
+
+def read_record_file(directory: Path, stem: str) -> list[dict]:
+    path = record_file_path(directory, stem)
+    return read_record_path(path) if path is not None else []
+
+
+def dataset_stems(directory: Path) -> list[str]:
+    if not directory.is_dir():
+        return []
+    return sorted({path.stem for path in directory.iterdir() if path.suffix in RECORD_SUFFIXES})
+
+
+def _date_key(record: dict) -> list[str]:
+    return record.get("date", "").split("/")[::-1]
+
+
+def _time_minutes(record: dict) -> int | None:
+    """Minutes past midnight for an HH:MM time, None for All Day, Tentative and other labels."""
+    hours, separator, minutes = record.get("time", "").partition(":")
+    if separator and hours.isdigit() and minutes.isdigit():
+        return int(hours) * 60 + int(minutes)
+    return None
+
+
+def _insert_position(records: list[dict], record: dict) -> int:
+    """Where a new record belongs in calendar order without moving any existing row.
+
+    It goes after the last row of its day with the same or an earlier time. All Day
+    rows go before the day's timed rows, as on the calendar; Tentative and other
+    untimed rows go at the end of the day.
+    """
+    date = _date_key(record)
+    same_day = [index for index, row in enumerate(records) if _date_key(row) == date]
+    if not same_day:
+        return next((index for index, row in enumerate(records) if _date_key(row) > date), len(records))
+    timed = [(index, _time_minutes(records[index])) for index in same_day]
+    timed = [(index, minutes) for index, minutes in timed if minutes is not None]
+    minutes = _time_minutes(record)
+    if minutes is None:
+        if record.get("time") == "All Day" and timed:
+            return timed[0][0]
+        return same_day[-1] + 1
+    earlier = [index for index, row_minutes in timed if row_minutes <= minutes]
+    if earlier:
+        return earlier[-1] + 1
+    if timed:
+        return timed[0][0]
+    return same_day[-1] + 1
+
+
+def merge_records(existing: list[dict], updates: list[dict], replace_dates: Iterable[str] = ()) -> list[dict]:
+    """Replace existing records by event identity in place and insert new ones in calendar order.
+
+    Existing rows on replace_dates are dropped first, so an event that a week or
+    day scrape lists with a new time or impact does not leave its old row behind.
+    """
+    replace_dates = set(replace_dates)
+    merged = [record for record in existing if record.get("date", "") not in replace_dates]
+    positions = {event_identity(record): index for index, record in enumerate(merged)}
+    added = {}
+    for record in updates:
+        identity = event_identity(record)
+        if identity in positions:
+            merged[positions[identity]] = record
+        else:
+            added[identity] = record
+    for record in added.values():
+        merged.insert(_insert_position(merged, record), record)
+    return merged
+
+
+class CsvRecordWriter:
+    def __init__(self, handle) -> None:
+        self.writer = csv.DictWriter(handle, fieldnames=NORMALIZED_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, record: dict) -> None:
+        self.writer.writerow({field: record.get(field, "") for field in NORMALIZED_FIELDS})
+
+    def close(self) -> None:
+        pass
+
+
+class JsonRecordWriter:
+    """Write records one at a time, byte-for-byte like ``json.dump(records, handle, indent=2)``."""
+
+    def __init__(self, handle) -> None:
+        self.handle = handle
+        self.count = 0
+
+    # json.dumps(indent=...) always uses the pure-Python encoder; records are flat, so the
+    # indented layout is assembled here and only the values go through the C string encoder.
+    KEYS = [f"    {json.dumps(field)}: " for field in NORMALIZED_FIELDS]
+
+    def write(self, record: dict) -> None:
+        lines = ",\n".join(
+            key + (encode_basestring_ascii(value) if type(value) is str else json.dumps(value))
+            for key, value in zip(self.KEYS, (record.get(field, "") for field in NORMALIZED_FIELDS))
+        )
+        self.handle.write((",\n  {\n" if self.count else "[\n  {\n") + lines + "\n  }")
+        self.count += 1
+
+    def close(self) -> None:
+        self.handle.write("\n]" if self.count else "[]")
+
+
+def _columnar_writer(file_format: str):
+    def open_writer(handle):
+        # pyarrow is only imported when a columnar format is actually written.
+        from .columnar import COLUMNAR_WRITERS
+
+        return COLUMNAR_WRITERS[file_format](handle)
+
+    return open_writer
+
+
+RECORD_WRITERS = {
+    "csv": CsvRecordWriter,
+    "json": JsonRecordWriter,
+    "parquet": _columnar_writer("parquet"),
+    "arrow": _columnar_writer("arrow"),
+}
 
 
 class OutputStore(ABC):
     @abstractmethod
-    def write(self, records: list[dict], context: ScrapeContext, output_format: str) -> WriteResult:
+    def write(self, records: Iterable[dict], context: ScrapeContext, output_format: str) -> WriteResult:
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release any connection the store holds; file stores hold none."""
+
+    def __enter__(self) -> "OutputStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 class FileOutputStore(OutputStore):
     def __init__(self, output_dir: Path) -> None:
         self.output_dir = output_dir
         self.last_run_dir = self.output_dir / "last_run"
+        self.generations_dir = self.output_dir / LAST_RUN_GENERATIONS_DIR
         self.monthly_dir = self.output_dir / "monthly"
         self.history_dir = self.output_dir / "history"
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.last_run_dir.mkdir(parents=True, exist_ok=True)
         self.monthly_dir.mkdir(parents=True, exist_ok=True)
         self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.bytes_written = 0
+        self._staging_dir = None
+        if not self.last_run_dir.exists():
+            self._publish_generation(self._new_generation())
 
     def begin_run(self, output_format: str) -> None:
+        """Collect this run's last_run files in a new generation that readers cannot see yet."""
+        self._staging_dir = self._new_generation()
+
+    def end_run(self) -> None:
+        """Swap last_run over to the generation the run just filled, in a single rename.
+
+        Until then last_run keeps serving the previous run's complete files. A run that
+        fails before this point leaves them in place.
+        """
+        if self._staging_dir is None:
+            return
+        generation, self._staging_dir = self._staging_dir, None
+        self._publish_generation(generation)
+
+    @property
+    def active_last_run_dir(self) -> Path:
+        """Where last_run files are written: the run's unpublished generation, or last_run itself."""
+        return self._staging_dir or self.last_run_dir
+
+    def _new_generation(self) -> Path:
+        self.generations_dir.mkdir(parents=True, exist_ok=True)
+        generation = self.generations_dir / f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        generation.mkdir()
+        return generation
+
+    def _publish_generation(self, generation: Path) -> None:
+        """Point the last_run symlink at generation in a single rename.
+
+        Readers resolve last_run either to the old generation or the new one, never to a
+        half-written directory. The replaced generation is kept until the next swap, so a
+        reader that resolved it just before the swap can still open its files. Where
+        symlinks are unavailable, last_run stays a plain directory whose files are replaced.
+        """
+        temp_link = temp_path_for(self.last_run_dir)
+        try:
+            os.symlink(Path(LAST_RUN_GENERATIONS_DIR) / generation.name, temp_link, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            self._replace_last_run_files(generation)
+            return
+
+        previous = None
+        try:
+            if self.last_run_dir.is_symlink():
+                previous = Path(os.readlink(self.last_run_dir)).name
+            elif self.last_run_dir.is_dir():
+                # A last_run directory from before generations existed becomes the previous generation.
+                previous = f"legacy-{uuid.uuid4().hex[:8]}"
+                self.last_run_dir.rename(self.generations_dir / previous)
+            os.replace(temp_link, self.last_run_dir)
+        finally:
+            temp_link.unlink(missing_ok=True)
+        fsync_directory(self.output_dir)
+
+        for path in self.generations_dir.iterdir():
+            if path.name not in {generation.name, previous}:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _replace_last_run_files(self, generation: Path) -> None:
+        self.last_run_dir.mkdir(parents=True, exist_ok=True)
+        staged = {path.name for path in generation.iterdir()}
         for path in self.last_run_dir.glob("*"):
-            if path.is_file():
+            if path.is_file() and path.name not in staged:
                 path.unlink()
+        for path in generation.iterdir():
+            os.replace(path, self.last_run_dir / path.name)
+        fsync_directory(self.last_run_dir)
+        shutil.rmtree(generation, ignore_errors=True)
+
+    def write(self, records: Iterable[dict], context: ScrapeContext, output_format: str) -> WriteResult:
+        """Serialize each format once into history and link it into monthly and last_run.
 
-    def write(self, records: list[dict], context: ScrapeContext, output_format: str) -> WriteResult:
+        Records are consumed in a single pass, so they may be a one-shot iterator.
+        """
+        started = time.perf_counter()
+        bytes_before = self.bytes_written
         formats = ["csv", "json"] if output_format == "both" else [output_format]
-        last_run_paths = []
-        monthly_paths = []
-        history_paths = []
-        timestamp = datetime.now().astimezone().strftime("%Y-%m-%dT%H-%M-%S%z")
-        history_month_dir = self.history_dir / context.month_slug
-        history_month_dir.mkdir(parents=True, exist_ok=True)
 
-        for file_format in formats:
-            last_run_path = self.last_run_dir / f"{context.month_slug}.{file_format}"
-            monthly_path = self.monthly_dir / f"{context.month_slug}.{file_format}"
-            history_path = history_month_dir / f"{timestamp}.{file_format}"
+        last_run_paths = [self.last_run_dir / f"{context.month_slug}.{file_format}" for file_format in formats]
+        monthly_paths = [self.monthly_dir / f"{context.month_slug}.{file_format}" for file_format in formats]
+        history_paths, records_written, reused = self._write_history(records, context, formats)
+        for history_path, monthly_path, last_run_path in zip(history_paths, monthly_paths, last_run_paths):
+            self._link_or_copy(history_path, monthly_path)
+            self._link_or_copy(history_path, self.active_last_run_dir / last_run_path.name)
+
+        return WriteResult(
+            last_run_paths=last_run_paths,
+            monthly_paths=monthly_paths,
+            history_paths=history_paths,
+            records_written=records_written,
+            bytes_written=self.bytes_written - bytes_before,
+            write_seconds=time.perf_counter() - started,
+            history_reused=reused,
+        )
 
-            self._write_file(last_run_path, file_format, records)
-            self._write_file(monthly_path, file_format, records)
-            self._write_file(history_path, file_format, records)
+    def merge(self, records: list[dict], context: ScrapeContext, output_format: str) -> WriteResult:
+        """Write a week or day scrape and fold its rows into the monthly files they fall in."""
+        started = time.perf_counter()
+        bytes_before = self.bytes_written
+        formats = ["csv", "json"] if output_format == "both" else [output_format]
 
-            last_run_paths.append(last_run_path)
-            monthly_paths.append(monthly_path)
-            history_paths.append(history_path)
+        last_run_paths = [self.last_run_dir / f"{context.month_slug}.{file_format}" for file_format in formats]
+        history_paths, records_written, reused = self._write_history(records, context, formats)
+        for history_path, last_run_path in zip(history_paths, last_run_paths):
+            self._link_or_copy(history_path, self.active_last_run_dir / last_run_path.name)
+        monthly_paths = self.merge_monthly(records, output_format, replace_dates=covered_dates(context))
 
         return WriteResult(
             last_run_paths=last_run_paths,
             monthly_paths=monthly_paths,
             history_paths=history_paths,
+            records_written=records_written,
+            bytes_written=self.bytes_written - bytes_before,
+            write_seconds=time.perf_counter() - started,
+            history_reused=reused,
         )
 
-    def _write_file(self, path: Path, file_format: str, records: list[dict]) -> None:
-        if file_format == "csv":
-            self._write_csv(path, records)
+    def _write_history(
+        self, records: Iterable[dict], context: ScrapeContext, formats: list[str]
+    ) -> tuple[list[Path], int, bool]:
+        """Write a timestamped history snapshot unless the same content is already stored.
+
+        Every scrape appends one line to the period's manifest.jsonl. When the records
+        (ignoring scraped_at) hash to a snapshot that is already on disk in every
+        requested format, that line points at the existing files and no new file is
+        kept. Returns the snapshot paths, the record count and whether it was reused.
+        """
+        history_period_dir = self.history_dir / context.month_slug
+        history_period_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().astimezone().strftime(HISTORY_TIMESTAMP_FORMAT)
+        history_paths = [history_period_dir / f"{timestamp}.{file_format}" for file_format in formats]
+        suffix = 1
+        while any(path.exists() for path in history_paths):
+            # Two scrapes within one second must not overwrite a snapshot the manifest points at.
+            history_paths = [history_period_dir / f"{timestamp}-{suffix}.{file_format}" for file_format in formats]
+            suffix += 1
+
+        snapshots = {}
+        for entry in read_history_manifest(history_period_dir):
+            if not entry.get("reused"):
+                snapshots.setdefault(entry["digest"], {}).update(entry["files"])
+        digest = hashlib.sha256()
+        existing_paths = []
+
+        def stored_snapshot() -> bool:
+            files = snapshots.get(digest.hexdigest(), {})
+            paths = [history_period_dir / files[file_format] for file_format in formats if file_format in files]
+            if len(paths) == len(formats) and all(path.exists() for path in paths):
+                existing_paths.extend(paths)
+            return bool(existing_paths)
+
+        records_written = self._write_files(
+            list(zip(history_paths, formats)), records, digest=digest, skip_if=stored_snapshot
+        )
+        reused = bool(existing_paths)
+        if reused:
+            history_paths = existing_paths
+        append_history_manifest(
+            history_period_dir,
+            {
+                "written_at": timestamp,
+                "scraped_at": context.scraped_at,
+                "period": context.period,
+                "digest": digest.hexdigest(),
+                "records": records_written,
+                "files": {file_format: path.name for file_format, path in zip(formats, history_paths)},
+                "reused": reused,
+            },
+        )
+        return history_paths, records_written, reused
+
+    def merge_monthly(
+        self, records: list[dict], output_format: str, replace_dates: Iterable[str] = ()
+    ) -> list[Path]:
+        """Update records in place in their monthly files and in any last_run file for the same month.
+
+        Rows already stored on replace_dates are replaced by records, even in months
+        records no longer have any rows for.
+        """
+        replace_dates = list(replace_dates)
+        by_month = {record_month_slug({"date": date}): [] for date in replace_dates}
+        for record in records:
+            slug = record_month_slug(record)
+            if slug:
+                by_month.setdefault(slug, []).append(record)
+
+        monthly_paths = []
+        for slug, month_records in sorted(by_month.items()):
+            existing = self.read_monthly(slug)
+            if not existing and not month_records:
+                continue
+            merged = merge_records(existing, month_records, replace_dates)
+            formats = self._month_formats(slug, output_format)
+            for file_format in formats:
+                monthly_path = self.monthly_dir / f"{slug}.{file_format}"
+                self._write_file(monthly_path, file_format, merged)
+                monthly_paths.append(monthly_path)
+
+            last_run_records = self._read_records(self.active_last_run_dir, slug)
+            if last_run_records:
+                merged = merge_records(last_run_records, month_records, replace_dates)
+                for file_format in formats:
+                    last_run_path = self.active_last_run_dir / f"{slug}.{file_format}"
+                    if last_run_path.exists():
+                        self._write_file(last_run_path, file_format, merged)
+        return monthly_paths
+
+    def replace_monthly(self, slug: str, records: list[dict], output_format: str) -> list[Path]:
+        """Overwrite a month's monthly files, and any last_run files for it, with records."""
+        formats = self._month_formats(slug, output_format)
+        monthly_paths = [self.monthly_dir / f"{slug}.{file_format}" for file_format in formats]
+        self._write_files(list(zip(monthly_paths, formats)), records)
+        for monthly_path in monthly_paths:
+            last_run_path = self.active_last_run_dir / monthly_path.name
+            if last_run_path.exists():
+                self._link_or_copy(monthly_path, last_run_path)
+        return monthly_paths
+
+    def _month_formats(self, slug: str, output_format: str) -> list[str]:
+        """The requested formats plus every other format the month is already stored in.
+
+        Rewriting only some of them would leave the others holding stale rows.
+        """
+        formats = ["csv", "json"] if output_format == "both" else [output_format]
+        existing = [suffix[1:] for suffix in RECORD_SUFFIXES if (self.monthly_dir / f"{slug}{suffix}").exists()]
+        return list(dict.fromkeys([*formats, *existing]))
+
+    def monthly_slugs(self) -> list[str]:
+        return dataset_stems(self.monthly_dir)
+
+    def month_scrape_times(self, slug: str) -> list[str]:
+        """scraped_at of every full scrape of the month, read from its history manifest.
+
+        Week and day merges only touch monthly/, so they never count here. Snapshots
+        written before the manifest existed fall back to their timestamped file names.
+        """
+        history_month_dir = self.history_dir / slug
+        manifest = read_history_manifest(history_month_dir)
+        if manifest:
+            return [entry["scraped_at"] for entry in manifest if entry.get("period", "month") == "month"]
+        times = []
+        for stem in dataset_stems(history_month_dir):
+            try:
+                times.append(datetime.strptime(stem, HISTORY_TIMESTAMP_FORMAT).isoformat())
+            except ValueError:
+                continue
+        return times
+
+    def read_monthly(self, slug: str) -> list[dict]:
+        return self._read_records(self.monthly_dir, slug)
+
+    def _read_records(self, directory: Path, slug: str) -> list[dict]:
+        return read_record_file(directory, slug)
+
+    def _write_file(self, path: Path, file_format: str, records: Iterable[dict]) -> None:
+        self._write_files([(path, file_format)], records)
+
+    def _write_files(
+        self,
+        targets: list[tuple[Path, str]],
+        records: Iterable[dict],
+        digest=None,
+        skip_if=None,
+    ) -> int:
+        """Stream records into every (path, format) target at once and return how many were written.
+
+        Each target is written to a temporary sibling, fsynced and renamed over the final path.
+        Readers therefore see either the old file or the complete new one. A file that is
+        hard-linked from another tier is replaced rather than modified through the link. A
+        target whose bytes would not change is left alone, so its mtime stays put.
+
+        ``digest`` is a hashlib object fed every record's content as it streams past. When
+        ``skip_if()`` returns True after the last record, every temporary file is discarded.
+        """
+        count = 0
+        temp_paths = [temp_path_for(path) for path, _ in targets]
+        unchanged = set()
+        try:
+            with ExitStack() as stack:
+                writers = []
+                handles = []
+                for temp_path, (_, file_format) in zip(temp_paths, targets):
+                    if file_format in BINARY_FORMATS:
+                        handle = stack.enter_context(open(temp_path, "wb"))
+                    else:
+                        handle = stack.enter_context(open(temp_path, "w", newline="", encoding="utf-8"))
+                    handles.append(handle)
+                    writers.append(RECORD_WRITERS[file_format](handle))
+                for record in records:
+                    for writer in writers:
+                        writer.write(record)
+                    if digest is not None:
+                        digest.update(record_digest_key(record))
+                    count += 1
+                for writer, handle in zip(writers, handles):
+                    writer.close()
+                    handle.flush()
+                if skip_if is not None and skip_if():
+                    return count
+                for handle, temp_path, (path, _) in zip(handles, temp_paths, targets):
+                    if same_bytes(temp_path, path):
+                        unchanged.add(path)
+                    else:
+                        os.fsync(handle.fileno())
+            for temp_path, (path, _) in zip(temp_paths, targets):
+                if path in unchanged:
+                    continue
+                self.bytes_written += temp_path.stat().st_size
+                os.replace(temp_path, path)
+            for directory in {path.parent for path, _ in targets if path not in unchanged}:
+                fsync_directory(directory)
+        finally:
+            for temp_path in temp_paths:
+                temp_path.unlink(missing_ok=True)
+        return count
+
+    def _link_or_copy(self, source: Path, target: Path) -> None:
+        """Point target at source's bytes with a hard link, copying only where linking fails.
+
+        A target that already holds the same bytes is not touched.
+        """
+        if same_bytes(source, target):
             return
-        self._write_json(path, records)
-
-    def _write_csv(self, path: Path, records: list[dict]) -> None:
-        with open(path, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=NORMALIZED_FIELDS)
-            writer.writeheader()
-            writer.writerows([{field: row.get(field, "") for field in NORMALIZED_FIELDS} for row in records])
-
-    def _write_json(self, path: Path, records: list[dict]) -> None:
-        payload = [{field: row.get(field, "") for field in NORMALIZED_FIELDS} for row in records]
-        with open(path, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+        temp_path = temp_path_for(target)
+        try:
+            try:
+                os.link(source, temp_path)
+            except OSError:
+                shutil.copyfile(source, temp_path)
+                with open(temp_path, "rb") as handle:
+                    os.fsync(handle.fileno())
+                self.bytes_written += temp_path.stat().st_size
+            os.replace(temp_path, target)
+            fsync_directory(target.parent)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+def build_store(options) -> OutputStore:
+    """Output store selected by the run options' ``storage`` setting."""
+    if options.storage == "sqlite":
+        from .sqlite_store import SqliteOutputStore
+
+        return SqliteOutputStore(options.sqlite_path)
+    if options.storage != "file":
+        raise ValueError(f"Unknown storage backend '{options.storage}', expected file or sqlite")
+    return FileOutputStore(options.output_dir)
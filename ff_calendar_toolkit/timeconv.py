@@ -0,0 +1,110 @@
+"""Cached timezone lookups and calendar time parsing shared by normalize and alerts.
+
+Zone objects are memoized for the life of the process and individual
+conversions in a bounded LRU, because a month of rows repeats the same few
+dates and release times over and over. Localization still goes through
+``pytz`` ``localize`` so DST handling is unchanged.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import pytz
+
+CONVERSION_CACHE_SIZE = 8192
+UNTIMED_LABELS = {"all day", "tentative"}
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str):
+    return pytz.timezone(name)
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def convert_with_utc(
+    date_str: str,
+    time_str: str,
+    from_zone_str: str | None,
+    to_zone_str: str | None,
+) -> tuple[str, datetime | None]:
+    """Convert a calendar ``9:30am`` time on a ``dd/mm/yyyy`` date to ``HH:MM`` and its UTC instant.
+
+    Times that cannot be converted (missing or unknown zones, ``All Day``,
+    unparseable labels) are returned unchanged with no instant.
+    """
+    try:
+        from_zone = get_zone(from_zone_str) if from_zone_str else None
+        to_zone = get_zone(to_zone_str) if to_zone_str else None
+    except Exception:
+        return time_str, None
+    return convert_with_instant(date_str, time_str, from_zone, to_zone)
+
+
+def convert_time(
+    date_str: str,
+    time_str: str,
+    from_zone_str: str | None,
+    to_zone_str: str | None,
+) -> str:
+    """The ``HH:MM`` half of convert_with_utc."""
+    return convert_with_utc(date_str, time_str, from_zone_str, to_zone_str)[0]
+
+
+def convert_times(
+    pairs: list[tuple[str, str]],
+    from_zone_str: str | None,
+    to_zone_str: str | None,
+) -> list[str]:
+    """Convert a month's worth of (date, time) pairs."""
+    return [time_str for time_str, _ in convert_batch(pairs, from_zone_str, to_zone_str)]
+
+
+def convert_batch(
+    pairs: list[tuple[str, str]],
+    from_zone_str: str | None,
+    to_zone_str: str | None,
+) -> list[tuple[str, datetime | None]]:
+    """Like convert_times, but also return each row's UTC instant (None when it has no exact time)."""
+    convert = batch_converter(from_zone_str, to_zone_str)
+    return [convert(date_str, time_str) for date_str, time_str in pairs]
+
+
+def batch_converter(from_zone_str: str | None, to_zone_str: str | None):
+    """Return convert(date, time) -> (time, utc_instant) for one pair of zones."""
+
+    def convert(date_str: str, time_str: str) -> tuple[str, datetime | None]:
+        return convert_with_utc(date_str, time_str, from_zone_str, to_zone_str)
+
+    return convert
+
+
+def convert_with_instant(date_str: str, time_str: str, from_zone, to_zone) -> tuple[str, datetime | None]:
+    if not time_str or not date_str or from_zone is None or time_str.lower() in UNTIMED_LABELS:
+        return time_str, None
+    try:
+        naive_dt = datetime.strptime(f"{date_str} {time_str}", "%d/%m/%Y %I:%M%p")
+    except ValueError:
+        return time_str, None
+    localized_dt = from_zone.localize(naive_dt)
+    converted = localized_dt.astimezone(to_zone).strftime("%H:%M") if to_zone is not None else time_str
+    return converted, localized_dt.astimezone(timezone.utc)
+
+
+def utc_fields(instant: datetime | None) -> tuple[str, int | str]:
+    """ISO string and epoch seconds stored as event_time_utc / event_timestamp_utc."""
+    if instant is None:
+        return "", ""
+    return instant.isoformat(), int(instant.timestamp())
+
+
+def from_timestamp(timestamp, zone_str: str | None) -> datetime:
+    """Instant from a stored epoch, expressed in the record timezone when it has one."""
+    instant = datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
+    return instant.astimezone(get_zone(zone_str)) if zone_str else instant
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def parse_local_time(date_str: str, time_str: str, zone_str: str) -> datetime:
+    """Localize a stored ``dd/mm/yyyy`` date and ``HH:MM`` time in its record timezone."""
+    naive = datetime.strptime(f"{date_str} {time_str}", "%d/%m/%Y %H:%M")
+    return get_zone(zone_str).localize(naive)
@@ -1,4 +1,3 @@
-import json
 import os
 from pathlib import Path
 from types import SimpleNamespace
@@ -17,32 +16,38 @@ from ff_calendar_toolkit.runtime import (
     load_env_file,
     resolve_config_path,
 )
+from ff_calendar_toolkit.sqlite_store import read_events, read_month_slugs
+from ff_calendar_toolkit.storage import latest_scrape_times, read_record_path
 
 
 WEEKDAY_OPTIONS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
 
+VIEWER_SUFFIXES = (".json", ".parquet", ".arrow")
+COLUMNAR_SUFFIXES = (".parquet", ".arrow")
+
+
+def _dataset_files(directory: Path, recursive: bool = False) -> list[Path]:
+    paths = directory.rglob("*") if recursive else directory.glob("*")
+    return sorted(path for path in paths if path.suffix in VIEWER_SUFFIXES)
+
+
 def _load_default_file(output_dir: Path) -> Path | None:
-    last_run_files = sorted((output_dir / "last_run").glob("*.json"))
+    last_run_files = _dataset_files(output_dir / "last_run")
     if last_run_files:
         return last_run_files[-1]
 
-    history_files = sorted((output_dir / "history").rglob("*.json"))
+    history_files = _dataset_files(output_dir / "history", recursive=True)
     if history_files:
         return history_files[-1]
 
-    monthly_files = sorted((output_dir / "monthly").glob("*.json"))
+    monthly_files = _dataset_files(output_dir / "monthly")
     if monthly_files:
         return monthly_files[-1]
 
     return None
 
 
-def _load_records(path: Path) -> list[dict]:
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
 def _view_context():
     config_path = resolve_config_path(os.getenv("FF_CONFIG_PATH"))
     load_env_file(config_path)
@@ -74,41 +79,69 @@ def _save_config_text(config_path: Path, content: str) -> None:
         yaml.safe_dump(parsed, handle, sort_keys=False)
 
 
-def _render_data_browser(output_dir: Path) -> list[dict]:
+def _database_records(sqlite_path: Path) -> list[dict] | None:
+    months = read_month_slugs(sqlite_path)
+    if not months:
+        st.warning(f"No events found in {sqlite_path}. Run the scraper first.")
+        return None
+    selected = st.sidebar.selectbox("Month", options=months, index=len(months) - 1)
+    return read_events(sqlite_path, month=selected)
+
+
+def _render_data_browser(output_dir: Path, sqlite_path: Path | None = None) -> list[dict]:
+    if sqlite_path is not None:
+        records = _database_records(sqlite_path)
+        if records is None:
+            return []
+        return _render_records(records)
+
     default_path = _load_default_file(output_dir)
     if default_path is None:
-        st.warning(f"No JSON data found in {output_dir}. Run the scraper first.")
+        st.warning(f"No JSON, Parquet or Arrow data found in {output_dir}. Run the scraper first.")
         return []
 
-    json_files = (
-        sorted((output_dir / "last_run").glob("*.json"))
-        + sorted((output_dir / "monthly").glob("*.json"))
-        + sorted((output_dir / "history").rglob("*.json"))
+    dataset_files = (
+        _dataset_files(output_dir / "last_run")
+        + _dataset_files(output_dir / "monthly")
+        + _dataset_files(output_dir / "history", recursive=True)
     )
     selected = st.sidebar.selectbox(
         "Dataset",
-        options=json_files,
-        index=json_files.index(default_path),
+        options=dataset_files,
+        index=dataset_files.index(default_path),
         format_func=lambda path: str(path.relative_to(output_dir)),
     )
+    if selected.parent.name in ("last_run", "monthly"):
+        # Rows keep the scraped_at of the first identical scrape; the manifest has the latest.
+        scraped_at = latest_scrape_times(output_dir).get(selected.stem)
+        if scraped_at:
+            st.caption(f"Last scraped at {scraped_at}")
+
+    if selected.suffix in COLUMNAR_SUFFIXES:
+        return _render_columnar(selected)
+    return _render_records(read_record_path(selected))
+
+
+def _render_empty() -> list[dict]:
+    st.info("The selected dataset is empty.")
+    st.dataframe(pd.DataFrame(columns=NORMALIZED_FIELDS), use_container_width=True)
+    return []
+
 
-    records = _load_records(selected)
+def _filter_pickers(df: pd.DataFrame) -> tuple[list[str], list[str]]:
+    currency_options = sorted(df["currency"].dropna().unique())
+    impact_options = sorted(df["impact"].dropna().unique())
+    currencies = st.sidebar.multiselect("Currencies", options=currency_options, default=currency_options)
+    impacts = st.sidebar.multiselect("Impact", options=impact_options, default=impact_options)
+    return currencies, impacts
+
+
+def _render_records(records: list[dict]) -> list[dict]:
     if not records:
-        st.info("The selected dataset is empty.")
-        st.dataframe(pd.DataFrame(columns=NORMALIZED_FIELDS), use_container_width=True)
-        return []
+        return _render_empty()
 
     df = pd.DataFrame(records, columns=NORMALIZED_FIELDS)
-    currencies = st.sidebar.multiselect(
-        "Currencies",
-        options=sorted(df["currency"].dropna().unique()),
-        default=sorted(df["currency"].dropna().unique()),
-    )
-    impacts = st.sidebar.multiselect(
-        "Impact",
-        options=sorted(df["impact"].dropna().unique()),
-        default=sorted(df["impact"].dropna().unique()),
-    )
+    currencies, impacts = _filter_pickers(df)
 
     filtered = df[df["currency"].isin(currencies) & df["impact"].isin(impacts)]
     st.metric("Rows", len(filtered))
@@ -116,6 +149,25 @@ def _render_data_browser(output_dir: Path) -> list[dict]:
     return records
 
 
+def _render_columnar(path: Path) -> list[dict]:
+    from ff_calendar_toolkit.columnar import read_columnar_table
+
+    # Only the two filter columns are read to build the pickers; the full rows are then
+    # read with the picks pushed down, so unselected currencies are never decoded.
+    vocabulary = read_columnar_table(path, columns=["currency", "impact"]).to_pandas()
+    if vocabulary.empty:
+        return _render_empty()
+
+    currencies, impacts = _filter_pickers(vocabulary)
+    if currencies and impacts:
+        filtered = read_columnar_table(path, currencies=currencies, impacts=impacts).to_pandas()
+    else:
+        filtered = pd.DataFrame(columns=NORMALIZED_FIELDS)
+    st.metric("Rows", len(filtered))
+    st.dataframe(filtered, use_container_width=True)
+    return vocabulary.to_dict("records")
+
+
 def _render_rules_tab(alert_options, records: list[dict]) -> None:
     st.subheader("Rules")
     rules_dir = alert_options.rules_dir
@@ -278,7 +330,7 @@ def main() -> None:
     )
 
     with data_tab:
-        records = _render_data_browser(view_options.output_dir)
+        records = _render_data_browser(view_options.output_dir, view_options.sqlite_path)
     with rules_tab:
         _render_rules_tab(alert_options, records)
     with config_tab:
@@ -0,0 +1,61 @@
+"""Process-pool helpers for scraping several months in parallel."""
+
+import os
+from multiprocessing import util
+
+from .console import AppConsole
+from .metrics import RunMetrics
+from .models import RunOptions, ScrapeContext
+
+_worker_scraper = None
+
+
+def available_memory_bytes() -> int | None:
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def effective_worker_count(
+    requested: int,
+    month_count: int,
+    memory_per_worker_mb: int,
+    available_bytes: int | None = None,
+    cpu_count: int | None = None,
+) -> int:
+    workers = min(max(1, requested), max(1, month_count))
+    cpus = cpu_count if cpu_count is not None else os.cpu_count()
+    if cpus:
+        workers = min(workers, cpus)
+    if available_bytes is not None and memory_per_worker_mb > 0:
+        workers = min(workers, max(1, available_bytes // (memory_per_worker_mb * 1024 * 1024)))
+    return workers
+
+
+def init_worker(options: RunOptions) -> None:
+    """Start one scraper session per worker process and close it when the worker exits."""
+    global _worker_scraper
+    from .service import build_scraper
+
+    _worker_scraper = build_scraper(AppConsole(), options)
+    session = _worker_scraper.session()
+    session.__enter__()
+    util.Finalize(_worker_scraper, session.__exit__, args=(None, None, None), exitpriority=10)
+
+
+def scrape_month_in_worker(
+    month: str, target_timezone: str | None
+) -> tuple[list[dict], ScrapeContext, RunMetrics]:
+    """Scrape one month and hand back the timings recorded for it alongside the rows."""
+    _worker_scraper.metrics = RunMetrics()
+    _worker_scraper.console.step(f"Worker {os.getpid()} scraping month selector '{month}'")
+    raw_rows, context = _worker_scraper.scrape_month(month, target_timezone)
+    return raw_rows, context, _worker_scraper.metrics
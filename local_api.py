@@ -15,6 +15,10 @@ from ff_calendar_toolkit.runtime import (
     load_env_file,
     resolve_config_path,
 )
+from ff_calendar_toolkit.storage import latest_scrape_times, record_month_slug
+
+
+DATASET_SUFFIXES = (".json", ".parquet", ".arrow")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -66,12 +70,13 @@ def build_app(config_value: str | None = None) -> FastAPI:
     def datasets():
         output_dir = context["view_options"].output_dir
         return {
-            "last_run": [path.name for path in sorted((output_dir / "last_run").glob("*.json"))],
-            "monthly": [path.name for path in sorted((output_dir / "monthly").glob("*.json"))],
+            "last_run": [path.name for path in _dataset_files(output_dir / "last_run", "*")],
+            "monthly": [path.name for path in _dataset_files(output_dir / "monthly", "*")],
             "history": [
                 str(path.relative_to(output_dir))
-                for path in sorted((output_dir / "history").rglob("*.json"))
+                for path in _dataset_files(output_dir / "history", "**/*")
             ],
+            "scraped_at": latest_scrape_times(output_dir),
         }
 
     @app.get("/events")
@@ -83,21 +88,18 @@ def build_app(config_value: str | None = None) -> FastAPI:
         month: str | None = None,
         limit: int = Query(default=100, ge=1, le=5000),
     ):
-        filtered = _upcoming_events(context["view_options"].output_dir, 5000)
+        filtered = _upcoming_events(
+            context["view_options"],
+            5000,
+            currencies=[currency] if currency else None,
+            impacts=[impact] if impact else None,
+        )
         if month:
             filtered = [
                 event
                 for event in filtered
                 if event.get("date", "").endswith(f"/{month[5:7]}/{month[:4]}")
             ]
-        if currency:
-            filtered = [
-                event for event in filtered if event.get("currency", "").upper() == currency.upper()
-            ]
-        if impact:
-            filtered = [
-                event for event in filtered if event.get("impact", "").lower() == impact.lower()
-            ]
         if keyword:
             filtered = [
                 event for event in filtered if keyword.lower() in event.get("event", "").lower()
@@ -108,7 +110,7 @@ def build_app(config_value: str | None = None) -> FastAPI:
 
     @app.get("/events/upcoming")
     def events_upcoming(limit: int = Query(default=20, ge=1, le=5000)):
-        return _upcoming_events(context["view_options"].output_dir, limit)
+        return _upcoming_events(context["view_options"], limit)
 
     @app.get("/alerts/preview")
     def alerts_preview():
@@ -133,10 +135,22 @@ def build_app(config_value: str | None = None) -> FastAPI:
     return app
 
 
-def _upcoming_events(output_dir: Path, limit: int) -> list[dict]:
+def _dataset_files(directory: Path, pattern: str) -> list[Path]:
+    return sorted(path for path in directory.glob(pattern) if path.suffix in DATASET_SUFFIXES)
+
+
+def _upcoming_events(view_options, limit: int, currencies=None, impacts=None) -> list[dict]:
+    # Stored currencies are upper-case codes and impacts lower-case colors, so the
+    # filters can match exactly (and be pushed into SQL or Parquet) once cased the same.
+    currencies = [value.upper() for value in currencies] if currencies else None
+    impacts = [value.lower() for value in impacts] if impacts else None
+    # Unchanged file store scrapes only reach the history manifests, so report their time.
+    scrape_times = {} if view_options.sqlite_path else latest_scrape_times(view_options.output_dir)
     events = []
-    for event in load_alert_events(output_dir):
-        payload = dict(event.payload)
+    for event in load_alert_events(view_options.output_dir, view_options.sqlite_path, currencies, impacts):
+        payload = event.payload.to_dict()
+        month_scraped_at = scrape_times.get(record_month_slug(payload), "")
+        payload["scraped_at"] = max(payload.get("scraped_at", ""), month_scraped_at)
         payload["event_time"] = event.event_time.isoformat()
         payload["event_id"] = event.event_id
         events.append(payload)
@@ -0,0 +1,146 @@
+import json
+import tempfile
+import unittest
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from ff_calendar_toolkit.actuals import LATENCY_LOG_NAME, ActualsWatcher, day_selector, watched_events
+from ff_calendar_toolkit.alerts.models import AlertEvent
+from ff_calendar_toolkit.models import ActualsOptions
+from ff_calendar_toolkit.periods import month_context
+from ff_calendar_toolkit.runtime import build_run_options
+from ff_calendar_toolkit.storage import FileOutputStore
+
+RELEASE = datetime(2026, 4, 3, 12, 30, tzinfo=timezone.utc)
+
+
+class SilentConsole:
+    def step(self, message):
+        pass
+
+    def warn(self, message):
+        pass
+
+    def success(self, message):
+        pass
+
+
+class Args:
+    config = None
+    months = None
+    output_format = None
+    output_dir = None
+    timezone = None
+    currencies = None
+    impacts = None
+    show_browser = False
+
+
+class FakeDayScraper:
+    """Serves the day view, publishing the actual on the second poll; the first ``failures`` polls raise."""
+
+    def __init__(self, failures=0):
+        self.calls = []
+        self.failures = failures
+
+    @contextmanager
+    def session(self):
+        yield self
+
+    def scrape_month(self, selector, target_timezone):
+        self.calls.append(selector)
+        if len(self.calls) <= self.failures:
+            raise TimeoutError("day view timed out")
+        actual = "250K" if len(self.calls) > 1 else "empty"
+        rows = [
+            {"date": "Fri Apr 3", "time": "12:30pm", "currency": "USD", "impact": "red", "event": "NFP", "actual": actual},
+        ]
+        return rows, month_context(selector, "UTC", target_timezone)
+
+
+def _record(actual=""):
+    return {
+        "time": "12:30",
+        "timezone": "UTC",
+        "currency": "USD",
+        "impact": "red",
+        "event": "NFP",
+        "detail": "",
+        "actual": actual,
+        "forecast": "",
+        "previous": "",
+        "day": "Fri",
+        "date": "03/04/2026",
+        "scraped_at": "",
+    }
+
+
+class ActualsWatchTests(unittest.TestCase):
+    def test_watch_window_skips_released_and_distant_events(self):
+        def event(minutes, actual="", impact="red"):
+            payload = {"actual": actual, "impact": impact}
+            return AlertEvent(f"e{minutes}{actual}{impact}", RELEASE + timedelta(minutes=minutes), payload)
+
+        events = [event(-30), event(-5), event(-5, actual="1.2"), event(3), event(3, impact="orange"), event(20)]
+
+        watched = watched_events(events, RELEASE, ["red"], 5, 15)
+
+        self.assertEqual([item.event_id for item in watched], ["e-5red", "e3red"])
+        self.assertEqual(day_selector(events[0], "America/New_York"), "day:2026-04-03")
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        tmp_path = Path(self.temp_dir.name)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            "output_dir: news\nstate_dir: state\ntimezone: UTC\nengine: http\nsource_timezone: UTC\n",
+            encoding="utf-8",
+        )
+        args = Args()
+        args.config = str(config_path)
+        self.run_options = build_run_options(args)
+        store = FileOutputStore(self.run_options.output_dir)
+        store.write([_record()], month_context("2026-04", "UTC", "UTC"), "both")
+        self.options = ActualsOptions(
+            run=self.run_options, impacts=["red"], lookahead_minutes=5, give_up_minutes=15, poll_seconds=10
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _watch(self, scraper):
+        now = [RELEASE + timedelta(seconds=2)]
+        watcher = ActualsWatcher(
+            SilentConsole(),
+            clock=lambda: now[0],
+            sleep=lambda seconds: now.__setitem__(0, now[0] + timedelta(seconds=seconds)),
+        )
+        with patch("ff_calendar_toolkit.actuals.build_scraper", return_value=scraper):
+            watcher.run(self.options)
+
+    def _monthly_actuals(self):
+        path = self.run_options.output_dir / "monthly" / "2026-04.json"
+        return [row["actual"] for row in json.loads(path.read_text(encoding="utf-8"))]
+
+    def test_actual_is_merged_in_place_and_latency_logged(self):
+        scraper = FakeDayScraper()
+        self._watch(scraper)
+
+        self.assertEqual(scraper.calls, ["day:2026-04-03", "day:2026-04-03"])
+        self.assertEqual(self._monthly_actuals(), ["250K"])
+        log_path = self.run_options.state_dir / "actuals" / LATENCY_LOG_NAME
+        entry = json.loads(log_path.read_text(encoding="utf-8").splitlines()[0])
+        self.assertEqual(entry["latency_seconds"], 12.0)
+
+    def test_failed_poll_is_retried_on_the_next_tick(self):
+        scraper = FakeDayScraper(failures=1)
+        self._watch(scraper)
+
+        self.assertEqual(scraper.calls, ["day:2026-04-03", "day:2026-04-03"])
+        self.assertEqual(self._monthly_actuals(), ["250K"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from ff_calendar_toolkit.backfill import BackfillCheckpoint, BackfillService, month_is_complete
+from ff_calendar_toolkit.models import BackfillOptions, ScrapeContext
+from ff_calendar_toolkit.periods import month_context
+from ff_calendar_toolkit.runtime import build_run_options
+from ff_calendar_toolkit.storage import FileOutputStore
+
+
+class SilentConsole:
+    def step(self, message):
+        pass
+
+    def success(self, message):
+        pass
+
+
+class Args:
+    config = None
+    months = None
+    output_format = "json"
+    output_dir = None
+    timezone = None
+    currencies = None
+    impacts = None
+    show_browser = False
+
+
+class RecordingScrapeService:
+    def __init__(self, fail_after=None):
+        self.requested = []
+        self.fail_after = fail_after
+
+    def run(self, options, on_month_written=None):
+        self.requested.append(list(options.months))
+        for index, month in enumerate(options.months):
+            if self.fail_after is not None and index == self.fail_after:
+                raise RuntimeError("browser crashed")
+            on_month_written(month_context(month, "UTC", "UTC"), [{}])
+        return 0
+
+
+class BackfillTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        tmp_path = Path(self.temp_dir.name)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("output_dir: news\nstate_dir: state\n", encoding="utf-8")
+        args = Args()
+        args.config = str(config_path)
+        self.run_options = build_run_options(args)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _options(self, force=False):
+        return BackfillOptions(run=self.run_options, start="2022-11", end="2023-02", force=force)
+
+    def test_interrupted_backfill_resumes_after_last_checkpointed_month(self):
+        crashing = RecordingScrapeService(fail_after=2)
+        with self.assertRaises(RuntimeError):
+            BackfillService(SilentConsole(), crashing).run(self._options())
+
+        resumed = RecordingScrapeService()
+        BackfillService(SilentConsole(), resumed).run(self._options())
+
+        self.assertEqual(crashing.requested, [["2022-11", "2022-12", "2023-01", "2023-02"]])
+        self.assertEqual(resumed.requested, [["2023-01", "2023-02"]])
+        completed = BackfillCheckpoint(self.run_options.state_dir).load()["completed"]
+        self.assertEqual(sorted(completed), ["2022-11", "2022-12", "2023-01", "2023-02"])
+
+    def test_months_with_complete_monthly_data_are_skipped(self):
+        store = FileOutputStore(self.run_options.output_dir)
+        store.write(
+            [{"date": "05/12/2022", "scraped_at": "2023-01-02T00:00:00+00:00"}],
+            replace(month_context("2022-12", "UTC", "UTC"), scraped_at="2023-01-02T00:00:00+00:00"),
+            "json",
+        )
+        store.write(
+            [{"date": "05/01/2023", "scraped_at": "2023-01-20T00:00:00+00:00"}],
+            replace(month_context("2023-01", "UTC", "UTC"), scraped_at="2023-01-20T00:00:00+00:00"),
+            "json",
+        )
+        scrape_service = RecordingScrapeService()
+
+        BackfillService(SilentConsole(), scrape_service).run(self._options())
+
+        self.assertEqual(scrape_service.requested, [["2022-11", "2023-01", "2023-02"]])
+
+    def test_week_merge_into_the_previous_month_does_not_complete_it(self):
+        store = FileOutputStore(self.run_options.output_dir)
+        store.merge(
+            [{"date": "30/03/2026", "event": "Retail Sales", "scraped_at": "2026-04-04T00:00:00+00:00"}],
+            ScrapeContext(
+                "week:this", "", "week-2026-03-29", "2026", "UTC", "UTC", "2026-04-04T00:00:00+00:00", period="week"
+            ),
+            "json",
+        )
+
+        self.assertEqual(len(store.read_monthly("2026-03")), 1)
+        self.assertFalse(month_is_complete(store, "2026-03"))
+
+        store.write(
+            [{"date": "30/03/2026", "event": "Retail Sales", "scraped_at": "2026-04-02T00:00:00+00:00"}],
+            replace(month_context("2026-03", "UTC", "UTC"), scraped_at="2026-04-02T00:00:00+00:00"),
+            "json",
+        )
+        self.assertTrue(month_is_complete(store, "2026-03"))
+
+    def test_force_rescrapes_checkpointed_months(self):
+        BackfillService(SilentConsole(), RecordingScrapeService()).run(self._options())
+        scrape_service = RecordingScrapeService()
+
+        BackfillService(SilentConsole(), scrape_service).run(self._options(force=True))
+
+        self.assertEqual(scrape_service.requested, [["2022-11", "2022-12", "2023-01", "2023-02"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
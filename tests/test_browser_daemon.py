@@ -0,0 +1,80 @@
+import json
+import os
+import socket
+import tempfile
+import unittest
+from pathlib import Path
+
+from ff_calendar_toolkit.browser_daemon import (
+    BrowserDaemon,
+    acquire_lease,
+    daemon_endpoint,
+    process_tree_rss_bytes,
+    record_page,
+    release_lease,
+)
+
+
+class SilentConsole:
+    def step(self, message):
+        pass
+
+
+
+class BrowserDaemonTests(unittest.TestCase):
+    def test_endpoint_is_none_without_a_live_daemon(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_dir = Path(temp_dir)
+            self.assertIsNone(daemon_endpoint(state_dir))
+
+            (state_dir / "browser").mkdir()
+            (state_dir / "browser" / "endpoint.json").write_text(
+                json.dumps({"debugger_address": "127.0.0.1:1"}), encoding="utf-8"
+            )
+            self.assertIsNone(daemon_endpoint(state_dir, timeout_seconds=0.2))
+
+    def test_leases_and_page_counts_drive_recycling(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_dir = Path(temp_dir)
+            daemon = BrowserDaemon(SilentConsole(), state_dir, port=9222, max_pages=2, max_memory_mb=0)
+            lease = acquire_lease(state_dir)
+            record_page(state_dir)
+            record_page(state_dir)
+
+            self.assertEqual(daemon._page_count(), 2)
+            self.assertEqual(daemon._active_leases(), [lease])
+
+            release_lease(lease)
+            self.assertEqual(daemon._active_leases(), [])
+
+    def test_endpoint_is_only_published_after_chrome_answers(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_dir = Path(temp_dir)
+            silent_chrome = state_dir / "chrome"
+            silent_chrome.write_text("#!/bin/sh\nexec sleep 30\n", encoding="utf-8")
+            silent_chrome.chmod(0o755)
+            with socket.socket() as probe:
+                probe.bind(("127.0.0.1", 0))
+                port = probe.getsockname()[1]
+            daemon = BrowserDaemon(
+                SilentConsole(), state_dir, port=port, max_pages=0, max_memory_mb=0, startup_timeout_seconds=0.5
+            )
+
+            daemon.directory.mkdir(parents=True)
+            daemon.endpoint_path.write_text(json.dumps({"debugger_address": "127.0.0.1:1"}), encoding="utf-8")
+
+            with self.assertRaises(RuntimeError):
+                daemon._start(str(silent_chrome))
+
+            self.assertIsNone(daemon._process)
+            self.assertFalse((state_dir / "browser" / "endpoint.json").exists())
+
+    def test_process_tree_rss_includes_current_process(self):
+        rss = process_tree_rss_bytes(os.getpid())
+        if rss is None:
+            self.skipTest("/proc is not available")
+        self.assertGreater(rss, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
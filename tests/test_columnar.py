@@ -0,0 +1,126 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ff_calendar_toolkit.alerts.events import load_alert_events
+from ff_calendar_toolkit.columnar import ROW_GROUP_SIZE, read_columnar, read_columnar_table
+from ff_calendar_toolkit.config import NORMALIZED_FIELDS
+from ff_calendar_toolkit.models import ScrapeContext
+from ff_calendar_toolkit.storage import FileOutputStore, read_record_file
+
+
+def _record(index, currency="USD", impact="red", timestamp=None):
+    return {
+        "time": "08:30" if timestamp else "All Day",
+        "currency": currency,
+        "impact": impact,
+        "event": f"Event {index}",
+        "date": "02/04/2026",
+        "event_timestamp_utc": timestamp if timestamp else "",
+    }
+
+
+class ColumnarFormatTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.store = FileOutputStore(self.output_dir)
+        self.context = ScrapeContext(
+            "april", "April", "2026-04", "2026", "UTC", "UTC", "2026-04-19T00:00:00+00:00"
+        )
+        self.records = [
+            _record(0, timestamp=1775118600),
+            _record(1, currency="EUR", impact="orange", timestamp=1775122200),
+            _record(2, impact="gray"),
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parquet_and_arrow_round_trip_like_json(self):
+        for file_format in ["json", "parquet", "arrow"]:
+            self.store.write(self.records, self.context, file_format)
+
+        expected = json.loads((self.output_dir / "monthly" / "2026-04.json").read_text(encoding="utf-8"))
+        for suffix in [".parquet", ".arrow"]:
+            path = self.output_dir / "monthly" / f"2026-04{suffix}"
+            self.assertTrue((self.output_dir / "last_run" / path.name).exists())
+            self.assertEqual(read_columnar(path), expected)
+
+    def test_arrow_projection_does_not_load_unselected_columns(self):
+        records = [{**_record(index, timestamp=1775118600), "event": f"Event {index} " * 20} for index in range(5000)]
+        self.store.write(records, self.context, "arrow")
+        path = self.output_dir / "monthly" / "2026-04.arrow"
+
+        allocated = pa.total_allocated_bytes()
+        table = read_columnar_table(path, columns=["currency"])
+
+        self.assertEqual(table.num_rows, 5000)
+        self.assertLess(pa.total_allocated_bytes() - allocated, path.stat().st_size // 10)
+
+    def test_schema_dictionary_encodes_vocabularies_and_types_the_timestamp(self):
+        self.store.write(self.records, self.context, "parquet")
+        schema = read_columnar_table(self.output_dir / "monthly" / "2026-04.parquet").schema
+
+        for field in ["currency", "impact", "day", "timezone"]:
+            self.assertTrue(pa.types.is_dictionary(schema.field(field).type), field)
+        self.assertTrue(pa.types.is_timestamp(schema.field("event_timestamp_utc").type))
+        self.assertEqual(schema.field("event_timestamp_utc").type.tz, "UTC")
+
+    def test_readers_project_columns_and_push_down_filters(self):
+        for file_format in ["parquet", "arrow"]:
+            self.store.write(self.records, self.context, file_format)
+            path = self.output_dir / "monthly" / f"2026-04.{file_format}"
+
+            table = read_columnar_table(path, columns=["event", "currency"], currencies=["USD"])
+            self.assertEqual(table.column_names, ["event", "currency"])
+            self.assertEqual(table.column("event").to_pylist(), ["Event 0", "Event 2"])
+            self.assertEqual(
+                [row["event"] for row in read_columnar(path, impacts=["orange", "gray"])], ["Event 1", "Event 2"]
+            )
+            self.assertEqual([row["event"] for row in read_columnar(path, start=1775118601)], ["Event 1"])
+
+    def test_large_months_are_written_in_several_batches(self):
+        records = [_record(index, timestamp=1775118600 + index) for index in range(ROW_GROUP_SIZE + 10)]
+        self.store.write(records, self.context, "parquet")
+        expected = [{field: record.get(field, "") for field in NORMALIZED_FIELDS} for record in records]
+        self.assertEqual(read_record_file(self.output_dir / "monthly", "2026-04"), expected)
+
+    def test_parquet_filters_skip_row_groups_ruled_out_by_statistics(self):
+        records = [_record(index, timestamp=1775118600) for index in range(ROW_GROUP_SIZE)]
+        records += [_record(index, currency="EUR", timestamp=1775200000) for index in range(10)]
+        self.store.write(records, self.context, "parquet")
+        path = self.output_dir / "monthly" / "2026-04.parquet"
+
+        original = pq.ParquetFile.read_row_groups
+        with patch.object(pq.ParquetFile, "read_row_groups", autospec=True, side_effect=original) as read:
+            self.assertEqual(len(read_columnar_table(path, currencies=["EUR"])), 10)
+            self.assertEqual(len(read_columnar_table(path, end=1775118600)), 0)
+        self.assertEqual(read.call_args_list[0].args[1], [1])
+        self.assertEqual(read.call_args_list[1].args[1], [])
+
+    def test_newest_format_wins_and_merges_and_alerts_read_columnar_files(self):
+        self.store.write(self.records[:1], self.context, "json")
+        stale = self.output_dir / "monthly" / "2026-04.json"
+        os.utime(stale, (1, 1))
+        self.store.write(self.records, self.context, "parquet")
+        self.assertEqual(len(read_record_file(self.output_dir / "monthly", "2026-04")), 3)
+
+        updated = dict(self.records[0], actual="0.4%")
+        self.store.merge_monthly([updated], "parquet")
+        stored = read_record_file(self.output_dir / "monthly", "2026-04")
+        self.assertEqual(stored[0]["actual"], "0.4%")
+        self.assertEqual(len(stored), 3)
+
+        events = load_alert_events(self.output_dir, currencies=["EUR"])
+        self.assertEqual([event.payload["event"] for event in events], ["Event 1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
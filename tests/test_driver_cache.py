@@ -0,0 +1,30 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from ff_calendar_toolkit.driver_cache import DriverCache
+
+
+class DriverCacheTests(unittest.TestCase):
+    def test_cached_path_is_reused_only_for_the_same_chrome_version(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_dir = Path(temp_dir)
+            driver_path = state_dir / "chromedriver"
+            driver_path.write_text("", encoding="utf-8")
+            cache = DriverCache(state_dir)
+
+            cache.save("120.0.6099.109", str(driver_path), "webdriver-manager")
+
+            self.assertEqual(cache.lookup("120.0.6099.109"), str(driver_path))
+            self.assertIsNone(cache.lookup("121.0.6167.85"))
+            self.assertIsNone(cache.lookup(None))
+
+    def test_missing_driver_binary_is_not_returned(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DriverCache(Path(temp_dir))
+            cache.save("120.0", str(Path(temp_dir) / "gone"), "selenium-manager")
+            self.assertIsNone(cache.lookup("120.0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import unittest
+
+from ff_calendar_toolkit.extract import (
+    embedded_days_from_html,
+    raw_rows_from_embedded_days,
+    raw_rows_from_page,
+    raw_rows_from_table_json,
+)
+from ff_calendar_toolkit.normalize import normalize_rows
+
+EMBEDDED_PAGE = """
+<script>
+window.calendarComponentStates = window.calendarComponentStates || [];
+window.calendarComponentStates[1] = {
+    days: [{"date":"<span>Tue <\\/span><span>Sep 2<\\/span>","events":[
+        {"id":1234,"name":"ISM Manufacturing PMI [final]","currency":"USD","impactClass":"icon--ff-impact-red",
+         "timeLabel":"10:00am","actual":"","forecast":"49.0","previous":"48.0"},
+        {"id":1235,"name":"Bank \\\"Holiday\\\"","currency":"CAD","impactClass":"icon--ff-impact-gra",
+         "timeLabel":"All Day","actual":"","forecast":"","previous":""}
+    ]}],
+    time: {"now": 1},
+};
+</script>
+<table class="calendar__table"></table>
+"""
+
+
+class ExtractTests(unittest.TestCase):
+    def test_table_json_matches_element_row_format(self):
+        payload = json.dumps(
+            [
+                {"id": None, "cells": [{"class": "calendar__cell calendar__date", "text": "Tue Sep 2", "spans": []}]},
+                {
+                    "id": "1234",
+                    "cells": [
+                        {"class": "calendar__cell calendar__time", "text": "3:00am", "spans": []},
+                        {"class": "calendar__cell calendar__currency", "text": "USD", "spans": []},
+                        {
+                            "class": "calendar__cell calendar__impact",
+                            "text": "",
+                            "spans": ["icon icon--ff-impact-red"],
+                        },
+                        {"class": "calendar__cell calendar__detail", "text": "", "spans": []},
+                        {"class": "calendar__cell calendar__actual", "text": "", "spans": []},
+                        {"class": "calendar__cell calendar__graph", "text": "chart", "spans": []},
+                    ],
+                },
+                {"id": None, "cells": []},
+            ]
+        )
+
+        rows = raw_rows_from_table_json(payload, "September")
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0], {"date": "Tue Sep 2"})
+        self.assertEqual(
+            rows[1],
+            {
+                "time": "3:00am",
+                "currency": "USD",
+                "impact": "red",
+                "detail": "https://www.forexfactory.com/calendar?month=September#detail=1234",
+                "actual": "empty",
+            },
+        )
+
+    def test_embedded_state_is_read_from_page_source(self):
+        days = embedded_days_from_html(EMBEDDED_PAGE)
+
+        self.assertEqual(len(days), 1)
+        self.assertEqual([event["id"] for event in days[0]["events"]], [1234, 1235])
+        self.assertEqual(days[0]["events"][1]["name"], 'Bank "Holiday"')
+
+    def test_embedded_state_maps_to_table_row_format(self):
+        rows = raw_rows_from_embedded_days(embedded_days_from_html(EMBEDDED_PAGE), "September")
+
+        self.assertEqual(
+            rows[0],
+            {
+                "date": "Tue Sep 2",
+                "time": "10:00am",
+                "currency": "USD",
+                "impact": "red",
+                "event": "ISM Manufacturing PMI [final]",
+                "detail": "https://www.forexfactory.com/calendar?month=September#detail=1234",
+                "actual": "empty",
+                "forecast": "49.0",
+                "previous": "48.0",
+            },
+        )
+        self.assertEqual(rows[1]["date"], "empty")
+        self.assertEqual(rows[1]["impact"], "gray")
+
+    def test_embedded_and_table_rows_normalize_identically(self):
+        table_rows = [
+            {"date": "Tue Sep 2"},
+            {
+                "time": "10:00am",
+                "currency": "USD",
+                "impact": "red",
+                "event": "ISM Manufacturing PMI [final]",
+                "detail": "https://www.forexfactory.com/calendar?month=September#detail=1234",
+                "actual": "empty",
+                "forecast": "49.0",
+                "previous": "48.0",
+            },
+        ]
+        state_rows = raw_rows_from_embedded_days(embedded_days_from_html(EMBEDDED_PAGE), "September")[:1]
+        arguments = ("2025", "America/New_York", "UTC", ["USD"], ["red"], "2025-09-01T00:00:00")
+
+        self.assertEqual(normalize_rows(state_rows, *arguments), normalize_rows(table_rows, *arguments))
+
+    def test_page_without_embedded_state_falls_back_to_table(self):
+        html = (
+            '<table class="calendar__table"><tr data-event-id="9">'
+            '<td class="calendar__cell calendar__currency">EUR</td></tr></table>'
+        )
+
+        rows, source = raw_rows_from_page(html, "September")
+
+        self.assertEqual(source, "table")
+        self.assertEqual(rows, [{"currency": "EUR"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from ff_calendar_toolkit.models import ScrapeContext
+from ff_calendar_toolkit.storage import (
+    HISTORY_MANIFEST_NAME,
+    FileOutputStore,
+    latest_scrape_times,
+    read_history_manifest,
+)
+
+
+def _records(actual="", scraped_at="2026-04-19T00:00:00+00:00"):
+    return [
+        {"date": "02/04/2026", "time": "08:30", "currency": "USD", "event": "NFP", "actual": actual,
+         "scraped_at": scraped_at},
+        {"date": "03/04/2026", "time": "10:00", "currency": "EUR", "event": "CPI", "scraped_at": scraped_at},
+    ]
+
+
+class HistoryDedupTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.store = FileOutputStore(self.output_dir)
+        self.context = ScrapeContext(
+            "april", "April", "2026-04", "2026", "UTC", "UTC", "2026-04-19T00:00:00+00:00"
+        )
+        self.history_dir = self.output_dir / "history" / "2026-04"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _snapshots(self):
+        return sorted(path.name for path in self.history_dir.iterdir() if path.name != HISTORY_MANIFEST_NAME)
+
+    def test_identical_rescrape_only_appends_a_manifest_pointer(self):
+        self.store.begin_run("both")
+        first = self.store.write(_records(), self.context, "both")
+        self.store.end_run()
+        monthly = self.output_dir / "monthly" / "2026-04.json"
+        os.utime(monthly, (1, 1))
+        before = monthly.stat()
+
+        self.store.begin_run("both")
+        later = "2026-04-20T00:00:00+00:00"
+        second = self.store.write(_records(scraped_at=later), replace(self.context, scraped_at=later), "both")
+        self.store.end_run()
+
+        self.assertTrue(second.history_reused)
+        self.assertEqual(second.history_paths, first.history_paths)
+        self.assertEqual(second.bytes_written, 0)
+        self.assertEqual(len(self._snapshots()), 2)
+        self.assertEqual((monthly.stat().st_ino, monthly.stat().st_mtime), (before.st_ino, before.st_mtime))
+        self.assertTrue(os.path.samefile(self.output_dir / "last_run" / "2026-04.csv", first.history_paths[0]))
+
+        manifest = read_history_manifest(self.history_dir)
+        self.assertEqual([entry["reused"] for entry in manifest], [False, True])
+        self.assertEqual(manifest[0]["digest"], manifest[1]["digest"])
+        self.assertEqual(manifest[1]["scraped_at"], later)
+        self.assertEqual(manifest[1]["files"], {path.suffix[1:]: path.name for path in first.history_paths})
+
+    def test_reused_snapshot_reports_the_latest_scrape_time(self):
+        self.store.write(_records(), self.context, "json")
+        later = "2026-04-20T00:00:00+00:00"
+        result = self.store.write(_records(scraped_at=later), replace(self.context, scraped_at=later), "json")
+
+        self.assertTrue(result.history_reused)
+        monthly = json.loads((self.output_dir / "monthly" / "2026-04.json").read_text(encoding="utf-8"))
+        self.assertEqual(monthly[0]["scraped_at"], self.context.scraped_at)
+        self.assertEqual(latest_scrape_times(self.output_dir), {"2026-04": later})
+
+    def test_changed_content_writes_a_new_snapshot_and_old_content_is_reused(self):
+        first = self.store.write(_records(), self.context, "json")
+        changed = self.store.write(_records(actual="250K"), self.context, "json")
+        again = self.store.write(_records(), self.context, "json")
+
+        self.assertFalse(changed.history_reused)
+        self.assertNotEqual(changed.history_paths, first.history_paths)
+        self.assertEqual(len(self._snapshots()), 2)
+        self.assertTrue(again.history_reused)
+        self.assertEqual(again.history_paths, first.history_paths)
+        monthly = json.loads((self.output_dir / "monthly" / "2026-04.json").read_text(encoding="utf-8"))
+        self.assertEqual(monthly[0]["actual"], "")
+
+    def test_snapshot_is_not_reused_for_a_format_it_lacks(self):
+        self.store.write(_records(), self.context, "json")
+        result = self.store.write(_records(), self.context, "both")
+
+        self.assertFalse(result.history_reused)
+        self.assertEqual(len(self._snapshots()), 3)
+
+    def test_merging_unchanged_rows_leaves_monthly_untouched(self):
+        self.store.write(_records(actual="250K"), self.context, "json")
+        monthly = self.output_dir / "monthly" / "2026-04.json"
+        os.utime(monthly, (1, 1))
+
+        bytes_before = self.store.bytes_written
+        self.store.merge_monthly(_records(actual="250K")[:1], "json")
+
+        self.assertEqual(monthly.stat().st_mtime, 1)
+        self.assertEqual(self.store.bytes_written, bytes_before)
+        self.assertEqual([path.name for path in monthly.parent.iterdir()], ["2026-04.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ff_calendar_toolkit.http_fetcher import FetchError, HttpCalendarFetcher
+from ff_calendar_toolkit.normalize import normalize_rows
+
+RECORDED_PAGE = """<!DOCTYPE html>
+<html><body>
+<table class="calendar__table calendar__table--no-future">
+  <tr class="calendar__row calendar__row--day-breaker"><td class="calendar__cell" colspan="10">
+    <span>Tue <span>Sep 2</span></span></td></tr>
+  <tr class="calendar__row" data-event-id="140001">
+    <td class="calendar__cell calendar__date"><span class="date">Tue <span>Sep 2</span></span></td>
+    <td class="calendar__cell calendar__time"><div>3:00am</div></td>
+    <td class="calendar__cell calendar__currency"><span>USD</span></td>
+    <td class="calendar__cell calendar__impact"><span title="High Impact Expected"
+      class="icon icon--ff-impact-red"></span></td>
+    <td class="calendar__cell calendar__event event"><div class="calendar__event-title-wrapper">
+      <span class="calendar__event-title">Core CPI m/m</span></div></td>
+    <td class="calendar__cell calendar__detail"><a title="Open Detail"></a></td>
+    <td class="calendar__cell calendar__actual"><span class="better">0.4%</span></td>
+    <td class="calendar__cell calendar__forecast"><span>0.3%</span></td>
+    <td class="calendar__cell calendar__previous"><span>0.2%</span></td>
+    <td class="calendar__cell calendar__graph"><table><tr><td>chart</td></tr></table></td>
+  </tr>
+  <tr class="calendar__row" data-event-id="140002">
+    <td class="calendar__cell calendar__date"></td>
+    <td class="calendar__cell calendar__time"></td>
+    <td class="calendar__cell calendar__currency"><span>EUR</span></td>
+    <td class="calendar__cell calendar__impact"><span class="icon icon--ff-impact-ora"></span></td>
+    <td class="calendar__cell calendar__event event"><span class="calendar__event-title">PPI m/m</span></td>
+    <td class="calendar__cell calendar__detail"><a></a></td>
+    <td class="calendar__cell calendar__actual"></td>
+    <td class="calendar__cell calendar__forecast"><span>0.1%</span></td>
+    <td class="calendar__cell calendar__previous"><span>-0.1%</span></td>
+  </tr>
+</table>
+</body></html>
+"""
+
+
+class RecordedPageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if not self.path.startswith("/calendar?month="):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = RECORDED_PAGE.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SilentConsole:
+    def step(self, message):
+        pass
+
+
+class HttpFetcherTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), RecordedPageHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_scrape_month_parses_recorded_page(self):
+        fetcher = HttpCalendarFetcher(SilentConsole(), source_timezone="UTC", base_url=self.base_url)
+
+        with fetcher.session():
+            rows, context = fetcher.scrape_month("september", "Asia/Karachi")
+
+        self.assertEqual(context.source_timezone, "UTC")
+        self.assertEqual(rows[0], {"date": "Tue Sep 2"})
+        self.assertEqual(rows[1]["time"], "3:00am")
+        self.assertEqual(rows[1]["impact"], "red")
+        self.assertEqual(rows[1]["event"], "Core CPI m/m")
+        self.assertEqual(
+            rows[1]["detail"],
+            "https://www.forexfactory.com/calendar?month=September#detail=140001",
+        )
+        self.assertEqual(rows[2]["actual"], "empty")
+
+        normalized = normalize_rows(
+            rows, "2025", context.source_timezone, "Asia/Karachi", ["USD", "EUR"], ["red", "orange"]
+        )
+        self.assertEqual([row["time"] for row in normalized], ["08:00", "08:00"])
+        self.assertEqual([row["date"] for row in normalized], ["02/09/2025", "02/09/2025"])
+
+    def test_non_200_response_raises_fetch_error(self):
+        fetcher = HttpCalendarFetcher(SilentConsole(), base_url=self.base_url)
+        with self.assertRaises(FetchError):
+            fetcher.fetch_html(f"{self.base_url}/missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from ff_calendar_toolkit.metrics import REPORT_JSON_NAME, REPORT_PROM_NAME, RunMetrics, prometheus_text
+
+
+class RunMetricsTests(unittest.TestCase):
+    def test_phases_and_counts_are_summed_per_month_in_prometheus_text(self):
+        metrics = RunMetrics()
+        metrics.record("driver_get", 1.5, "2025-01")
+        metrics.record("driver_get", 0.5, "2025-01")
+        metrics.record("driver_get", 2.0, "2025-02")
+        metrics.count("records", 40, "2025-01")
+
+        text = prometheus_text(metrics.report())
+
+        self.assertIn('ff_scrape_phase_seconds{phase="driver_get",month="2025-01"} 2.000000', text)
+        self.assertIn('ff_scrape_phase_seconds{phase="driver_get",month="2025-02"} 2.000000', text)
+        self.assertIn('ff_scrape_count{name="records",month="2025-01"} 40', text)
+        self.assertIn("ff_scrape_peak_rss_bytes ", text)
+
+    def test_merge_keeps_worker_phases(self):
+        parent = RunMetrics()
+        worker = RunMetrics()
+        with worker.phase("parse_table", "2025-03"):
+            pass
+        parent.merge(worker)
+        self.assertEqual([item["phase"] for item in parent.report()["phases"]], ["parse_table"])
+
+    def test_write_creates_json_and_textfile_reports(self):
+        metrics = RunMetrics()
+        metrics.record("normalize_rows", 0.25, "2025-01")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path, prom_path = metrics.write(Path(temp_dir))
+            report = json.loads(json_path.read_text(encoding="utf-8"))
+            self.assertEqual(json_path.name, REPORT_JSON_NAME)
+            self.assertEqual(prom_path.name, REPORT_PROM_NAME)
+            self.assertEqual(report["phases"][0]["seconds"], 0.25)
+            self.assertGreater(report["peak_rss_bytes"], 0)
+            self.assertTrue(prom_path.read_text(encoding="utf-8").endswith("\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
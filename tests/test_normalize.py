@@ -1,6 +1,6 @@
 import unittest
 
-from ff_calendar_toolkit.normalize import convert_time_zone, normalize_rows
+from ff_calendar_toolkit.normalize import convert_time_zone, iter_normalized_rows, normalize_rows
 
 
 class NormalizeTests(unittest.TestCase):
@@ -34,12 +34,52 @@ class NormalizeTests(unittest.TestCase):
         self.assertEqual(normalized[0]["time"], "08:00")
         self.assertEqual(normalized[1]["time"], "08:00")
 
+    def test_iter_normalized_rows_is_lazy_and_leaves_raw_rows_untouched(self):
+        consumed = []
+
+        def source():
+            for index in range(1, 4):
+                row = {"date": f"Tue Sep {index}", "time": "3:00am", "currency": "USD", "impact": "red"}
+                consumed.append(row)
+                yield row
+
+        records = iter_normalized_rows(source(), "2025", "UTC", "UTC", ["USD"], ["red"])
+        first = next(records)
+
+        self.assertEqual(len(consumed), 1)
+        self.assertEqual(first["date"], "01/09/2025")
+        self.assertEqual(consumed[0]["date"], "Tue Sep 1")
+        self.assertEqual([record["date"] for record in records], ["02/09/2025", "03/09/2025"])
+
     def test_convert_time_zone_handles_special_values(self):
         self.assertEqual(
             convert_time_zone("02/09/2025", "all day", "UTC", "Asia/Karachi"),
             "all day",
         )
 
+    def test_week_view_rolling_into_january_moves_to_next_year(self):
+        rows = [
+            {"date": "Wed Dec 31", "time": "10:00am", "currency": "USD", "impact": "red", "event": "A"},
+            {"date": "Thu Jan 1", "time": "All Day", "currency": "USD", "impact": "red", "event": "B"},
+        ]
+
+        normalized = normalize_rows(rows, "2025", "UTC", "UTC", ["USD"], ["red"])
+
+        self.assertEqual([row["date"] for row in normalized], ["31/12/2025", "01/01/2026"])
+
+    def test_records_carry_utc_instant_of_timed_events(self):
+        rows = [
+            {"date": "Sun Mar 9", "time": "8:30am", "currency": "USD", "impact": "red", "event": "A"},
+            {"time": "All Day", "currency": "USD", "impact": "red", "event": "B"},
+        ]
+
+        normalized = normalize_rows(rows, "2025", "America/New_York", "Asia/Karachi", ["USD"], ["red"])
+
+        self.assertEqual(normalized[0]["time"], "17:30")
+        self.assertEqual(normalized[0]["event_time_utc"], "2025-03-09T12:30:00+00:00")
+        self.assertEqual(normalized[0]["event_timestamp_utc"], 1741523400)
+        self.assertEqual((normalized[1]["event_time_utc"], normalized[1]["event_timestamp_utc"]), ("", ""))
+
 
 if __name__ == "__main__":
     unittest.main()
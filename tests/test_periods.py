@@ -0,0 +1,51 @@
+import unittest
+from datetime import datetime
+
+from ff_calendar_toolkit.periods import (
+    month_context,
+    month_range,
+    month_slug,
+    month_url,
+    resolve_day,
+    resolve_week,
+)
+
+
+class PeriodTests(unittest.TestCase):
+    def test_month_selectors_keep_their_urls(self):
+        self.assertEqual(month_url("next"), "https://www.forexfactory.com/calendar?month=next")
+        self.assertEqual(month_url("September"), "https://www.forexfactory.com/calendar?month=september")
+
+    def test_year_month_selectors_reach_past_years(self):
+        self.assertEqual(month_url("2022-01"), "https://www.forexfactory.com/calendar?month=jan.2022")
+        self.assertEqual(month_slug("2022-01"), "2022-01")
+        self.assertEqual(month_range("2022-11", "2023-02"), ["2022-11", "2022-12", "2023-01", "2023-02"])
+        with self.assertRaises(ValueError):
+            month_range("2023-02", "2022-11")
+
+    def test_week_and_day_selectors_map_to_narrow_views(self):
+        self.assertEqual(month_url("week:this"), "https://www.forexfactory.com/calendar?week=this")
+        self.assertEqual(month_url("day:today"), "https://www.forexfactory.com/calendar?day=today")
+        self.assertEqual(month_url("day:2025-09-02"), "https://www.forexfactory.com/calendar?day=sep2.2025")
+        self.assertEqual(month_slug("day:2025-09-02"), "day-2025-09-02")
+
+    def test_weeks_start_on_sunday(self):
+        wednesday = datetime(2025, 9, 3, 12, 0)
+        self.assertEqual(resolve_week("this", wednesday).isoformat(), "2025-08-31")
+        self.assertEqual(resolve_week("next", wednesday).isoformat(), "2025-09-07")
+        self.assertEqual(resolve_day("tomorrow", wednesday).isoformat(), "2025-09-04")
+
+    def test_context_records_period_and_first_month(self):
+        context = month_context("day:2025-12-31", "UTC", "UTC")
+        self.assertEqual(context.period, "day")
+        self.assertEqual((context.month_name, context.year), ("December", "2025"))
+
+    def test_unknown_selectors_are_rejected(self):
+        with self.assertRaises(ValueError):
+            month_url("week:last")
+        with self.assertRaises(ValueError):
+            month_url("day:02/09/2025")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import queue
+import threading
+import unittest
+from unittest.mock import patch
+
+from ff_calendar_toolkit import pipeline
+from ff_calendar_toolkit.metrics import RunMetrics
+from ff_calendar_toolkit.pipeline import StagePipeline
+
+
+class StagePipelineTests(unittest.TestCase):
+    def test_items_pass_through_every_stage_in_order(self):
+        written = []
+        pipeline = StagePipeline(RunMetrics(), 2, label=str)
+
+        pipeline.run(range(5), [("double", lambda item: item * 2), ("write", written.append)])
+
+        self.assertEqual(written, [0, 2, 4, 6, 8])
+
+    def test_producer_is_held_back_by_a_slow_stage(self):
+        release = threading.Event()
+        stage_busy = threading.Event()
+        producer_blocked = threading.Event()
+        produced = []
+
+        class ProbeQueue(queue.Queue):
+            def put(self, item, block=True, timeout=None):
+                # Once the slow stage holds an item, a put that finds the queue full is the producer blocking.
+                if stage_busy.is_set() and self.full():
+                    producer_blocked.set()
+                super().put(item, block, timeout)
+
+        def source():
+            for item in range(6):
+                produced.append(item)
+                yield item
+
+        def slow(item):
+            stage_busy.set()
+            release.wait(timeout=5)
+            return item
+
+        observed = []
+
+        def watchdog():
+            # The slow stage holds one item, its queue one more, and the producer blocks on the third.
+            producer_blocked.wait(timeout=5)
+            observed.append(len(produced))
+            release.set()
+
+        checker = threading.Thread(target=watchdog)
+        checker.start()
+        metrics = RunMetrics()
+        with patch.object(pipeline.queue, "Queue", ProbeQueue):
+            StagePipeline(metrics, 1, label=str).run(source(), [("slow", slow), ("write", lambda item: None)])
+        checker.join()
+
+        self.assertTrue(producer_blocked.is_set())
+        self.assertEqual(observed, [3])
+
+        depths = [item["value"] for item in metrics.counts if item["name"] == "slow_queue_depth"]
+        self.assertEqual(len(depths), 6)
+        self.assertLessEqual(max(depths), 1)
+
+    def test_stage_error_stops_the_pipeline_and_is_raised(self):
+        consumed = []
+
+        def source():
+            for item in range(100):
+                consumed.append(item)
+                yield item
+
+        def failing(item):
+            if item == 2:
+                raise ValueError("bad month")
+            return item
+
+        with self.assertRaises(ValueError):
+            StagePipeline(RunMetrics(), 1).run(source(), [("normalize", failing), ("write", lambda item: None)])
+
+        self.assertLess(len(consumed), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
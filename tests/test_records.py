@@ -0,0 +1,65 @@
+import json
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from ff_calendar_toolkit.alerts.events import load_alert_events
+from ff_calendar_toolkit.config import NORMALIZED_FIELDS
+from ff_calendar_toolkit.records import CalendarRecord
+
+
+class CalendarRecordTests(unittest.TestCase):
+    def setUp(self):
+        self.row = {
+            "time": "08:30",
+            "timezone": "UTC",
+            "currency": "USD",
+            "impact": "red",
+            "event": "NFP",
+            "day": "Fri",
+            "date": "03/04/2026",
+            "event_timestamp_utc": 1775205000,
+        }
+
+    def test_round_trips_through_dict_with_every_field(self):
+        record = CalendarRecord.from_dict(self.row)
+
+        payload = record.to_dict()
+        self.assertEqual(list(payload), NORMALIZED_FIELDS)
+        self.assertEqual(payload["event_timestamp_utc"], 1775205000)
+        self.assertEqual(payload["actual"], "")
+        self.assertEqual(record, payload)
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+    def test_behaves_like_a_read_only_mapping(self):
+        record = CalendarRecord.from_dict(self.row)
+
+        self.assertEqual(record["event"], "NFP")
+        self.assertEqual(record.get("missing", "x"), "x")
+        self.assertNotIn("missing", record)
+        with self.assertRaises(KeyError):
+            record["missing"]
+        with self.assertRaises(AttributeError):
+            record.event = "CPI"
+        self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_small_vocabularies_are_shared(self):
+        first = CalendarRecord.from_dict({**self.row, "currency": "".join(["U", "SD"])})
+        second = CalendarRecord.from_dict({**self.row, "currency": "".join(["US", "D"])})
+        self.assertIs(first["currency"], second["currency"])
+
+    def test_alert_events_load_as_records(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            (output_dir / "monthly").mkdir()
+            (output_dir / "monthly" / "2026-04.json").write_text(json.dumps([self.row]), encoding="utf-8")
+
+            events = load_alert_events(output_dir)
+
+        self.assertIsInstance(events[0].payload, CalendarRecord)
+        self.assertEqual(events[0].payload["event"], "NFP")
+
+
+if __name__ == "__main__":
+    unittest.main()
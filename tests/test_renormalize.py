@@ -0,0 +1,209 @@
+import csv
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from ff_calendar_toolkit.bulk import normalize_batches, renormalize_batches
+from ff_calendar_toolkit.models import RenormalizeOptions, ScrapeContext
+from ff_calendar_toolkit.normalize import normalize_rows, renormalize_records
+from ff_calendar_toolkit.renormalize import RenormalizeService
+from ff_calendar_toolkit.snapshots import save_snapshot
+from ff_calendar_toolkit.sqlite_store import SqliteOutputStore
+from ff_calendar_toolkit.storage import FileOutputStore
+
+CURRENCIES = ["USD", "EUR"]
+IMPACTS = ["red", "orange"]
+TIMES = [
+    "2:30am", "1:30am", "8:30am", "12:00pm", "9:5am", "0:30am",
+    "13:00pm", " 10:00AM ", "All Day", "Tentative", "Day 2", "empty",
+]
+DATES = ["Sun Mar 9", "Sun Nov 2", "Tue Dec 30", "Thu Jan 1", "Fri Jan 2", "bogus", "empty"]
+
+PAGE = """<html><body><table class="calendar__table">
+<tr data-event-id="77">
+  <td class="calendar__cell calendar__date"><span>Tue <span>Sep 2</span></span></td>
+  <td class="calendar__cell calendar__time">3:00am</td>
+  <td class="calendar__cell calendar__currency">USD</td>
+  <td class="calendar__cell calendar__impact"><span class="icon icon--ff-impact-red"></span></td>
+  <td class="calendar__cell calendar__event event"><span>Core CPI m/m</span></td>
+  <td class="calendar__cell calendar__detail"></td>
+</tr>
+</table></body></html>"""
+
+
+class SilentConsole:
+    def step(self, message):
+        pass
+
+    def success(self, message):
+        pass
+
+    def error(self, message):
+        pass
+
+
+def random_raw_rows(rng: random.Random, count: int) -> list[dict]:
+    rows = []
+    for index in range(count):
+        row = {
+            "currency": rng.choice(["USD", "EUR", "GBP", "empty"]),
+            "impact": rng.choice(["red", "Orange", "gray"]),
+            "event": f"Event {index}",
+            "actual": rng.choice(["", "1.2%", "empty"]),
+        }
+        if rng.random() < 0.3:
+            row["date"] = rng.choice(DATES)
+        if rng.random() < 0.6:
+            row["time"] = rng.choice(TIMES)
+        if rng.random() < 0.05:
+            row = {"date": rng.choice(DATES)}
+        rows.append(row)
+    return rows
+
+
+class BulkNormalizeTests(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.batches = [
+            (
+                random_raw_rows(rng, rng.randint(0, 60)),
+                rng.choice(["2024", "2025"]),
+                rng.choice(["America/New_York", "UTC", None, "Not/AZone"]),
+                rng.choice(["2025-01-01T00:00:00+00:00", None]),
+            )
+            for _ in range(30)
+        ]
+
+    def test_vectorized_normalize_matches_scalar_path(self):
+        for target in ["Asia/Karachi", "America/New_York", None]:
+            expected = [
+                normalize_rows(rows, year, source, target, CURRENCIES, IMPACTS, scraped_at)
+                for rows, year, source, scraped_at in self.batches
+            ]
+            actual = normalize_batches(self.batches, target, CURRENCIES, IMPACTS)
+            self.assertEqual(json.dumps(actual), json.dumps(expected))
+
+    def test_vectorized_renormalize_matches_scalar_path(self):
+        stored = [
+            normalize_rows(rows, year, "America/New_York", "America/New_York", CURRENCIES, IMPACTS, scraped_at)
+            for rows, year, _, scraped_at in self.batches
+        ]
+        for records in stored[::3]:
+            for record in records:
+                record["event_timestamp_utc"] = ""
+        for records in stored[1::3]:
+            for record in records:
+                record["event_timestamp_utc"] = str(record["event_timestamp_utc"])
+        stored[0].append(
+            {
+                "currency": "USD",
+                "impact": "red",
+                "date": "09/03/2025",
+                "time": "02:30",
+                "timezone": "America/New_York",
+            }
+        )
+
+        targets = [("Asia/Karachi", CURRENCIES), ("UTC", ["USD"]), (None, CURRENCIES), ("", CURRENCIES)]
+        for target, currencies in targets:
+            expected = [list(renormalize_records(records, target, currencies, IMPACTS)) for records in stored]
+            actual = renormalize_batches(stored, target, currencies, IMPACTS)
+            self.assertEqual(json.dumps(actual), json.dumps(expected))
+
+
+class RenormalizeServiceTests(unittest.TestCase):
+    def options(self, output_dir: Path, snapshot_paths=None, sqlite_path=None) -> RenormalizeOptions:
+        return RenormalizeOptions(
+            snapshot_paths=snapshot_paths or [],
+            output_format="json",
+            output_dir=output_dir,
+            target_timezone="UTC",
+            allowed_currencies=["USD"],
+            allowed_impacts=["red"],
+            storage="sqlite" if sqlite_path else "file",
+            sqlite_path=sqlite_path,
+        )
+
+    def karachi_records(self):
+        rows = [{"date": "Tue Sep 2", "time": "8:00am", "currency": "USD", "impact": "red", "event": "CPI"}]
+        return normalize_rows(rows, "2025", "Asia/Karachi", "Asia/Karachi", ["USD"], ["red"], "")
+
+    def test_monthly_datasets_are_rewritten_in_the_new_timezone(self):
+        rows = [
+            {"date": "Tue Sep 2", "time": "3:00am", "currency": "USD", "impact": "red", "event": "CPI"},
+            {"time": "4:00am", "currency": "EUR", "impact": "red", "event": "ZEW"},
+        ]
+        records = normalize_rows(rows, "2025", "UTC", "Asia/Karachi", ["USD", "EUR"], ["red"], "")
+        context = ScrapeContext("september", "September", "2025-09", "2025", "UTC", "Asia/Karachi", "")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            store = FileOutputStore(output_dir)
+            store.write(records, context, "json")
+
+            result = RenormalizeService(SilentConsole()).run(self.options(output_dir))
+
+            monthly = json.loads((output_dir / "monthly" / "2025-09.json").read_text(encoding="utf-8"))
+            last_run = json.loads((output_dir / "last_run" / "2025-09.json").read_text(encoding="utf-8"))
+        self.assertEqual(result, 0)
+        self.assertEqual(
+            [(row["event"], row["time"], row["timezone"]) for row in monthly], [("CPI", "03:00", "UTC")]
+        )
+        self.assertEqual(last_run, monthly)
+
+    def test_every_stored_format_is_rewritten_not_only_the_requested_one(self):
+        context = ScrapeContext("september", "September", "2025-09", "2025", "UTC", "Asia/Karachi", "")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            FileOutputStore(output_dir).write(self.karachi_records(), context, "both")
+
+            RenormalizeService(SilentConsole()).run(self.options(output_dir))
+
+            monthly = json.loads((output_dir / "monthly" / "2025-09.json").read_text(encoding="utf-8"))
+            with open(output_dir / "monthly" / "2025-09.csv", newline="", encoding="utf-8") as handle:
+                monthly_csv = list(csv.DictReader(handle))
+            with open(output_dir / "last_run" / "2025-09.csv", newline="", encoding="utf-8") as handle:
+                last_run_csv = list(csv.DictReader(handle))
+        self.assertEqual((monthly[0]["time"], monthly[0]["timezone"]), ("03:00", "UTC"))
+        self.assertEqual((monthly_csv[0]["time"], monthly_csv[0]["timezone"]), ("03:00", "UTC"))
+        self.assertEqual(last_run_csv, monthly_csv)
+
+    def test_sqlite_storage_renormalizes_the_database(self):
+        context = ScrapeContext("september", "September", "2025-09", "2025", "UTC", "Asia/Karachi", "")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            database_path = output_dir / "calendar.sqlite"
+            store = SqliteOutputStore(database_path)
+            try:
+                store.write(self.karachi_records(), context, "json")
+            finally:
+                store.close()
+
+            result = RenormalizeService(SilentConsole()).run(self.options(output_dir, sqlite_path=database_path))
+
+            store = SqliteOutputStore(database_path)
+            try:
+                stored = store.read_monthly("2025-09")
+            finally:
+                store.close()
+            self.assertFalse((output_dir / "monthly").exists())
+        self.assertEqual(result, 0)
+        self.assertEqual([(row["time"], row["timezone"]) for row in stored], [("03:00", "UTC")])
+
+    def test_snapshots_are_rebuilt_with_current_settings(self):
+        context = ScrapeContext("september", "September", "2025-09", "2025", "UTC", "Asia/Karachi", "")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir) / "news"
+            path = save_snapshot(Path(temp_dir) / "snapshots", PAGE, context)
+
+            result = RenormalizeService(SilentConsole()).run(self.options(output_dir, [path]))
+
+            monthly = json.loads((output_dir / "monthly" / "2025-09.json").read_text(encoding="utf-8"))
+        self.assertEqual(result, 0)
+        self.assertEqual(monthly[0]["time"], "03:00")
+        self.assertEqual(monthly[0]["event_time_utc"], "2025-09-02T03:00:00+00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -60,6 +60,25 @@ class RuntimeTests(unittest.TestCase):
             os.environ.clear()
             os.environ.update(previous)
 
+    def test_week_and_day_selectors_are_scraped_alongside_months(self):
+        previous = dict(os.environ)
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                os.environ["FF_MONTHS"] = "this next"
+                args = Args()
+                args.config = str(Path(temp_dir) / "config.yaml")
+                args.months = ["2026-05"]
+                args.week = ["this"]
+                args.day = ["tomorrow"]
+
+                self.assertEqual(build_run_options(args).months, ["2026-05", "week:this", "day:tomorrow"])
+
+                args.months = None
+                self.assertEqual(build_run_options(args).months, ["week:this", "day:tomorrow"])
+        finally:
+            os.environ.clear()
+            os.environ.update(previous)
+
     def test_yaml_config_is_used_when_env_and_cli_are_absent(self):
         previous = dict(os.environ)
         try:
@@ -0,0 +1,142 @@
+import unittest
+from unittest.mock import patch
+
+from selenium.common.exceptions import WebDriverException
+
+from ff_calendar_toolkit.scraper import (
+    ROW_COUNT_SCRIPT,
+    ForexFactoryScraper,
+    blocked_url_patterns,
+    host_resolver_rules,
+)
+
+
+class SilentConsole:
+    def step(self, message):
+        pass
+
+    def warn(self, message):
+        pass
+
+
+class FakeDriver:
+    def __init__(self, crash_on=None):
+        self.crash_on = crash_on
+        self.dead = False
+        self.quit_calls = 0
+        self.urls = []
+
+    def get(self, url):
+        if self.crash_on and self.crash_on in url:
+            self.dead = True
+            raise WebDriverException("browser crashed")
+        self.urls.append(url)
+
+    @property
+    def current_url(self):
+        if self.dead:
+            raise WebDriverException("browser is gone")
+        return self.urls[-1] if self.urls else ""
+
+    def execute_script(self, script, *args):
+        if "Intl" in script:
+            return "UTC"
+        if "JSON.stringify" in script:
+            return "[]"
+        return 0
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class GrowingRowsDriver:
+    """Adds rows after each scroll until ``scrolls_with_new_rows`` scrolls have happened."""
+
+    def __init__(self, scrolls_with_new_rows):
+        self.scrolls_with_new_rows = scrolls_with_new_rows
+        self.scrolls = 0
+
+    def execute_script(self, script, *args):
+        if script == ROW_COUNT_SCRIPT:
+            return 10 + 5 * min(self.scrolls, self.scrolls_with_new_rows)
+        self.scrolls += 1
+        return None
+
+
+class ScrollTests(unittest.TestCase):
+    def test_scrolling_stops_once_the_row_count_stops_growing(self):
+        driver = GrowingRowsDriver(scrolls_with_new_rows=3)
+        ForexFactoryScraper(SilentConsole(), scroll_wait_seconds=0).scroll_to_end(driver)
+        self.assertEqual(driver.scrolls, 4)
+
+    def test_scrolling_is_bounded_when_rows_keep_growing(self):
+        driver = GrowingRowsDriver(scrolls_with_new_rows=10**6)
+        with patch("ff_calendar_toolkit.scraper.MAX_SCROLL_STEPS", 5):
+            ForexFactoryScraper(SilentConsole(), scroll_wait_seconds=0).scroll_to_end(driver)
+        self.assertEqual(driver.scrolls, 5)
+
+
+class ScraperSessionTests(unittest.TestCase):
+    def _scraper(self, drivers):
+        scraper = ForexFactoryScraper(SilentConsole(), scroll_wait_seconds=0)
+        scraper.init_driver = lambda: drivers.pop(0)
+        return scraper
+
+    def test_session_reuses_one_driver_across_months(self):
+        driver = FakeDriver()
+        scraper = self._scraper([driver])
+
+        with scraper.session():
+            scraper.scrape_month("this", "UTC")
+            scraper.scrape_month("next", "UTC")
+
+        self.assertEqual(len(driver.urls), 2)
+        self.assertEqual(driver.quit_calls, 1)
+
+    def test_session_restarts_crashed_browser(self):
+        crashing = FakeDriver(crash_on="month=next")
+        replacement = FakeDriver()
+        scraper = self._scraper([crashing, replacement])
+
+        with scraper.session():
+            scraper.scrape_month("this", "UTC")
+            rows, context = scraper.scrape_month("next", "UTC")
+
+        self.assertEqual(rows, [])
+        self.assertEqual(context.source_timezone, "UTC")
+        self.assertEqual(replacement.urls, ["https://www.forexfactory.com/calendar?month=next"])
+        self.assertEqual(crashing.quit_calls, 1)
+        self.assertEqual(replacement.quit_calls, 1)
+
+    def test_without_session_each_month_gets_a_fresh_driver(self):
+        first = FakeDriver()
+        second = FakeDriver()
+        scraper = self._scraper([first, second])
+
+        scraper.scrape_month("this", "UTC")
+        scraper.scrape_month("next", "UTC")
+
+        self.assertEqual(first.quit_calls, 1)
+        self.assertEqual(second.quit_calls, 1)
+
+
+class ResourceBlockingTests(unittest.TestCase):
+    def test_blocked_url_patterns_cover_requested_types(self):
+        patterns = blocked_url_patterns(["font", "stylesheet"])
+        self.assertIn("*.woff2", patterns)
+        self.assertIn("*.css", patterns)
+        self.assertNotIn("*.png", patterns)
+
+    def test_unknown_resource_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ForexFactoryScraper(SilentConsole(), block_resources=True, blocked_resource_types=["video"])
+
+    def test_host_resolver_rules_keep_allowed_domains(self):
+        self.assertEqual(
+            host_resolver_rules(["forexfactory.com", "*.forexfactory.com"]),
+            "MAP * ~NOTFOUND, EXCLUDE localhost, EXCLUDE forexfactory.com, EXCLUDE *.forexfactory.com",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ff_calendar_toolkit.models import ReplayOptions, ScrapeContext
+from ff_calendar_toolkit.replay import ReplayService
+from ff_calendar_toolkit.snapshots import load_snapshot, replay_snapshot, save_snapshot
+
+PAGE = """<html><body><table class="calendar__table">
+<tr data-event-id="77">
+  <td class="calendar__cell calendar__date"><span>Tue <span>Sep 2</span></span></td>
+  <td class="calendar__cell calendar__time">3:00am</td>
+  <td class="calendar__cell calendar__currency">USD</td>
+  <td class="calendar__cell calendar__impact"><span class="icon icon--ff-impact-red"></span></td>
+  <td class="calendar__cell calendar__event event"><span>Core CPI m/m</span></td>
+  <td class="calendar__cell calendar__detail"></td>
+</tr>
+</table></body></html>"""
+
+
+class SilentConsole:
+    def step(self, message):
+        pass
+
+    def success(self, message):
+        pass
+
+    def error(self, message):
+        pass
+
+
+class SnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.context = ScrapeContext(
+            month_param="september",
+            month_name="September",
+            month_slug="2025-09",
+            year="2025",
+            source_timezone="UTC",
+            target_timezone="Asia/Karachi",
+            scraped_at="2025-09-01T00:00:00+00:00",
+        )
+
+    def test_snapshot_round_trip_rebuilds_raw_rows(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = save_snapshot(Path(temp_dir), PAGE, self.context)
+
+            html, context = load_snapshot(path)
+            rows, replay_context = replay_snapshot(path)
+
+            self.assertTrue(path.name.endswith(".json.gz"))
+            self.assertEqual(html, PAGE)
+            self.assertEqual(context, self.context)
+            self.assertEqual(replay_context.source_timezone, "UTC")
+            self.assertEqual(rows[0]["impact"], "red")
+            self.assertEqual(rows[0]["event"], "Core CPI m/m")
+
+    def test_snapshots_taken_within_one_second_do_not_overwrite_each_other(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("ff_calendar_toolkit.snapshots.datetime") as clock:
+                clock.now.return_value.astimezone.return_value.strftime.return_value = "2025-09-02T10-00-00+0000"
+                first = save_snapshot(Path(temp_dir), PAGE, self.context)
+                second = save_snapshot(Path(temp_dir), "<html></html>", self.context)
+
+            self.assertNotEqual(first, second)
+            self.assertEqual(load_snapshot(first)[0], PAGE)
+            self.assertEqual(load_snapshot(second)[0], "<html></html>")
+
+    def test_replay_service_writes_renormalized_output(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            snapshot_dir = Path(temp_dir) / "snapshots"
+            output_dir = Path(temp_dir) / "news"
+            save_snapshot(snapshot_dir, PAGE, self.context)
+            options = ReplayOptions(
+                snapshot_paths=[snapshot_dir],
+                output_format="json",
+                output_dir=output_dir,
+                target_timezone="Europe/London",
+                allowed_currencies=["USD"],
+                allowed_impacts=["red"],
+                write=True,
+                repeat=2,
+            )
+
+            self.assertEqual(ReplayService(SilentConsole()).run(options), 0)
+            self.assertIn('"time": "04:00"', (output_dir / "monthly" / "2025-09.json").read_text())
+
+    def test_replaying_a_week_snapshot_merges_into_the_monthly_file(self):
+        week = ScrapeContext(
+            month_param="week:this",
+            month_name="",
+            month_slug="week-2025-08-31",
+            year="2025",
+            source_timezone="UTC",
+            target_timezone="UTC",
+            scraped_at="2025-09-03T00:00:00+00:00",
+            period="week",
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            snapshot_dir = Path(temp_dir) / "snapshots"
+            output_dir = Path(temp_dir) / "news"
+            save_snapshot(snapshot_dir, PAGE, week)
+            options = ReplayOptions(
+                snapshot_paths=[snapshot_dir],
+                output_format="json",
+                output_dir=output_dir,
+                target_timezone="UTC",
+                allowed_currencies=["USD"],
+                allowed_impacts=["red"],
+                write=True,
+                repeat=1,
+            )
+
+            self.assertEqual(ReplayService(SilentConsole()).run(options), 0)
+            self.assertEqual([path.name for path in (output_dir / "monthly").iterdir()], ["2025-09.json"])
+            self.assertIn('"event": "Core CPI m/m"', (output_dir / "monthly" / "2025-09.json").read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
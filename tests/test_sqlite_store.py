@@ -0,0 +1,201 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ff_calendar_toolkit.alerts.events import load_alert_events
+from ff_calendar_toolkit.backfill import month_is_complete
+from ff_calendar_toolkit.models import ScrapeContext
+from ff_calendar_toolkit.runtime import build_alert_options, build_run_options
+from ff_calendar_toolkit.sqlite_store import SqliteOutputStore, import_file_store, read_events
+from ff_calendar_toolkit.storage import FileOutputStore, build_store
+
+
+def _record(event, date="02/04/2026", time="08:30", currency="USD", impact="red", actual="", timestamp=None):
+    return {
+        "time": time,
+        "currency": currency,
+        "impact": impact,
+        "event": event,
+        "actual": actual,
+        "date": date,
+        "event_timestamp_utc": timestamp if timestamp else "",
+    }
+
+
+class Args:
+    config = None
+    months = None
+    output_format = None
+    output_dir = None
+    rules_dir = None
+    state_dir = None
+    timezone = None
+    currencies = None
+    impacts = None
+    show_browser = False
+
+
+class SqliteOutputStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database_path = Path(self.temp_dir.name) / "calendar.sqlite"
+        self.store = SqliteOutputStore(self.database_path)
+        self.context = ScrapeContext(
+            "april", "April", "2026-04", "2026", "UTC", "UTC", "2026-05-02T00:00:00+00:00"
+        )
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_database_uses_wal_and_indexes_event_time_currency_and_impact(self):
+        connection = sqlite3.connect(self.database_path)
+        try:
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            plan = " ".join(
+                str(row)
+                for row in connection.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM events WHERE currency = 'USD' AND event_timestamp_utc >= 0"
+                )
+            )
+            indexed = {row[1] for row in connection.execute("PRAGMA index_list(events)")}
+        finally:
+            connection.close()
+        self.assertIn("events_currency_time", plan)
+        self.assertTrue({"events_time", "events_currency_time", "events_impact_time"} <= indexed)
+
+    def test_month_write_upserts_by_identity_and_drops_missing_events(self):
+        self.store.write([_record("CPI"), _record("NFP", date="03/04/2026")], self.context, "both")
+        result = self.store.write(
+            [_record("CPI", actual="0.3%"), _record("GDP", date="04/04/2026")], self.context, "both"
+        )
+
+        stored = self.store.read_monthly("2026-04")
+        self.assertEqual([item["event"] for item in stored], ["CPI", "GDP"])
+        self.assertEqual(stored[0]["actual"], "0.3%")
+        self.assertEqual(result.records_written, 2)
+        self.assertEqual([item["record_count"] for item in self.store.revisions("2026-04")], [2, 2])
+
+    def test_week_merge_keeps_other_events_and_records_a_revision(self):
+        self.store.write([_record("CPI"), _record("NFP", date="30/04/2026")], self.context, "both")
+        week = ScrapeContext("week:this", "", "week-2026-04-26", "2026", "UTC", "UTC", "", period="week")
+        self.store.merge(
+            [_record("NFP", date="30/04/2026", actual="200K"), _record("PMI", date="01/05/2026")], week, "json"
+        )
+
+        self.assertEqual([item["actual"] for item in self.store.read_monthly("2026-04")], ["", "200K"])
+        self.assertEqual([item["event"] for item in self.store.read_monthly("2026-05")], ["PMI"])
+        self.assertEqual(self.store.monthly_slugs(), ["2026-04", "2026-05"])
+        self.assertEqual(self.store.revisions("week-2026-04-26")[0]["period"], "week")
+
+    def test_day_merge_replaces_a_rescheduled_event(self):
+        self.store.write([_record("CPI"), _record("NFP", date="03/04/2026")], self.context, "both")
+        day = ScrapeContext("day:2026-04-02", "", "day-2026-04-02", "2026", "UTC", "UTC", "", period="day")
+        self.store.merge([_record("CPI", time="10:00", impact="orange")], day, "json")
+
+        stored = self.store.read_monthly("2026-04")
+        self.assertEqual(
+            [(item["event"], item["time"], item["impact"]) for item in stored],
+            [("CPI", "10:00", "orange"), ("NFP", "08:30", "red")],
+        )
+
+    def test_events_round_trip_timestamps_and_filter_in_sql(self):
+        self.store.write(
+            [
+                _record("CPI", timestamp=1775118600),
+                _record("ECB", currency="EUR", timestamp=1775205000),
+                _record("Bank Holiday", time="All Day", impact="gray"),
+            ],
+            self.context,
+            "both",
+        )
+
+        stored = read_events(self.database_path)
+        self.assertEqual(stored[0]["event_timestamp_utc"], 1775118600)
+        self.assertEqual(stored[2]["event_timestamp_utc"], "")
+        self.assertEqual([item["event"] for item in read_events(self.database_path, currencies=["EUR"])], ["ECB"])
+        self.assertEqual([item["event"] for item in read_events(self.database_path, impacts=["gray"])], ["Bank Holiday"])
+        self.assertEqual(
+            [item["event"] for item in read_events(self.database_path, start=1775118601)], ["ECB"]
+        )
+
+    def test_alert_events_and_backfill_read_from_the_database(self):
+        self.store.write(
+            [_record("CPI", timestamp=1775118600), _record("ECB", currency="EUR", timestamp=1775205000)],
+            self.context,
+            "both",
+        )
+
+        events = load_alert_events(Path(self.temp_dir.name), self.database_path, currencies=["EUR"])
+        self.assertEqual([event.payload["event"] for event in events], ["ECB"])
+        self.assertTrue(month_is_complete(self.store, "2026-04"))
+
+    def test_reader_connection_sees_committed_rows_during_a_write(self):
+        self.store.write([_record("CPI")], self.context, "both")
+        with self.store.lock, self.store.connection:
+            self.store._upsert([_record("NFP", date="03/04/2026")], None, "now")
+            self.assertEqual([item["event"] for item in read_events(self.database_path)], ["CPI"])
+        self.assertEqual(len(read_events(self.database_path)), 2)
+
+
+class SqliteImportTests(unittest.TestCase):
+    def test_import_loads_history_revisions_and_monthly_events_once(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir) / "news"
+            files = FileOutputStore(output_dir)
+            month = ScrapeContext("april", "April", "2026-04", "2026", "UTC", "UTC", "")
+            with patch("ff_calendar_toolkit.storage.datetime") as clock:
+                clock.now.return_value.astimezone.return_value.strftime.return_value = "2026-04-20T10-00-00+0000"
+                files.write([_record("CPI")], month, "both")
+            day = ScrapeContext("day:this", "", "day-2026-04-02", "2026", "UTC", "UTC", "", period="day")
+            files.merge([_record("CPI", actual="0.3%")], day, "json")
+
+            store = SqliteOutputStore(output_dir / "calendar.sqlite")
+            try:
+                self.assertEqual(import_file_store(store, output_dir), (2, 1))
+                self.assertEqual(import_file_store(store, output_dir), (0, 1))
+                revisions = store.revisions("2026-04")
+                self.assertEqual(revisions[0]["source"], "history/2026-04/2026-04-20T10-00-00+0000")
+                self.assertEqual(revisions[0]["written_at"], "2026-04-20T10:00:00+00:00")
+                self.assertEqual(store.revisions("day-2026-04-02")[0]["period"], "day")
+                self.assertEqual(store.read_monthly("2026-04")[0]["actual"], "0.3%")
+            finally:
+                store.close()
+
+
+class StorageSelectionTests(unittest.TestCase):
+    def test_storage_setting_selects_sqlite_under_the_output_dir(self):
+        previous = dict(os.environ)
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                config_path = Path(temp_dir) / "config.yaml"
+                config_path.write_text("output_dir: news\nstorage: sqlite\n", encoding="utf-8")
+                args = Args()
+                args.config = str(config_path)
+
+                options = build_run_options(args)
+                self.assertEqual(options.storage, "sqlite")
+                self.assertEqual(options.sqlite_path, (Path(temp_dir) / "news" / "calendar.sqlite").resolve())
+                self.assertEqual(build_alert_options(args).sqlite_path, options.sqlite_path)
+
+                with build_store(options) as store:
+                    self.assertIsInstance(store, SqliteOutputStore)
+                    self.assertTrue(options.sqlite_path.exists())
+                with self.assertRaises(sqlite3.ProgrammingError):
+                    store.connection.execute("SELECT 1")
+
+                os.environ["FF_STORAGE"] = "file"
+                options = build_run_options(args)
+                self.assertIsNone(options.sqlite_path)
+                self.assertIsInstance(build_store(options), FileOutputStore)
+        finally:
+            os.environ.clear()
+            os.environ.update(previous)
+
+
+if __name__ == "__main__":
+    unittest.main()
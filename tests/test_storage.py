@@ -1,10 +1,13 @@
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from ff_calendar_toolkit.config import NORMALIZED_FIELDS
 from ff_calendar_toolkit.models import ScrapeContext
-from ff_calendar_toolkit.storage import FileOutputStore
+from ff_calendar_toolkit.storage import FileOutputStore, merge_records
 
 
 class StorageTests(unittest.TestCase):
@@ -40,6 +43,7 @@ class StorageTests(unittest.TestCase):
 
             store.begin_run("both")
             result = store.write(records, context, "both")
+            store.end_run()
 
             self.assertEqual(len(result.last_run_paths), 2)
             self.assertTrue((tmp_path / "last_run" / "2026-04.csv").exists())
@@ -54,6 +58,241 @@ class StorageTests(unittest.TestCase):
             self.assertEqual(payload[0]["event"], "NFP")
             self.assertEqual(payload[0]["timezone"], "Asia/Karachi")
 
+    def test_day_scrape_merges_into_monthly_by_event_identity(self):
+        base = {"time": "08:30", "currency": "USD", "impact": "red", "timezone": "UTC"}
+        existing = [
+            {**base, "event": "CPI m/m", "date": "02/04/2026", "actual": ""},
+            {**base, "event": "NFP", "date": "03/04/2026", "actual": ""},
+        ]
+        update = [
+            {**base, "event": "NFP", "date": "03/04/2026", "actual": "250K"},
+            {**base, "event": "Claims", "date": "01/05/2026", "actual": "210K"},
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tmp_path = Path(temp_dir)
+            store = FileOutputStore(tmp_path)
+            month_context = ScrapeContext(
+                month_param="april",
+                month_name="April",
+                month_slug="2026-04",
+                year="2026",
+                source_timezone="UTC",
+                target_timezone="UTC",
+                scraped_at="2026-04-01T00:00:00+00:00",
+            )
+            week_context = ScrapeContext(
+                month_param="week:this",
+                month_name="April",
+                month_slug="week-2026-04-26",
+                year="2026",
+                source_timezone="UTC",
+                target_timezone="UTC",
+                scraped_at="2026-04-03T12:00:00+00:00",
+                period="week",
+            )
+            store.write(existing, month_context, "json")
+
+            result = store.merge(update, week_context, "json")
+
+            april = json.loads((tmp_path / "monthly" / "2026-04.json").read_text(encoding="utf-8"))
+            may = json.loads((tmp_path / "monthly" / "2026-05.json").read_text(encoding="utf-8"))
+            self.assertEqual([row["actual"] for row in april], ["", "250K"])
+            self.assertEqual([row["event"] for row in may], ["Claims"])
+            self.assertEqual(len(result.monthly_paths), 2)
+            self.assertTrue((tmp_path / "last_run" / "week-2026-04-26.json").exists())
+
+    def test_week_scrape_replaces_rescheduled_events_on_the_days_it_covers(self):
+        base = {"currency": "USD", "timezone": "UTC", "actual": ""}
+        existing = [
+            {**base, "event": "PPI m/m", "date": "10/04/2026", "time": "08:30", "impact": "red"},
+            {**base, "event": "CPI m/m", "date": "28/04/2026", "time": "08:30", "impact": "red"},
+            {**base, "event": "Consumer Confidence", "date": "28/04/2026", "time": "10:00", "impact": "orange"},
+        ]
+        update = [{**base, "event": "CPI m/m", "date": "29/04/2026", "time": "12:30", "impact": "orange"}]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tmp_path = Path(temp_dir)
+            store = FileOutputStore(tmp_path)
+            month_context = ScrapeContext(
+                "april", "April", "2026-04", "2026", "UTC", "UTC", "2026-04-01T00:00:00+00:00"
+            )
+            week_context = ScrapeContext(
+                "week:this", "April", "week-2026-04-26", "2026", "UTC", "UTC", "2026-04-27T00:00:00+00:00", "week"
+            )
+            store.write(existing, month_context, "json")
+
+            store.merge(update, week_context, "json")
+
+            april = json.loads((tmp_path / "monthly" / "2026-04.json").read_text(encoding="utf-8"))
+            self.assertEqual(
+                [(row["event"], row["date"], row["time"]) for row in april],
+                [("PPI m/m", "10/04/2026", "08:30"), ("CPI m/m", "29/04/2026", "12:30")],
+            )
+            last_run = json.loads((tmp_path / "last_run" / "2026-04.json").read_text(encoding="utf-8"))
+            self.assertEqual(last_run, april)
+
+    def test_write_streams_a_generator_into_every_tier(self):
+        records = [
+            {"date": f"0{day}/04/2026", "time": "08:30", "currency": "USD", "event": f"Event {day}"}
+            for day in range(1, 4)
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tmp_path = Path(temp_dir)
+            store = FileOutputStore(tmp_path)
+            context = ScrapeContext(
+                month_param="april",
+                month_name="April",
+                month_slug="2026-04",
+                year="2026",
+                source_timezone="UTC",
+                target_timezone="UTC",
+                scraped_at="2026-04-01T00:00:00+00:00",
+            )
+            store.begin_run("both")
+
+            result = store.write((record for record in records), context, "both")
+            store.end_run()
+
+            self.assertEqual(result.records_written, 3)
+            expected = json.dumps(
+                [{field: record.get(field, "") for field in NORMALIZED_FIELDS} for record in records],
+                indent=2,
+            )
+            for path in [*result.last_run_paths, *result.monthly_paths, *result.history_paths]:
+                if path.suffix == ".json":
+                    self.assertEqual(path.read_text(encoding="utf-8"), expected)
+                else:
+                    self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 4)
+
+    def test_streamed_json_matches_json_dump_when_empty(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "empty.json"
+            FileOutputStore(Path(temp_dir))._write_file(path, "json", iter(()))
+            self.assertEqual(path.read_text(encoding="utf-8"), json.dumps([], indent=2))
+
+    def test_write_serializes_history_once_and_links_other_tiers(self):
+        records = [{"date": "01/04/2026", "time": "08:30", "currency": "USD", "event": "NFP", "actual": ""}]
+        context = ScrapeContext("april", "April", "2026-04", "2026", "UTC", "UTC", "2026-04-01T00:00:00+00:00")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FileOutputStore(Path(temp_dir))
+
+            result = store.write(records, context, "json")
+
+            history_path = result.history_paths[0]
+            self.assertEqual(result.bytes_written, history_path.stat().st_size)
+            self.assertTrue(os.path.samefile(history_path, result.monthly_paths[0]))
+            self.assertTrue(os.path.samefile(history_path, result.last_run_paths[0]))
+
+            store.merge_monthly([{**records[0], "actual": "250K"}], "json")
+
+            self.assertEqual(json.loads(history_path.read_text(encoding="utf-8"))[0]["actual"], "")
+            self.assertEqual(
+                json.loads(result.monthly_paths[0].read_text(encoding="utf-8"))[0]["actual"], "250K"
+            )
+            self.assertEqual(sorted(path.name for path in Path(temp_dir, "monthly").iterdir()), ["2026-04.json"])
+
+    def test_write_copies_when_links_are_not_supported(self):
+        context = ScrapeContext("april", "April", "2026-04", "2026", "UTC", "UTC", "2026-04-01T00:00:00+00:00")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FileOutputStore(Path(temp_dir))
+            with patch("ff_calendar_toolkit.storage.os.link", side_effect=OSError("not supported")):
+                result = store.write([{"event": "NFP"}], context, "csv")
+
+            size = result.history_paths[0].stat().st_size
+            self.assertEqual(result.bytes_written, size * 3)
+            self.assertFalse(os.path.samefile(result.history_paths[0], result.monthly_paths[0]))
+            self.assertEqual(result.monthly_paths[0].read_bytes(), result.history_paths[0].read_bytes())
+
+    def test_last_run_keeps_the_previous_run_until_the_run_ends(self):
+        april = ScrapeContext("april", "April", "2026-04", "2026", "UTC", "UTC", "2026-04-01T00:00:00+00:00")
+        may = ScrapeContext("may", "May", "2026-05", "2026", "UTC", "UTC", "2026-05-01T00:00:00+00:00")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            (output_dir / "last_run").mkdir()
+            (output_dir / "last_run" / "2026-03.json").write_text("[]", encoding="utf-8")
+            store = FileOutputStore(output_dir)
+            last_run = output_dir / "last_run"
+
+            store.begin_run("json")
+            store.write([{"event": "NFP"}], april, "json")
+            self.assertEqual(sorted(path.name for path in last_run.iterdir()), ["2026-03.json"])
+            store.end_run()
+            self.assertTrue(last_run.is_symlink())
+            self.assertEqual(sorted(path.name for path in last_run.iterdir()), ["2026-04.json"])
+            first_generation = os.readlink(last_run)
+
+            store.begin_run("json")
+            store.write([{"event": "CPI"}], may, "json")
+            self.assertEqual(sorted(path.name for path in last_run.iterdir()), ["2026-04.json"])
+            store.end_run()
+            store.begin_run("json")
+            store.end_run()
+
+            self.assertEqual(list(last_run.iterdir()), [])
+            generations = sorted(path.name for path in (output_dir / "last_run_generations").iterdir())
+            self.assertEqual(len(generations), 2)
+            self.assertNotIn(Path(first_generation).name, generations)
+
+    def test_end_run_replaces_plain_directory_files_without_symlinks(self):
+        context = ScrapeContext("april", "April", "2026-04", "2026", "UTC", "UTC", "2026-04-01T00:00:00+00:00")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            (output_dir / "last_run").mkdir()
+            (output_dir / "last_run" / "2026-03.json").write_text("[]", encoding="utf-8")
+            store = FileOutputStore(output_dir)
+
+            with patch("ff_calendar_toolkit.storage.os.symlink", side_effect=OSError("not permitted")):
+                store.begin_run("json")
+                store.write([{"event": "NFP"}], context, "json")
+                self.assertEqual([path.name for path in (output_dir / "last_run").iterdir()], ["2026-03.json"])
+                store.end_run()
+
+            self.assertFalse((output_dir / "last_run").is_symlink())
+            self.assertEqual([path.name for path in (output_dir / "last_run").iterdir()], ["2026-04.json"])
+
+    def test_failed_write_leaves_previous_file_and_no_temp_files(self):
+        def broken_records():
+            yield {"event": "NFP"}
+            raise RuntimeError("scrape failed")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FileOutputStore(Path(temp_dir))
+            path = store.monthly_dir / "2026-04.json"
+            store._write_file(path, "json", [{"event": "CPI"}])
+
+            with self.assertRaises(RuntimeError):
+                store._write_file(path, "json", broken_records())
+
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8"))[0]["event"], "CPI")
+            self.assertEqual([item.name for item in store.monthly_dir.iterdir()], ["2026-04.json"])
+
+    def test_merge_records_keeps_date_order(self):
+        existing = [{"date": "05/04/2026", "event": "Late"}]
+        merged = merge_records(existing, [{"date": "01/04/2026", "event": "Early"}])
+        self.assertEqual([row["event"] for row in merged], ["Early", "Late"])
+
+    def test_merge_records_inserts_new_rows_by_time_and_keeps_existing_positions(self):
+        existing = [
+            {"date": "02/04/2026", "time": "All Day", "event": "Holiday"},
+            {"date": "02/04/2026", "time": "08:30", "event": "CPI"},
+            {"date": "02/04/2026", "time": "14:00", "event": "Fed"},
+            {"date": "03/04/2026", "time": "07:00", "event": "PMI"},
+        ]
+        updates = [
+            {"date": "02/04/2026", "time": "10:00", "event": "Claims"},
+            {"date": "02/04/2026", "time": "Tentative", "event": "Speech"},
+            {"date": "02/04/2026", "time": "All Day", "event": "Summit"},
+            {"date": "02/04/2026", "time": "08:30", "event": "CPI", "actual": "0.3%"},
+            {"date": "01/04/2026", "time": "09:00", "event": "GDP"},
+        ]
+
+        merged = merge_records(existing, updates)
+
+        self.assertEqual(
+            [row["event"] for row in merged],
+            ["GDP", "Holiday", "Summit", "CPI", "Claims", "Fed", "Speech", "PMI"],
+        )
+        self.assertEqual(merged[3]["actual"], "0.3%")
+
 
 if __name__ == "__main__":
     unittest.main()
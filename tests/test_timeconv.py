@@ -0,0 +1,71 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+import pytz
+
+from ff_calendar_toolkit.alerts.events import _parse_event_time
+from ff_calendar_toolkit.timeconv import convert_batch, convert_time, convert_times, convert_with_utc, parse_local_time
+
+
+def reference_convert(date_str, time_str, from_zone_str, to_zone_str):
+    """The per-row conversion normalize used before zones and results were cached."""
+    if not time_str or not date_str or not from_zone_str or not to_zone_str:
+        return time_str
+    if time_str.lower() in ["all day", "tentative"]:
+        return time_str
+    try:
+        from_zone = pytz.timezone(from_zone_str)
+        to_zone = pytz.timezone(to_zone_str)
+        naive_dt = datetime.strptime(f"{date_str} {time_str}", "%d/%m/%Y %I:%M%p")
+        return from_zone.localize(naive_dt).astimezone(to_zone).strftime("%H:%M")
+    except Exception:
+        return time_str
+
+
+class TimeConversionTests(unittest.TestCase):
+    def test_conversions_match_uncached_pytz_across_dst_changes(self):
+        times = ["12:00am", "1:30am", "2:30am", "3:00am", "8:30am", "All Day", "Tentative", "soon"]
+        pairs = []
+        day = date(2025, 3, 1)
+        while day <= date(2025, 11, 30):
+            pairs.extend((day.strftime("%d/%m/%Y"), time_str) for time_str in times)
+            day += timedelta(days=1)
+
+        for from_zone, to_zone in [("America/New_York", "Asia/Karachi"), ("Europe/London", "America/New_York")]:
+            expected = [reference_convert(d, t, from_zone, to_zone) for d, t in pairs]
+            self.assertEqual([convert_time(d, t, from_zone, to_zone) for d, t in pairs], expected)
+            self.assertEqual(convert_times(pairs, from_zone, to_zone), expected)
+
+    def test_missing_or_unknown_zones_leave_times_unchanged(self):
+        pairs = [("02/09/2025", "3:00am")]
+        self.assertEqual(convert_times(pairs, None, "UTC"), ["3:00am"])
+        self.assertEqual(convert_times(pairs, "Mars/Olympus", "UTC"), ["3:00am"])
+        self.assertEqual(convert_time("02/09/2025", "3:00am", "Mars/Olympus", "UTC"), "3:00am")
+
+    def test_batches_share_the_conversion_cache_and_return_utc_instants(self):
+        pairs = [("02/09/2025", "3:00am")] * 3
+        convert_time("02/09/2025", "3:00am", "America/New_York", "Asia/Karachi")
+        hits = convert_with_utc.cache_info().hits
+
+        converted = convert_batch(pairs, "America/New_York", "Asia/Karachi")
+
+        self.assertEqual(convert_with_utc.cache_info().hits, hits + 3)
+        self.assertEqual(converted[0][0], "12:00")
+        self.assertEqual(converted[0][1].isoformat(), "2025-09-02T07:00:00+00:00")
+
+    def test_parse_local_time_localizes_in_record_zone(self):
+        parsed = parse_local_time("09/03/2025", "03:30", "America/New_York")
+        self.assertEqual(parsed.utcoffset(), timedelta(hours=-4))
+        self.assertIs(parse_local_time("09/03/2025", "03:30", "America/New_York"), parsed)
+
+    def test_alert_events_prefer_stored_utc_timestamp(self):
+        record = {"date": "01/01/2000", "time": "00:00", "timezone": "Asia/Karachi", "event_timestamp_utc": "1741523400"}
+        event_time = _parse_event_time(record)
+        self.assertEqual(event_time.isoformat(), "2025-03-09T17:30:00+05:00")
+
+        del record["event_timestamp_utc"]
+        self.assertEqual(_parse_event_time(record).year, 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+from ff_calendar_toolkit.workers import effective_worker_count
+
+
+class WorkerCountTests(unittest.TestCase):
+    def test_worker_count_is_capped_by_months_and_cpus(self):
+        self.assertEqual(effective_worker_count(8, 3, 512, cpu_count=16), 3)
+        self.assertEqual(effective_worker_count(8, 24, 512, cpu_count=4), 4)
+
+    def test_worker_count_is_capped_by_available_memory(self):
+        available = 3 * 512 * 1024 * 1024 + 1
+        self.assertEqual(effective_worker_count(8, 24, 512, available, cpu_count=16), 3)
+
+    def test_worker_count_never_drops_below_one(self):
+        self.assertEqual(effective_worker_count(0, 0, 512, 0, cpu_count=16), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()